@@ -6,7 +6,9 @@ Behavior:
 - Builds the app from fixed repo metadata and a canonical repo layout.
 - Prefers assets from ``build_assets/`` and falls back to older local layouts.
 - Bundles an optional runtime splash into ``build_assets/`` for packaged builds.
-- Cleans ``build/`` and ``dist/`` before each run.
+- Cleans ``build/`` and ``dist/`` before each run, but keeps PyInstaller's
+  analysis cache in ``.pyinstaller-cache/`` unless ``--clean`` or
+  ``ISRC_FORCE_CLEAN=1`` asks for a full rebuild.
 - Stages a stable-named release artifact under ``dist/release/``.
 - Creates an upload-ready release archive under ``dist/release/packages/``.
 
@@ -17,6 +19,7 @@ Notes:
 
 from __future__ import annotations
 
+import argparse
 import json
 import os
 import platform
@@ -28,6 +31,7 @@ import sys
 import tarfile
 import urllib.parse
 import zipfile
+from collections import deque
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
@@ -56,6 +60,9 @@ SPLASH_BASENAME = "splash"
 REPORTING_CONFIG_BASENAME = "reporting.json"
 REPORTING_PROXY_ENV = "ISRC_REPORT_PROXY_URL"
 REPORTING_REPOSITORY_ENV = "ISRC_REPORT_REPOSITORY"
+FORCE_CLEAN_ENV = "ISRC_FORCE_CLEAN"
+PYINSTALLER_CACHE_DIRNAME = ".pyinstaller-cache"
+PYINSTALLER_LOG_TAIL_LINES = 200
 DEFAULT_REPORTING_REPOSITORY = "cosmowyn/ISRC-Catalog-Manager"
 SPLASH_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
 WINDOWS_ICON_EXTENSIONS = (".ico", ".png", ".jpg", ".jpeg", ".bmp")
@@ -69,6 +76,17 @@ PYINSTALLER_HIDDEN_IMPORTS = (
 )
 PYINSTALLER_COLLECT_SUBMODULES = ("keyring.backends",)
 PYINSTALLER_COPY_METADATA = ("keyring", "sqlcipher3")
+# Stdlib packages the app never imports. unittest (QA harness) and http.server
+# (SoundCloud OAuth capture) are used at runtime and must stay in the bundle.
+PYINSTALLER_EXCLUDE_MODULES = (
+    "tkinter",
+    "_tkinter",
+    "test",
+    "idlelib",
+    "turtledemo",
+    "pydoc_data",
+    "lib2to3",
+)
 SPLASH_VERSION_FONT_SIZE = 12
 SPLASH_VERSION_COLOR = (186, 214, 245)
 SPLASH_VERSION_TEXT_GAP = 4
@@ -91,6 +109,13 @@ class ResolutionResult:
     detail: str
 
 
+@dataclass(frozen=True)
+class PyInstallerRun:
+    returncode: int
+    output_tail: tuple[str, ...]
+    missing_module: bool
+
+
 def _is_windows() -> bool:
     return os.name == "nt"
 
@@ -192,7 +217,7 @@ def _resolve_build_python(project_root: Path) -> Path:
         if candidate in seen:
             continue
         seen.add(candidate)
-        if candidate.exists():
+        if candidate.is_file():
             return candidate
 
     checked = "\n".join(f"  - {candidate}" for candidate in candidates)
@@ -327,6 +352,33 @@ def _pyinstaller_missing_module_output(*texts: str) -> bool:
     return any(pattern in text for text in texts if text for pattern in patterns)
 
 
+def _run_pyinstaller(cmd: list[str], cwd: Path) -> PyInstallerRun:
+    # Echo PyInstaller's log as it is produced and keep only a bounded tail for the
+    # failure summary, instead of buffering the whole multi-megabyte log.
+    tail: deque[str] = deque(maxlen=PYINSTALLER_LOG_TAIL_LINES)
+    missing_module = False
+    with subprocess.Popen(
+        cmd,
+        cwd=str(cwd),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as process:
+        if process.stdout is not None:
+            for line in process.stdout:
+                print(line, end="", flush=True)
+                tail.append(line.rstrip("\r\n"))
+                if not missing_module and _pyinstaller_missing_module_output(line):
+                    missing_module = True
+        returncode = process.wait()
+    return PyInstallerRun(
+        returncode=returncode,
+        output_tail=tuple(tail),
+        missing_module=missing_module,
+    )
+
+
 def _select_pyinstaller(project_root: Path, build_python: Path) -> PyInstallerSelection:
     attempts: list[dict[str, str]] = []
     candidates: list[dict[str, object]] = []
@@ -545,6 +597,22 @@ def _asset_locations(project_root: Path, canonical_dir: Path) -> tuple[tuple[Pat
     )
 
 
+def _directory_file_names(directory: Path, *, casefold: bool) -> dict[str, str]:
+    names: dict[str, str] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                names.setdefault(entry.name.casefold() if casefold else entry.name, entry.name)
+    except OSError:
+        return {}
+    return names
+
+
 def _resolve_asset_candidate(
     project_root: Path,
     *,
@@ -554,14 +622,20 @@ def _resolve_asset_candidate(
     extensions: tuple[str, ...],
 ) -> ResolutionResult:
     checked: list[str] = []
+    # One directory listing per location instead of a stat per basename/extension
+    # pair; macOS and Windows volumes match names case-insensitively.
+    casefold = _is_windows() or _is_macos()
 
     for location_path, source_label, kind in _asset_locations(project_root, canonical_dir):
+        file_names = _directory_file_names(location_path, casefold=casefold)
         for basename in basenames:
             for extension in extensions:
                 candidate = location_path / f"{basename}{extension}"
                 checked.append(_display_path(candidate, project_root))
-                if not candidate.is_file():
+                lookup_name = candidate.name.casefold() if casefold else candidate.name
+                if lookup_name not in file_names:
                     continue
+                candidate = location_path / file_names[lookup_name]
 
                 candidate_resolved = candidate.resolve()
                 if kind == "canonical":
@@ -922,6 +996,9 @@ def _pyinstaller_cmd(
     icon: str | None,
     runtime_splash_asset: str | None,
     reporting_config_asset: str | None = None,
+    *,
+    work_path: Path | None = None,
+    clean: bool = True,
 ) -> list[str]:
     cmd = [
         *pyinstaller_launcher,
@@ -929,16 +1006,24 @@ def _pyinstaller_cmd(
         "--name",
         app_name,
         "--noconfirm",
-        "--clean",
+    ]
+    if clean:
+        cmd.append("--clean")
+    if work_path is not None:
+        cmd.extend(["--workpath", str(work_path)])
+    cmd += [
         "--windowed",
+        # UPX-packed Qt and Python DLLs must be unpacked again by the loader on
+        # every launch, and compressing them dominates PyInstaller run time. A
+        # somewhat larger bundle is the better trade for startup latency.
+        "--noupx",
         "--log-level",
         "INFO",
     ]
 
-    if _is_windows():
-        cmd.append("--onefile")
-    else:
-        cmd.append("--onedir")
+    # Every platform ships a one-folder bundle: --onefile re-extracts the Python
+    # runtime and Qt libraries into a temp folder on every launch.
+    cmd.append("--onedir")
 
     for module_name in PYINSTALLER_HIDDEN_IMPORTS:
         cmd.extend(["--hidden-import", module_name])
@@ -949,6 +1034,9 @@ def _pyinstaller_cmd(
     for package_name in PYINSTALLER_COPY_METADATA:
         cmd.extend(["--copy-metadata", package_name])
 
+    for module_name in PYINSTALLER_EXCLUDE_MODULES:
+        cmd.extend(["--exclude-module", module_name])
+
     if runtime_splash_asset:
         cmd.extend(
             [
@@ -994,8 +1082,6 @@ def _pyinstaller_cmd(
 
 def _expected_artifact_candidates(project_root: Path) -> list[Path]:
     dist_dir = project_root / "dist"
-    if _is_windows():
-        return [dist_dir / f"{PACKAGE_APP_NAME}.exe"]
     if _is_macos():
         return [dist_dir / f"{PACKAGE_APP_NAME}.app", dist_dir / PACKAGE_APP_NAME]
     return [dist_dir / PACKAGE_APP_NAME]
@@ -1033,6 +1119,40 @@ def _write_release_manifest(
     return manifest_path
 
 
+def _native_tree_copy_cmd(source: Path, target: Path) -> tuple[list[str], int] | None:
+    """Return a platform copy command for a bundle tree and its highest success code."""
+    if _is_windows():
+        if shutil.which("robocopy") is None:
+            return None
+        # robocopy exit codes below 8 all mean the copy succeeded.
+        return (
+            ["robocopy", str(source), str(target), "/E", "/MT:8", "/NFL", "/NDL", "/NJH", "/NJS"],
+            7,
+        )
+    if shutil.which("cp") is None:
+        return None
+    if _is_macos():
+        return ["cp", "-cR", str(source), str(target)], 0
+    return ["cp", "-a", "--reflink=auto", str(source), str(target)], 0
+
+
+def _copy_artifact_tree(source: Path, target: Path) -> None:
+    # APFS (cp -c) and Btrfs/XFS (cp --reflink) can clone the bundle's Qt and
+    # Python libraries copy-on-write; robocopy copies the many-file Windows
+    # bundle on several threads instead of one Python loop.
+    native_copy = _native_tree_copy_cmd(source, target)
+    if native_copy is not None:
+        copy_cmd, max_success_code = native_copy
+        try:
+            result = subprocess.run(copy_cmd, capture_output=True, text=True)
+        except OSError:
+            result = None
+        if result is not None and 0 <= result.returncode <= max_success_code and target.is_dir():
+            return
+        shutil.rmtree(target, ignore_errors=True)
+    shutil.copytree(source, target, symlinks=True)
+
+
 def _stage_release_artifact(source_artifact: Path, dist_dir: Path, *, app_version: str) -> Path:
     release_dir = dist_dir / "release"
     release_dir.mkdir(parents=True, exist_ok=True)
@@ -1041,7 +1161,7 @@ def _stage_release_artifact(source_artifact: Path, dist_dir: Path, *, app_versio
         target = release_dir / source_artifact.name
         if target.exists():
             shutil.rmtree(target, ignore_errors=True)
-        shutil.copytree(source_artifact, target, symlinks=True)
+        _copy_artifact_tree(source_artifact, target)
     else:
         target = release_dir / source_artifact.name
         target.unlink(missing_ok=True)
@@ -1115,14 +1235,42 @@ def _package_release_artifact(
     return package_path
 
 
-def _clean_build_directories(project_root: Path) -> None:
-    for directory_name in ("build", "dist"):
+def _clean_build_directories(project_root: Path, *, include_cache: bool = False) -> None:
+    directory_names = ["build", "dist"]
+    if include_cache:
+        directory_names.append(PYINSTALLER_CACHE_DIRNAME)
+    for directory_name in directory_names:
         path = project_root / directory_name
         if path.exists():
             shutil.rmtree(path, ignore_errors=True)
 
 
-def main() -> int:
+def _pyinstaller_work_path(project_root: Path) -> Path:
+    return project_root / PYINSTALLER_CACHE_DIRNAME / "work"
+
+
+def _force_clean_requested(cli_clean: bool) -> bool:
+    if cli_clean:
+        return True
+    return os.environ.get(FORCE_CLEAN_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build the packaged ISRC Manager release.")
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help=(
+            "discard the cached PyInstaller analysis and rebuild from scratch "
+            f"(same as {FORCE_CLEAN_ENV}=1)"
+        ),
+    )
+    return parser.parse_args([] if argv is None else argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    force_clean = _force_clean_requested(args.clean)
     project_root = PROJECT_ROOT
 
     try:
@@ -1146,7 +1294,7 @@ def main() -> int:
     os.chdir(project_root)
     print(f"OS: {_platform_tag()}  |  Project: {project_root}")
 
-    _clean_build_directories(project_root)
+    _clean_build_directories(project_root, include_cache=force_clean)
 
     try:
         pyinstaller = _select_pyinstaller(project_root, build_python)
@@ -1201,6 +1349,8 @@ def main() -> int:
         reporting_config_asset=(
             str(reporting_config_result.path) if reporting_config_result.path else None
         ),
+        work_path=_pyinstaller_work_path(project_root),
+        clean=force_clean,
     )
 
     print("\nRunning:")
@@ -1208,27 +1358,21 @@ def main() -> int:
     print()
 
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=str(project_root),
-            text=True,
-            capture_output=True,
-        )
+        result = _run_pyinstaller(cmd, project_root)
     except Exception as exc:
         print("\nERROR [build]: Build invocation failed.")
         print(str(exc))
         return 1
 
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr:
-        print(result.stderr)
-    if _pyinstaller_missing_module_output(result.stdout or "", result.stderr or ""):
+    if result.missing_module:
         print("\nERROR [build]: PyInstaller launcher reported a missing module.")
         return 1
     if result.returncode != 0:
         print("\nERROR [build]: PyInstaller returned a non-zero exit code.")
         print(f"Return code: {result.returncode}")
+        if result.output_tail:
+            print(f"\nLast {len(result.output_tail)} lines of PyInstaller output:")
+            print("\n".join(result.output_tail))
         return result.returncode
 
     out_path = project_root / "dist"
@@ -1288,4 +1432,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(main(sys.argv[1:]))
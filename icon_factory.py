@@ -12,26 +12,91 @@ Icon generator for Python applications.
     <app_root>/output/<OS_NAME>/<prefix><basename>.<ext>
 """
 
+from __future__ import annotations
+
+import functools
+import io
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
     import tkinter as tk
     from tkinter import filedialog, messagebox, simpledialog
-except ImportError:
-    print("tkinter is required for the GUI dialogs.")
-    sys.exit(1)
 
-try:
     from PIL import Image
-except ImportError:
-    print("Pillow is required. Install with: pip install pillow")
-    sys.exit(1)
 
 
-ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".tif", ".tiff", ".bmp", ".webp"}
+@functools.cache
+def load_pillow() -> None:
+    """Import Pillow once, on first use; later calls are free."""
+    global Image, LANCZOS
+    try:
+        from PIL import Image
+    except ImportError:
+        print("Pillow is required. Install with: pip install pillow")
+        sys.exit(1)
+
+    # Pillow >= 9.1 (and API-compatible builds such as Pillow-SIMD) expose the
+    # filter on Image.Resampling; older builds only have the module constant.
+    resampling = getattr(Image, "Resampling", None)
+    LANCZOS = resampling.LANCZOS if resampling is not None else Image.LANCZOS
+    warn_if_jpeg_decoder_is_slow()
+
+
+def warn_if_jpeg_decoder_is_slow() -> None:
+    """Warn on stderr when Pillow was built against stock libjpeg instead of libjpeg-turbo."""
+    try:
+        from PIL import features
+
+        turbo = features.check_feature("libjpeg_turbo")
+    except Exception:
+        return
+    if turbo is False:
+        print(
+            "Warning: this Pillow build does not use libjpeg-turbo; decoding large JPEG "
+            "sources will be slow. The PyPI Pillow wheels include it.",
+            file=sys.stderr,
+        )
+
+
+@functools.cache
+def load_gui_dependencies() -> None:
+    """Import tkinter on first use instead of at module import."""
+    global tk, filedialog, messagebox, simpledialog
+    try:
+        import tkinter as tk
+        from tkinter import filedialog, messagebox, simpledialog
+    except ImportError:
+        print("tkinter is required for the GUI dialogs.")
+        sys.exit(1)
+
+
+ALLOWED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".tif", ".tiff", ".bmp", ".webp"})
+# Pillow plugin for each allowed extension, so opening skips format probing
+EXTENSION_FORMATS = {
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".png": "PNG",
+    ".gif": "GIF",
+    ".tif": "TIFF",
+    ".tiff": "TIFF",
+    ".bmp": "BMP",
+    ".webp": "WEBP",
+}
 
 MIN_MACOS_ICON_SIZE = 1024  # recommended base size for macOS .icns
+WINDOWS_ICON_SIZE = 256  # largest frame in the Windows .ico
+LINUX_ICON_SIZE = 512  # side of the Linux .png
+MACOS_ICON_SIZES = (16, 32, 64, 128, 256, 512, 1024)
+# Encoded icons are written to disk in one go through a 256 KiB buffer.
+ICON_WRITE_BUFFER_SIZE = 256 * 1024
+# Large downscales first shrink by an integer box reduce to within 3x of the
+# target, then finish with LANCZOS. Pillow documents a gap of 3.0 or more as
+# indistinguishable from a full LANCZOS pass in most cases, not identical.
+RESIZE_REDUCING_GAP = 3.0
 
 OS_OPTIONS = {
     "1": {"name": "Windows", "prefix": "win_", "ext": ".ico"},
@@ -72,46 +137,123 @@ def select_image_file(root: tk.Tk) -> Path:
             else:
                 continue
 
-        path = Path(path_str)
-        if path.suffix.lower() in ALLOWED_EXTENSIONS:
-            return path
+        # Validate the extension on the string; only build a Path once it passes
+        suffix = os.path.splitext(path_str)[1]
+        if suffix.lower() in ALLOWED_EXTENSIONS:
+            return Path(path_str)
         else:
             messagebox.showerror(
                 "Unsupported file type",
-                f"Selected file has unsupported extension: {path.suffix}",
+                f"Selected file has unsupported extension: {suffix}",
                 parent=root,
             )
             # Loop again for another selection
 
 
 def crop_to_center_square(
-    img: Image.Image, add_margin: bool = False, margin_px: int = 20
+    img: Image.Image,
+    add_margin: bool = False,
+    margin_px: int = 20,
+    max_side: int | None = None,
 ) -> Image.Image:
     """
     Crop image to centered 1:1 square.
 
     If add_margin is True, the cropped square is placed into a slightly
     larger transparent canvas, adding 'margin_px' pixels on all sides.
+    If the result would exceed 'max_side', the crop and the downscale are
+    done in one resample pass and the margin is scaled to match.
     """
     w, h = img.size
+    if w == h and not (add_margin and margin_px > 0) and (max_side is None or w <= max_side):
+        # Already a square that needs no margin or downscale: skip the identity crop copy
+        return img
+
     side = min(w, h)
     left = (w - side) // 2
     top = (h - side) // 2
     right = left + side
     bottom = top + side
 
-    cropped = img.crop((left, top, right, bottom))
+    margin = margin_px if add_margin and margin_px > 0 else 0
+    out_side = side + 2 * margin
+    if max_side is not None and out_side > max_side:
+        margin = round(margin * max_side / out_side)
+        inner_side = max_side - 2 * margin
+        cropped = img.resize(
+            (inner_side, inner_side),
+            LANCZOS,
+            box=(left, top, right, bottom),
+            reducing_gap=RESIZE_REDUCING_GAP,
+        )
+    else:
+        cropped = img.crop((left, top, right, bottom))
 
-    if add_margin and margin_px > 0:
+    if margin:
         # Create transparent canvas slightly larger than cropped image
-        new_side = side + 2 * margin_px
+        new_side = cropped.size[0] + 2 * margin
         canvas = Image.new("RGBA", (new_side, new_side), (0, 0, 0, 0))
-        canvas.paste(cropped, (margin_px, margin_px))
+        canvas.paste(cropped, (margin, margin))
         return canvas
 
     return cropped
 
 
+def open_source_image(img_path: Path) -> Image.Image:
+    """Open the icon source, using simplejpeg for JPEGs when it is installed."""
+    # Pillow is first needed here, after the file dialog, so it stays off the
+    # path to the first window.
+    load_pillow()
+    if img_path.suffix.lower() in {".jpg", ".jpeg"}:
+        decoded = decode_jpeg_with_simplejpeg(img_path)
+        if decoded is not None:
+            return decoded
+
+    expected_format = EXTENSION_FORMATS.get(img_path.suffix.lower())
+    try:
+        img = Image.open(img_path, formats=[expected_format] if expected_format else None)
+    except Image.UnidentifiedImageError:
+        # The extension does not match the contents; fall back to full probing
+        img = Image.open(img_path)
+    if img.format == "JPEG":
+        # Let libjpeg IDCT at 1/2, 1/4 or 1/8 scale when the photo is far
+        # larger than the biggest icon; the result never drops below 2x it.
+        img.draft("RGB", (MIN_MACOS_ICON_SIZE * 2, MIN_MACOS_ICON_SIZE * 2))
+    return img
+
+
+def decode_jpeg_with_simplejpeg(img_path: Path) -> Image.Image | None:
+    """Decode straight to RGBA through libjpeg-turbo; None when unavailable or unsupported."""
+    try:
+        import simplejpeg
+    except ImportError:
+        return None
+    try:
+        pixels = simplejpeg.decode_jpeg(
+            img_path.read_bytes(),
+            colorspace="RGBA",
+            min_width=MIN_MACOS_ICON_SIZE * 2,
+            min_height=MIN_MACOS_ICON_SIZE * 2,
+        )
+    except OSError, ValueError:
+        # CMYK and other layouts turbojpeg cannot convert go through Pillow.
+        return None
+    return Image.fromarray(pixels, "RGBA")
+
+
+@functools.lru_cache(maxsize=2)
+def decode_source_image(path_str: str, mtime_ns: int) -> Image.Image:
+    """Open and fully decode an icon source; cached per file version (mtime_ns)."""
+    img = open_source_image(Path(path_str))
+    img.load()
+    return img
+
+
+def load_source_image(img_path: Path) -> Image.Image:
+    """Return the decoded source, reusing it when the same unchanged file is picked again."""
+    return decode_source_image(str(img_path), img_path.stat().st_mtime_ns)
+
+
 def get_square_image(root: tk.Tk) -> Image.Image:
     """
     Select an image and ensure it's square.
@@ -123,10 +265,12 @@ def get_square_image(root: tk.Tk) -> Image.Image:
     """
     while True:
         img_path = select_image_file(root)
-        img = Image.open(img_path)
+        img = load_source_image(img_path)
 
-        # Always work in RGBA to have alpha available for icons
-        if img.mode != "RGBA":
+        # Always work in RGBA to have alpha available for icons. Plain RGB is
+        # converted only after the crop/downscale below, so the alpha channel is
+        # added to at most a MIN_MACOS_ICON_SIZE square instead of the full photo.
+        if img.mode not in ("RGBA", "RGB"):
             img = img.convert("RGBA")
 
         w, h = img.size
@@ -144,7 +288,9 @@ def get_square_image(root: tk.Tk) -> Image.Image:
             )
             if resp:
                 # Add a small safe margin so content isn't flush against edges
-                img = crop_to_center_square(img, add_margin=True, margin_px=20)
+                img = crop_to_center_square(
+                    img, add_margin=True, margin_px=20, max_side=MIN_MACOS_ICON_SIZE
+                )
                 sw, sh = img.size
                 messagebox.showinfo(
                     "Image cropped",
@@ -182,7 +328,7 @@ def get_square_image(root: tk.Tk) -> Image.Image:
                 continue
 
         # Either large enough already, or user accepted a smaller one
-        return img
+        return img if img.mode == "RGBA" else img.convert("RGBA")
 
 
 def ask_target_os(root: tk.Tk) -> list[dict]:
@@ -292,22 +438,62 @@ def ask_base_name(root: tk.Tk) -> str:
         return name
 
 
-def ensure_output_dir(app_root: Path, os_name: str) -> Path:
+def ensure_output_dirs(app_root: Path, os_names: list[str]) -> dict[str, Path]:
     """
-    Ensure output/<OS_NAME> exists under app_root,
-    and return that directory.
+    Ensure output/<OS_NAME> exists under app_root for every OS name,
+    and return those directories keyed by OS name.
     """
-    out_dir = app_root / "output" / os_name
-    out_dir.mkdir(parents=True, exist_ok=True)
-    return out_dir
+    output_root = app_root / "output"
+    # Create the shared parent once; each OS folder then needs a single mkdir.
+    output_root.mkdir(parents=True, exist_ok=True)
+    out_dirs = {}
+    for os_name in dict.fromkeys(os_names):
+        out_dir = output_root / os_name
+        out_dir.mkdir(exist_ok=True)
+        out_dirs[os_name] = out_dir
+    return out_dirs
+
+
+def write_icon_file(img: Image.Image, out_path: Path, **save_options) -> None:
+    """Encode an icon in memory, then write the bytes out in one large write."""
+    buffer = io.BytesIO()
+    img.save(buffer, **save_options)
+    with open(out_path, "wb", buffering=ICON_WRITE_BUFFER_SIZE) as handle:
+        handle.write(buffer.getbuffer())
+
+
+def resize_icon_frames(img: Image.Image, sizes: list[tuple[int, int]]) -> list[Image.Image]:
+    """Resample one frame per icon size in parallel (Pillow releases the GIL while resizing)."""
+    # Downsample a large source only once, to the biggest frame, and derive the
+    # smaller frames from that instead of rereading every source pixel per size.
+    largest = max(sizes, key=lambda size: size[0] * size[1])
+    base = (
+        img
+        if img.size == largest
+        else img.resize(largest, LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
+    )
+
+    # Every smaller frame gets its own LANCZOS pass from the base. Chaining 2x box
+    # reduces down the ladder would be cheaper, but it serializes the pool and
+    # visibly softens the 16-32 px frames.
+    def resize(size: tuple[int, int]) -> Image.Image:
+        return (
+            base
+            if size == largest
+            else base.resize(size, LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
+        )
+
+    with ThreadPoolExecutor(max_workers=len(sizes)) as executor:
+        return list(executor.map(resize, sizes))
 
 
 def generate_windows_icon(img: Image.Image, out_path: Path) -> None:
     """Generate a multi-size .ico for Windows."""
+    load_pillow()
     # Ensure at least 256x256 for highest size
     min_side = min(img.size)
-    if min_side < 256:
-        img = img.resize((256, 256), Image.LANCZOS)
+    if min_side < WINDOWS_ICON_SIZE:
+        img = img.resize((WINDOWS_ICON_SIZE, WINDOWS_ICON_SIZE), LANCZOS)
 
     icon_sizes = [
         (16, 16),
@@ -316,30 +502,98 @@ def generate_windows_icon(img: Image.Image, out_path: Path) -> None:
         (48, 48),
         (64, 64),
         (128, 128),
-        (256, 256),
+        (WINDOWS_ICON_SIZE, WINDOWS_ICON_SIZE),
     ]
-    img.save(out_path, format="ICO", sizes=icon_sizes)
+    frames = resize_icon_frames(img, icon_sizes)
+    write_icon_file(frames[-1], out_path, format="ICO", sizes=icon_sizes, append_images=frames[:-1])
 
 
 def generate_macos_icon(img: Image.Image, out_path: Path) -> None:
     """Generate a .icns for macOS."""
-    # Use a large base, Pillow will create smaller sizes
+    load_pillow()
+    # Use a large base and hand Pillow every pyramid level pre-resized
     if img.size[0] < MIN_MACOS_ICON_SIZE:
-        img = img.resize((MIN_MACOS_ICON_SIZE, MIN_MACOS_ICON_SIZE), Image.LANCZOS)
+        img = img.resize((MIN_MACOS_ICON_SIZE, MIN_MACOS_ICON_SIZE), LANCZOS)
 
-    img.save(out_path, format="ICNS")
+    frames = resize_icon_frames(img, [(size, size) for size in MACOS_ICON_SIZES])
+    write_icon_file(frames[-1], out_path, format="ICNS", append_images=frames[:-1])
 
 
 def generate_linux_icon(img: Image.Image, out_path: Path) -> None:
     """Generate a PNG icon for Linux (512x512)."""
-    target_size = 512
+    load_pillow()
+    target_size = LINUX_ICON_SIZE
     if img.size[0] != target_size:
-        img = img.resize((target_size, target_size), Image.LANCZOS)
+        img = img.resize((target_size, target_size), LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
 
-    img.save(out_path, format="PNG")
+    write_icon_file(img, out_path, format="PNG")
+
+
+ICON_GENERATORS = {
+    "Windows": generate_windows_icon,
+    "macOS": generate_macos_icon,
+    "Linux": generate_linux_icon,
+}
+
+# Largest frame each generator resamples from; generate_icons shares these.
+ICON_BASE_SIDES = {
+    "Windows": WINDOWS_ICON_SIZE,
+    "macOS": MIN_MACOS_ICON_SIZE,
+    "Linux": LINUX_ICON_SIZE,
+}
+
+
+def downscale_from_cache(resize_cache: dict[int, Image.Image], side: int) -> Image.Image:
+    """
+    Return a side x side frame, resampled with LANCZOS from the smallest cached
+    frame that is still at least twice as large, and remember it in 'resize_cache'.
+    """
+    if side not in resize_cache:
+        source_side = min(
+            (cached for cached in resize_cache if cached >= 2 * side),
+            default=max(resize_cache),
+        )
+        resize_cache[side] = resize_cache[source_side].resize(
+            (side, side), LANCZOS, reducing_gap=RESIZE_REDUCING_GAP
+        )
+    return resize_cache[side]
+
+
+def generate_icons(img: Image.Image, targets: list[tuple[str, Path]]) -> list[str]:
+    """Generate every requested OS icon concurrently; returns the written paths in order."""
+    load_pillow()
+    # No target needs more than MIN_MACOS_ICON_SIZE, so shrink an oversized
+    # source once here rather than once per generator.
+    master_side = MIN_MACOS_ICON_SIZE
+    if img.size[0] > master_side:
+        img = img.resize((master_side, master_side), LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
+    # A freshly opened source may still be lazily decoded; decode it here so the
+    # worker threads below only ever read from a fully loaded image.
+    img.load()
+
+    # Hand each generator its base frame pre-shrunk, deriving smaller bases from
+    # larger ones (1024 -> 512 -> 256) instead of resampling the master for each.
+    resize_cache = {img.size[0]: img}
+    base_frames = {}
+    for os_name in sorted({name for name, _ in targets}, key=ICON_BASE_SIDES.get, reverse=True):
+        side = ICON_BASE_SIDES[os_name]
+        base_frames[os_name] = (
+            img if img.size[0] <= side else downscale_from_cache(resize_cache, side)
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, len(targets))) as executor:
+        futures = [
+            executor.submit(ICON_GENERATORS[os_name], base_frames[os_name], out_path)
+            for os_name, out_path in targets
+        ]
+        for future in futures:
+            future.result()
+    return [str(out_path) for _, out_path in targets]
 
 
 def main() -> None:
+    load_gui_dependencies()
+
     # Create the root Tk instance and make it visible / on top
     root = tk.Tk()
     root.title("Icon Factory")
@@ -359,24 +613,17 @@ def main() -> None:
     os_targets = ask_target_os(root)
     base_name = ask_base_name(root)
 
-    created_files: list[str] = []
+    out_dirs = ensure_output_dirs(app_root, [os_opt["name"] for os_opt in os_targets])
+    targets: list[tuple[str, Path]] = []
 
     for os_opt in os_targets:
         os_name = os_opt["name"]
         prefix = os_opt["prefix"]
         ext = os_opt["ext"]
 
-        out_dir = ensure_output_dir(app_root, os_name)
-        out_path = out_dir / f"{prefix}{base_name}{ext}"
-
-        if os_name == "Windows":
-            generate_windows_icon(square_img, out_path)
-        elif os_name == "macOS":
-            generate_macos_icon(square_img, out_path)
-        elif os_name == "Linux":
-            generate_linux_icon(square_img, out_path)
+        targets.append((os_name, out_dirs[os_name] / f"{prefix}{base_name}{ext}"))
 
-        created_files.append(str(out_path))
+    created_files = generate_icons(square_img, targets)
 
     messagebox.showinfo(
         "Done",
@@ -409,8 +409,9 @@ def _on_catalog_table_context_menu(app, pos):
 def _preview_catalog_blob_for_cell(app, row: int, col: int):
     """Directly preview the blob in the given cell (image/audio)."""
     controller = app._catalog_table_controller()
+    index = app.table.model().index(row, col)
     cell_target = controller.cell_target(
-        app.table.model().index(row, col),
+        index,
         base_column_count=len(app.BASE_HEADERS),
         custom_fields=app.active_custom_fields,
     )
@@ -426,7 +427,9 @@ def _preview_catalog_blob_for_cell(app, row: int, col: int):
         return
 
     try:
-        if not app.cf_has_blob(track_id, cell_target.custom_field_id):
+        # The cell's raw value already records whether a blob is attached, so the preview
+        # does not need its own has-blob query before the fetch.
+        if not app._media_cell_has_payload(index, field_id=cell_target.custom_field_id):
             return
 
         field_type = str(cell_target.custom_field_type or "").strip().lower()
@@ -454,19 +457,43 @@ def _preview_catalog_blob_for_cell(app, row: int, col: int):
                 autoplay=True,
             )
             return
-        data = app.cf_fetch_blob(
-            track_id, cell_target.custom_field_id
-        )  # must return bytes or memoryview
-        if not data:
-            _root_attr("QMessageBox", QMessageBox).information(
-                app, "Preview", "No data stored in this cell."
-            )
-            return
-        if field_type == "blob_image":
-            preview_title = f"{track_title} — {field_name}" if field_name else track_title
-            app._open_image_preview(data[0] if isinstance(data, tuple) else data, preview_title)
-            return
-        app._preview_blob_bytes(data, title)
+        field_id = int(cell_target.custom_field_id)
+
+        def _load_blob(bundle, _ctx):
+            # Stored blobs can be several megabytes; read them on a worker connection so the
+            # event loop stays responsive, and only build the preview widgets on the UI thread.
+            return bundle.custom_field_values.fetch_blob(track_id, field_id)
+
+        def _open_loaded_blob(data):
+            if not data:
+                _root_attr("QMessageBox", QMessageBox).information(
+                    app, "Preview", "No data stored in this cell."
+                )
+                return
+            if field_type == "blob_image":
+                preview_title = f"{track_title} — {field_name}" if field_name else track_title
+                app._open_image_preview(
+                    data[0] if isinstance(data, tuple) else data,
+                    preview_title,
+                )
+                return
+            app._preview_blob_bytes(data, title)
+
+        app._submit_background_bundle_task(
+            title="Preview File",
+            description=f"Loading preview for {track_title}...",
+            task_fn=_load_blob,
+            kind="read",
+            unique_key=f"catalog.preview_blob.{track_id}.{field_id}",
+            show_dialog=False,
+            on_success=_open_loaded_blob,
+            on_status=lambda message: app.statusBar().showMessage(message, 3000),
+            on_error=lambda failure: app._show_background_task_error(
+                "Custom Field Error",
+                failure,
+                user_message="Failed to preview file:",
+            ),
+        )
     except Exception as e:
         app.conn.rollback()
         app.logger.exception("Preview blob failed: %s", e)
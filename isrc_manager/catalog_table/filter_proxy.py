@@ -25,9 +25,42 @@ class CatalogFilterProxyModel(QSortFilterProxyModel):
         self._normalized_search_text = ""
         self._search_column_key: str | None = None
         self._explicit_track_ids: frozenset[int] | None = None
+        # filterAcceptsRow runs once per source row; resolve the searched columns once per
+        # filter pass instead of rescanning every header for each row.
+        self._searchable_columns_cache: tuple[int, ...] | None = None
         self.setDynamicSortFilter(True)
         self.setSortRole(SortRole)
 
+    def setSourceModel(self, source_model) -> None:
+        previous_model = self.sourceModel()
+        if previous_model is not None:
+            for signal in self._column_layout_signals(previous_model):
+                try:
+                    signal.disconnect(self._clear_searchable_columns_cache)
+                except RuntimeError, TypeError:
+                    pass
+        self._clear_searchable_columns_cache()
+        if source_model is not None:
+            # Connected before the base class wiring so the cache is clear by the time
+            # the proxy re-filters after a source reset.
+            for signal in self._column_layout_signals(source_model):
+                signal.connect(self._clear_searchable_columns_cache)
+        super().setSourceModel(source_model)
+
+    @staticmethod
+    def _column_layout_signals(model) -> tuple:
+        return (
+            model.modelAboutToBeReset,
+            model.modelReset,
+            model.headerDataChanged,
+            model.columnsInserted,
+            model.columnsRemoved,
+            model.columnsMoved,
+        )
+
+    def _clear_searchable_columns_cache(self, *_args) -> None:
+        self._searchable_columns_cache = None
+
     def set_search_text(self, search_text: str | None) -> None:
         normalized = (search_text or "").strip()
         if normalized == self._search_text:
@@ -71,6 +104,7 @@ class CatalogFilterProxyModel(QSortFilterProxyModel):
         return self._explicit_track_ids
 
     def _invalidate_filter_rows(self) -> None:
+        self._clear_searchable_columns_cache()
         begin_filter_change = getattr(self, "beginFilterChange", None)
         end_filter_change = getattr(self, "endFilterChange", None)
         direction = getattr(getattr(QSortFilterProxyModel, "Direction", None), "Rows", None)
@@ -96,7 +130,11 @@ class CatalogFilterProxyModel(QSortFilterProxyModel):
         if not self._normalized_search_text:
             return True
 
-        for source_column in self._searchable_source_columns():
+        searchable_columns = self._searchable_columns_cache
+        if searchable_columns is None:
+            searchable_columns = self._searchable_source_columns()
+            self._searchable_columns_cache = searchable_columns
+        for source_column in searchable_columns:
             model_index = model.index(source_row, source_column, source_parent)
             search_text = model.data(model_index, SearchTextRole)
             if self._normalized_search_text in str(search_text or "").casefold():
@@ -34,6 +34,9 @@ class CatalogHeaderStateManager:
         self._settings = settings
         self._settings_prefix = self._normalize_prefix(settings_prefix)
 
+    def settings(self) -> QSettings | None:
+        return self._settings
+
     def settings_prefix(self) -> str:
         return self._settings_prefix
 
@@ -149,12 +152,15 @@ class CatalogHeaderStateManager:
                 settings_prefix=settings_prefix,
             )
 
+            saved_label_tokens = (
+                self._label_tokens(legacy_labels) if not key_order and legacy_labels else []
+            )
+
             native_state_restored = False
             if isinstance(native_state, QByteArray) and not native_state.isEmpty():
                 if key_order and self._same_token_set(key_order, current_keys):
                     native_state_restored = bool(header.restoreState(native_state))
-                elif not key_order and legacy_labels:
-                    saved_label_tokens = self._label_tokens(legacy_labels)
+                elif saved_label_tokens:
                     if self._same_token_set(saved_label_tokens, current_label_tokens):
                         native_state_restored = bool(header.restoreState(native_state))
                 restored = restored or native_state_restored
@@ -163,11 +169,11 @@ class CatalogHeaderStateManager:
                 if key_order:
                     self._apply_visual_order_by_keys(header, current_keys, key_order)
                     restored = True
-                elif legacy_labels:
+                elif saved_label_tokens:
                     self._apply_visual_order_by_label_tokens(
                         header,
                         current_label_tokens,
-                        self._label_tokens(legacy_labels),
+                        saved_label_tokens,
                     )
                     restored = True
 
@@ -179,6 +185,7 @@ class CatalogHeaderStateManager:
                     header,
                     normalized_specs,
                     legacy_hidden_columns,
+                    label_tokens=current_label_tokens,
                 )
                 restored = True
             else:
@@ -391,13 +398,17 @@ class CatalogHeaderStateManager:
         current_keys: Sequence[str],
         ordered_keys: Sequence[str],
     ) -> None:
+        # Duplicate keys are consumed in logical order, so keep each position list reversed
+        # and pop from the end.
         positions: dict[str, list[int]] = {}
-        for logical_index, key in enumerate(current_keys):
-            positions.setdefault(key, []).append(logical_index)
-        self._apply_visual_order(
-            header,
-            [positions.get(key, [None]).pop(0) for key in ordered_keys if positions.get(key)],
-        )
+        for logical_index in range(len(current_keys) - 1, -1, -1):
+            positions.setdefault(current_keys[logical_index], []).append(logical_index)
+        logical_indices: list[int] = []
+        for key in ordered_keys:
+            available = positions.get(key)
+            if available:
+                logical_indices.append(available.pop())
+        self._apply_visual_order(header, logical_indices)
 
     def _apply_visual_order_by_label_tokens(
         self,
@@ -435,9 +446,12 @@ class CatalogHeaderStateManager:
         header: "QHeaderView",
         column_specs: Sequence[CatalogColumnSpec],
         hidden_columns: Sequence[tuple[str, int]],
+        *,
+        label_tokens: Sequence[tuple[str, int]] | None = None,
     ) -> None:
         hidden_token_set = set(hidden_columns)
-        label_tokens = self._label_tokens([spec.header_text for spec in column_specs])
+        if label_tokens is None:
+            label_tokens = self._label_tokens([spec.header_text for spec in column_specs])
         for logical_index, token in enumerate(label_tokens):
             header.setSectionHidden(logical_index, token in hidden_token_set)
 
@@ -15,6 +15,13 @@ from .models import (
     TrackIdRole,
 )
 
+_DISPLAY_ROLE = int(Qt.ItemDataRole.DisplayRole)
+_EDIT_ROLE = int(Qt.ItemDataRole.EditRole)
+_TOOLTIP_ROLE = int(Qt.ItemDataRole.ToolTipRole)
+_DECORATION_ROLE = int(Qt.ItemDataRole.DecorationRole)
+_TEXT_ALIGNMENT_ROLE = int(Qt.ItemDataRole.TextAlignmentRole)
+_EMPTY_CELL = CatalogCellValue()
+
 
 class CatalogTableModel(QAbstractTableModel):
     """Expose pure snapshot data through stable catalog-specific Qt roles."""
@@ -38,35 +45,33 @@ class CatalogTableModel(QAbstractTableModel):
             return 0
         return len(self._snapshot.column_specs)
 
-    def data(self, index: QModelIndex, role: int = int(Qt.ItemDataRole.DisplayRole)):
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE):
+        # Called for every visible cell and role on each paint; keep role constants and the
+        # empty-cell fallback precomputed at module level.
         if not index.isValid():
             return None
 
         row = index.row()
         column = index.column()
-        if not (
-            0 <= row < len(self._snapshot.rows) and 0 <= column < len(self._snapshot.column_specs)
-        ):
+        snapshot = self._snapshot
+        if not (0 <= row < len(snapshot.rows) and 0 <= column < len(snapshot.column_specs)):
             return None
 
-        column_spec = self._snapshot.column_specs[column]
-        row_snapshot = self._snapshot.rows[row]
-        cell_value = row_snapshot.cell(column_spec.key) or CatalogCellValue()
+        column_spec = snapshot.column_specs[column]
+        row_snapshot = snapshot.rows[row]
+        cell_value = row_snapshot.cells_by_key.get(column_spec.key) or _EMPTY_CELL
 
-        if role in (
-            int(Qt.ItemDataRole.DisplayRole),
-            int(Qt.ItemDataRole.EditRole),
-        ):
+        if role == _DISPLAY_ROLE or role == _EDIT_ROLE:
             return cell_value.display_text
-        if role == int(Qt.ItemDataRole.ToolTipRole):
+        if role == _TOOLTIP_ROLE:
             return cell_value.tooltip
-        if role == int(Qt.ItemDataRole.DecorationRole):
+        if role == _DECORATION_ROLE:
             return (
                 cell_value.decoration
                 if cell_value.decoration is not None
                 else cell_value.decoration_key
             )
-        if role == int(Qt.ItemDataRole.TextAlignmentRole):
+        if role == _TEXT_ALIGNMENT_ROLE:
             return cell_value.text_alignment
         if role == SortRole:
             return cell_value.sort_value
@@ -84,16 +89,16 @@ class CatalogTableModel(QAbstractTableModel):
         self,
         section: int,
         orientation: Qt.Orientation,
-        role: int = int(Qt.ItemDataRole.DisplayRole),
+        role: int = _DISPLAY_ROLE,
     ):
         if orientation != Qt.Orientation.Horizontal:
             return None
         spec = self.column_spec(section)
         if spec is None:
             return None
-        if role == int(Qt.ItemDataRole.DisplayRole):
+        if role == _DISPLAY_ROLE:
             return spec.header_text
-        if role == int(Qt.ItemDataRole.ToolTipRole):
+        if role == _TOOLTIP_ROLE:
             return spec.notes
         if role == ColumnKeyRole:
             return spec.key
@@ -120,6 +125,12 @@ class CatalogTableModel(QAbstractTableModel):
     def source_row_for_track_id(self, track_id: int) -> int | None:
         return self._track_id_to_source_row.get(int(track_id))
 
+    def cell_for_track_id(self, track_id: int, column_key: str) -> CatalogCellValue | None:
+        source_row = self.source_row_for_track_id(track_id)
+        if source_row is None:
+            return None
+        return self._snapshot.rows[source_row].cell(column_key)
+
     @staticmethod
     def _build_track_id_index(snapshot: CatalogSnapshot) -> dict[int, int]:
         return {row.track_id: source_row for source_row, row in enumerate(snapshot.rows)}
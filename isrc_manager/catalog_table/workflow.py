@@ -537,6 +537,16 @@ def _catalog_snapshot_from_dataset(
     standard_meta = dict((blob_badges or {}).get("standard_media") or {})
     custom_meta = dict((blob_badges or {}).get("custom_fields") or {})
     base_cols = len(app.BASE_HEADERS)
+    # Field types do not change during a refresh, so classify each custom column once
+    # instead of once per row.
+    custom_columns = tuple(
+        (
+            column_specs[base_cols + offset],
+            field,
+            str(field.get("field_type") or "").strip().lower() in ("blob_image", "blob_audio"),
+        )
+        for offset, field in enumerate(app.active_custom_fields)
+    )
     snapshot_rows: list[CatalogRowSnapshot] = []
     total_rows = len(rows)
     if total_rows <= 0:
@@ -577,10 +587,8 @@ def _catalog_snapshot_from_dataset(
                     header_text=header,
                 )
 
-        for offset, field in enumerate(app.active_custom_fields):
-            column_spec = column_specs[base_cols + offset]
-            field_type = str(field.get("field_type") or "").strip().lower()
-            if field_type in ("blob_image", "blob_audio"):
+        for column_spec, field, is_blob_field in custom_columns:
+            if is_blob_field:
                 cells_by_key[column_spec.key] = app._media_badge_cell_value(
                     custom_meta.get((track_id, int(field["id"]))),
                     track_id=track_id,
@@ -1029,13 +1037,15 @@ def refresh_table(app):
         header = app.table.horizontalHeader()
         sort_col = header.sortIndicatorSection()
         sort_order = header.sortIndicatorOrder()
-        if _prev_sort_enabled:
-            app.table.setSortingEnabled(False)
-        app._clear_catalog_table_model()
-        app._apply_catalog_model_dataset(dataset)
-        app.table.setSortingEnabled(_prev_sort_enabled)
-        if _prev_sort_enabled:
-            app._sort_catalog_table(sort_col, sort_order)
+        # Clearing, repopulating and re-sorting each reset the view; paint once at the end.
+        with app._suspend_catalog_view_updates():
+            if _prev_sort_enabled:
+                app.table.setSortingEnabled(False)
+            app._clear_catalog_table_model()
+            app._apply_catalog_model_dataset(dataset)
+            app.table.setSortingEnabled(_prev_sort_enabled)
+            if _prev_sort_enabled:
+                app._sort_catalog_table(sort_col, sort_order)
     finally:
         app._suspend_layout_history = previous_suspend_state
 
@@ -15,6 +15,12 @@ from isrc_manager.constants import FIELD_TYPE_CHOICES, PROMOTED_CUSTOM_FIELD_NAM
 from isrc_manager.file_storage import STORAGE_MODE_DATABASE
 from isrc_manager.ui_common import DatePickerDialog
 
+_ISO_DATE_RE = re.compile(r"\A\d{4}-\d{2}-\d{2}\Z")
+# Skip per-entry icon and symlink lookups; they dominate on network shares.
+_ATTACH_FILE_DIALOG_OPTIONS = (
+    QFileDialog.Option.DontUseCustomDirectoryIcons | QFileDialog.Option.DontResolveSymlinks
+)
+
 
 def _root_attr(name: str, fallback):
     main_window_module = sys.modules.get("isrc_manager.main_window")
@@ -101,9 +107,10 @@ def _apply_custom_field_configuration(
     try:
         changed_summary = json.dumps(
             [
-                {"id": f.get("id"), "name": f["name"], "type": f.get("field_type")}
-                for f in new_fields
-            ]
+                {"id": item["id"], "name": item["name"], "type": item["field_type"]}
+                for item in new_summary
+            ],
+            separators=(",", ":"),
         )
     except Exception:
         changed_summary = "fields changed"
@@ -316,7 +323,11 @@ def _on_catalog_index_double_clicked(app, index):
         else:
             flt = "Audio (*.wav *.aif *.aiff *.mp3 *.flac *.m4a *.aac *.ogg *.opus);;All files (*)"
         new_path, _ = _root_attr("QFileDialog", QFileDialog).getOpenFileName(
-            app, f"Attach file: {field['name']}", "", flt
+            app,
+            f"Attach file: {field['name']}",
+            "",
+            flt,
+            options=_ATTACH_FILE_DIALOG_OPTIONS,
         )
         if not new_path:
             return
@@ -374,7 +385,7 @@ def _on_catalog_index_double_clicked(app, index):
             current=choices.index(current_val) if current_val in choices else 0,
             editable=True,
         )
-        if not ok:
+        if not ok or new_val == current_val:
             return
         if new_val and options is not None and new_val not in options:
             options.append(new_val)
@@ -392,7 +403,7 @@ def _on_catalog_index_double_clicked(app, index):
             return
         new_val = "True" if choice == "True" else "False"
     elif field_type == "date":
-        init = current_val if re.match(r"^\d{4}-\d{2}-\d{2}$", (current_val or "")) else None
+        init = current_val if _ISO_DATE_RE.match(current_val or "") else None
         dlg = _root_attr("DatePickerDialog", DatePickerDialog)(
             app, initial_iso_date=init, title=f"Edit: {field['name']}"
         )
@@ -413,8 +424,11 @@ def _on_catalog_index_double_clicked(app, index):
 
         def mutation():
             if field_type == "dropdown" and options_updated:
-                app.custom_field_definitions.update_dropdown_options(field_id, options)
-            app.custom_field_values.save_value(track_id, field_id, value=new_val)
+                app.custom_field_values.save_value(
+                    track_id, field_id, value=new_val, dropdown_options=options
+                )
+            else:
+                app.custom_field_values.save_value(track_id, field_id, value=new_val)
 
         app._run_snapshot_history_action(
             action_label=f"Update Custom Field: {field['name']}",
@@ -1,5 +1,9 @@
 """Track duration formatting helpers."""
 
+import re
+
+_HMS_TEXT_RE = re.compile(r"(\d+):(\d+):(\d+)")
+
 
 def seconds_to_hms(total: int) -> str:
     try:
@@ -26,6 +30,10 @@ def hms_to_seconds(h: int, m: int, s: int) -> int:
 
 
 def parse_hms_text(t: str) -> int:
+    match = _HMS_TEXT_RE.fullmatch((t or "").strip())
+    if match is not None:
+        h, m, s = (int(part) for part in match.groups())
+        return h * 3600 + min(m, 59) * 60 + min(s, 59)
     try:
         parts = [int(x) for x in (t or "").split(":")]
         if len(parts) == 3:
@@ -6,6 +6,7 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QDialog, QFileDialog, QMessageBox
 
 from isrc_manager.exchange import ExchangeImportOptions, ExchangeImportReport, ExchangeInspection
@@ -308,7 +309,9 @@ def import_exchange_file(app, format_name: str):
                     focus_id=(report.created_tracks or report.updated_tracks or [None])[0]
                 )
                 app._refresh_history_actions()
-                app.populate_all_comboboxes()
+                # Combo sources are rebuilt once control returns to the event loop so the
+                # import report is not held back by a second full catalog query.
+                QTimer.singleShot(0, app.populate_all_comboboxes)
                 app._advance_task_ui_progress(
                     ui_progress,
                     value=100,
@@ -55,6 +55,8 @@ from .models import (
 
 JSON_SCHEMA_VERSION = 1
 CSV_SNIFF_SAMPLE_SIZE = 4096
+# Compressed ZIP members cannot use the kernel copy fast path, so copy them in 1 MiB blocks.
+PACKAGE_EXTRACT_BUFFER_SIZE = 1024 * 1024
 AUTO_CSV_DELIMITERS = ",;\t|"
 
 _IDENTIFIER_FIELD_TO_SYSTEM_KEY = {
@@ -883,7 +885,7 @@ class ExchangeService:
                     continue
                 destination.parent.mkdir(parents=True, exist_ok=True)
                 with archive.open(member, "r") as src, destination.open("wb") as dst:
-                    shutil.copyfileobj(src, dst)
+                    shutil.copyfileobj(src, dst, PACKAGE_EXTRACT_BUFFER_SIZE)
 
     @staticmethod
     def _normalize_package_media_key(value: object) -> str:
@@ -2162,6 +2164,7 @@ class ExchangeService:
             *,
             cursor: sqlite3.Cursor,
         ) -> None:
+            values: list[tuple[int, int, str]] = []
             for key, value in row.items():
                 if not str(key).startswith("custom::"):
                     continue
@@ -2169,7 +2172,9 @@ class ExchangeService:
                 field_id = custom_defs.get(field_name)
                 if field_id is None:
                     continue
-                cursor.execute(
+                values.append((track_id, field_id, str(value or "")))
+            if values:
+                cursor.executemany(
                     """
                     INSERT INTO CustomFieldValues(
                         track_id,
@@ -2192,7 +2197,7 @@ class ExchangeService:
                         mime_type=excluded.mime_type,
                         size_bytes=excluded.size_bytes
                     """,
-                    (track_id, field_id, str(value or "")),
+                    values,
                 )
 
         for index, row in enumerate(normalized_rows, start=1):
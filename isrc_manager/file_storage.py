@@ -202,6 +202,14 @@ def bytes_from_blob(blob_value: object | None) -> bytes:
     if isinstance(blob_value, bytearray):
         return bytes(blob_value)
     if isinstance(blob_value, memoryview):
+        # A view spanning a whole bytes object can hand back that object instead of copying it.
+        source = blob_value.obj
+        if (
+            isinstance(source, bytes)
+            and blob_value.c_contiguous
+            and blob_value.nbytes == len(source)
+        ):
+            return source
         return blob_value.tobytes()
     return bytes(blob_value)
 
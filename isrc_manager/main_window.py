@@ -759,6 +759,8 @@ class App(QMainWindow):
     STARTUP_SOUND_FILENAME = APP_SOUND_FILENAMES[APP_SOUND_STARTUP]
     DEFAULT_STARTUP_SOUND_ENABLED = APP_SOUND_DEFAULTS[APP_SOUND_STARTUP]
     STARTUP_SOUND_DELAY_MS = 250
+    HEADER_REORDER_SAVE_DELAY_MS = 500
+    BACKUP_PREFER_VACUUM_SETTINGS_KEY = "backup/prefer_vacuum_into"
     APP_SOUND_VOLUMES = {
         APP_SOUND_STARTUP: 0.45,
         APP_SOUND_NOTICE: 0.42,
@@ -816,6 +818,7 @@ class App(QMainWindow):
 
         self.settings = QSettings(str(settings_path()), QSettings.IniFormat)
         self.settings.setFallbacksEnabled(False)
+        self._catalog_header_state_managers: dict[str, CatalogHeaderStateManager] = {}
         self.update_preferences = UpdatePreferenceService(self.settings)
         self.logger = logging.getLogger("ISRCManager")
         self.trace_logger = logging.getLogger("ISRCManager.trace")
@@ -1657,6 +1660,7 @@ class App(QMainWindow):
         timer = getattr(self, "_app_sound_hook_timer", None)
         if timer is not None:
             timer.stop()
+        self._flush_header_reorder_save()
         self._stop_audio_waveform_cache_worker(wait=False)
         self._save_main_window_geometry(sync=False)
         self._store_workspace_panel_visibility_preferences(sync=False)
@@ -3290,13 +3294,13 @@ class App(QMainWindow):
                 details=details,
             )
         except Exception as e:
-            self.logger.exception(f"Failed to write AuditLog: {e}")
+            self.logger.exception("Failed to write AuditLog: %s", e)
 
     def _audit_commit(self):
         try:
             self.conn.commit()
         except Exception as e:
-            self.logger.exception(f"Audit commit error: {e}")
+            self.logger.exception("Audit commit error: %s", e)
 
     def _refresh_history_actions(self):
         if not hasattr(self, "undo_action"):
@@ -3378,6 +3382,24 @@ class App(QMainWindow):
     def _on_header_sections_reordered(self, *_args):
         if getattr(self, "_suspend_layout_history", False):
             return
+        # A drag can emit several sectionMoved signals in quick succession;
+        # persist the final order once the header settles.
+        self._header_reorder_save_pending = True
+        timer = getattr(self, "_header_save_timer", None)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            self._connect_noarg_signal(timer.timeout, timer, self._flush_header_reorder_save)
+            self._header_save_timer = timer
+        timer.start(self.HEADER_REORDER_SAVE_DELAY_MS)
+
+    def _flush_header_reorder_save(self) -> None:
+        timer = getattr(self, "_header_save_timer", None)
+        if timer is not None:
+            timer.stop()
+        if not getattr(self, "_header_reorder_save_pending", False):
+            return
+        self._header_reorder_save_pending = False
         prefix = self._table_settings_prefix()
         self._save_header_state(
             action_label="Reorder Columns",
@@ -3407,6 +3429,7 @@ class App(QMainWindow):
     def _unbind_header_state_signals(self):
         if not getattr(self, "_header_layout_signals_bound", False) or not hasattr(self, "table"):
             return
+        self._flush_header_reorder_save()
         header = self.table.horizontalHeader()
         moved_wrapper = getattr(self, "_header_section_moved_wrapper", None)
         resized_wrapper = getattr(self, "_header_section_resized_wrapper", None)
@@ -4009,7 +4032,7 @@ class App(QMainWindow):
                 self.history_manager.apply_setting_entries(before_entries)
             except Exception as restore_error:
                 self.logger.exception(
-                    f"Settings rollback failed for {action_label}: {restore_error}"
+                    "Settings rollback failed for %s: %s", action_label, restore_error
                 )
             raise
         after_entries = self.history_manager.capture_setting_states(setting_keys)
@@ -4064,7 +4087,7 @@ class App(QMainWindow):
             try:
                 self.history_manager.restore_file_state(target_path, before_state)
             except Exception as restore_error:
-                self.logger.exception(f"File rollback failed for {action_type}: {restore_error}")
+                self.logger.exception("File rollback failed for %s: %s", action_type, restore_error)
             raise
 
     def _table_setting_keys(self, *, include_columns_movable: bool = False) -> list[str]:
@@ -4228,7 +4251,7 @@ class App(QMainWindow):
                 if entry is not None:
                     self._refresh_after_history_change()
         except Exception as e:
-            self.logger.exception(f"Undo failed: {e}")
+            self.logger.exception("Undo failed: %s", e)
             QMessageBox.critical(self, "Undo Error", f"Could not undo the last action:\n{e}")
 
     def history_redo(self):
@@ -4247,7 +4270,7 @@ class App(QMainWindow):
                 if entry is not None:
                     self._refresh_after_history_change()
         except Exception as e:
-            self.logger.exception(f"Redo failed: {e}")
+            self.logger.exception("Redo failed: %s", e)
             QMessageBox.critical(self, "Redo Error", f"Could not redo the action:\n{e}")
 
     def create_manual_snapshot(self):
@@ -4743,10 +4766,13 @@ class App(QMainWindow):
     def populate_all_comboboxes(self, *args, **kwargs):
         return catalog_workflow.populate_all_comboboxes(self, *args, **kwargs)
 
-    def _artist_lookup_values(self) -> list[str]:
+    def _catalog_lookup_values(self) -> dict[str, list[str]]:
         if self.conn is None:
-            return []
-        return list(self._catalog_combo_values_from_connection(self.conn).get("artists", []))
+            return {}
+        return self._catalog_combo_values_from_connection(self.conn)
+
+    def _artist_lookup_values(self) -> list[str]:
+        return list(self._catalog_lookup_values().get("artists", []))
 
     @staticmethod
     def _populate_combobox(combo: QComboBox, items, allow_empty=False):
@@ -5772,11 +5798,11 @@ class App(QMainWindow):
             )
         except sqlite3.IntegrityError as e:
             self.conn.rollback()
-            self.logger.exception(f"Save failed (integrity): {e}")
+            self.logger.exception("Save failed (integrity): %s", e)
             QMessageBox.critical(self, "Save Error", f"Database constraint error:\n{e}")
         except Exception as e:
             self.conn.rollback()
-            self.logger.exception(f"Save failed: {e}")
+            self.logger.exception("Save failed: %s", e)
             QMessageBox.critical(self, "Save Error", f"Failed to save record:\n{e}")
 
     def open_add_album_dialog(
@@ -7969,7 +7995,7 @@ class App(QMainWindow):
                 )
             except Exception as e:
                 self.conn.rollback()
-                self.logger.exception(f"Delete failed: {e}")
+                self.logger.exception("Delete failed: %s", e)
                 QMessageBox.critical(self, "Delete Error", f"Failed to delete:\n{e}")
 
     def init_form(self):
@@ -8016,7 +8042,7 @@ class App(QMainWindow):
         try:
             self._apply_single_setting_value("sena_number", (value or "").strip())
         except Exception as e:
-            self.logger.exception(f"Set SENA number failed: {e}")
+            self.logger.exception("Set SENA number failed: %s", e)
             QMessageBox.critical(self, "Error", f"Could not save SENA number:\n{e}")
 
     def _redirect_owner_registration_edit_to_party_manager(self, *args, **kwargs):
@@ -8248,29 +8274,36 @@ class App(QMainWindow):
         if not sel_model.hasSelection():
             view.selectAll()
 
-        rows_out = []
-        indexes = sorted(sel_model.selectedIndexes(), key=lambda i: (i.row(), i.column()))
-        if not indexes:
+        # One pass over the selection reads each cell's display text once; the bounding box
+        # comes from the same pass instead of sorting every selected index.
+        cell_texts: dict[tuple[int, int], str] = {}
+        r0 = c0 = sys.maxsize
+        r1 = c1 = -1
+        display_role = Qt.DisplayRole
+        for idx in sel_model.selectedIndexes():
+            r, c = idx.row(), idx.column()
+            cell_texts[(r, c)] = str(model.data(idx, display_role) or "")
+            r0, r1 = min(r0, r), max(r1, r)
+            c0, c1 = min(c0, c), max(c1, c)
+        if not cell_texts:
             QApplication.clipboard().setText("")
             return
-        r0, r1 = indexes[0].row(), indexes[-1].row()
-        c0, c1 = min(i.column() for i in indexes), max(i.column() for i in indexes)
-        idx_set = {(i.row(), i.column()): i for i in indexes}
+        columns = range(c0, c1 + 1)
+        # Cells and separators go into one flat list joined once, rather than building a
+        # string per row and then joining the rows again.
+        parts: list[str] = []
         if include_headers:
-            header_texts = []
-            for c in range(c0, c1 + 1):
-                header_texts.append(str(model.headerData(c, Qt.Horizontal) or ""))
-            rows_out.append("\t".join(header_texts))
+            for c in columns:
+                parts.append(str(model.headerData(c, Qt.Horizontal) or ""))
+                parts.append("\t")
+            parts[-1] = "\n"
         for r in range(r0, r1 + 1):
-            line = []
-            for c in range(c0, c1 + 1):
-                idx = idx_set.get((r, c))
-                if idx is None:
-                    line.append("")
-                else:
-                    line.append(str(model.data(idx, Qt.DisplayRole) or ""))
-            rows_out.append("\t".join(line))
-        QApplication.clipboard().setText("\n".join(rows_out))
+            for c in columns:
+                parts.append(cell_texts.get((r, c), ""))
+                parts.append("\t")
+            parts[-1] = "\n"
+        parts.pop()
+        QApplication.clipboard().setText("".join(parts))
 
     # =============================================================================
     # Table header order persistence
@@ -8290,10 +8323,14 @@ class App(QMainWindow):
         path: str | None = None,
     ) -> CatalogHeaderStateManager:
         resolved_path = getattr(self, "current_db_path", "") if path is None else path
-        return CatalogHeaderStateManager(
-            self.settings,
-            settings_prefix=self._table_settings_prefix_for_path(resolved_path or ""),
-        )
+        settings_prefix = self._table_settings_prefix_for_path(resolved_path or "")
+        # Header save/restore runs on every column move and resize; reuse one manager per
+        # profile namespace instead of rebuilding it for each call.
+        manager = self._catalog_header_state_managers.get(settings_prefix)
+        if manager is None or manager.settings() is not self.settings:
+            manager = CatalogHeaderStateManager(self.settings, settings_prefix=settings_prefix)
+            self._catalog_header_state_managers[settings_prefix] = manager
+        return manager
 
     def _catalog_table_controller(self) -> CatalogTableController:
         controller = getattr(self, "_catalog_table_controller_instance", None)
@@ -8636,16 +8673,32 @@ class App(QMainWindow):
         This uses the SQLite Online Backup API when available to capture the
         **entire** database (all tables, custom columns, indexes, triggers, data).
         If that fails (older Python/SQLite), it falls back to `VACUUM INTO`,
-        and finally to a safe file copy after closing the connection.
+        and finally to a safe file copy after closing the connection. The
+        `backup/prefer_vacuum_into` setting tries `VACUUM INTO` first for a
+        compacted backup file. The copy runs as a background task on the
+        worker bundle's own connection, so the window keeps painting and the
+        task dialog shows page progress while large profiles are copied.
         """
         src = Path(self.current_db_path)
         if not src.exists():
             QMessageBox.warning(self, "Backup", "No current database to backup.")
             return
+        prefer_vacuum = bool(
+            self.settings.value(self.BACKUP_PREFER_VACUUM_SETTINGS_KEY, False, bool)
+        )
 
         def _worker(bundle, ctx):
             ctx.set_status("Creating a database backup...")
-            result = bundle.database_maintenance.create_backup(bundle.conn, src)
+            result = bundle.database_maintenance.create_backup(
+                bundle.conn,
+                src,
+                prefer_vacuum=prefer_vacuum,
+                progress_callback=lambda value, maximum, message: ctx.report_progress(
+                    value=value,
+                    maximum=maximum,
+                    message=message,
+                ),
+            )
             if bundle.history_manager is not None:
                 before_state = {
                     "target_path": str(result.backup_path),
@@ -8715,7 +8768,9 @@ class App(QMainWindow):
 
         def _worker(bundle, ctx):
             ctx.set_status("Running SQLite integrity check...")
-            result = bundle.database_maintenance.verify_integrity(current_path)
+            # The bundle connection is already open with its schema loaded and statement
+            # cache primed, so the check skips a cold connect on every Verify.
+            result = bundle.database_maintenance.verify_integrity(current_path, conn=bundle.conn)
             if bundle.history_manager is not None:
                 bundle.history_manager.record_event(
                     label=f"Verify Integrity: {result}",
@@ -8752,6 +8807,100 @@ class App(QMainWindow):
             ),
         )
 
+    def compact_database(self):
+        """Give free pages left behind by deletions back to the file system.
+
+        The profile is closed while the maintenance service compacts it on a
+        connection of its own, either with a bounded incremental vacuum or by
+        swapping in a verified `VACUUM INTO` copy, and is reopened afterwards.
+        """
+        current_db_path = str(self.current_db_path)
+        if not Path(current_db_path).exists():
+            QMessageBox.warning(self, "Compact Database", "No current database to compact.")
+            return
+        allowed, reason = self.background_tasks.can_start(kind="exclusive", unique_key="db.compact")
+        if not allowed:
+            QMessageBox.warning(self, "Compact Database", reason or "Another task is running.")
+            return
+
+        # The swap needs every connection to the profile closed, so join the waveform cache
+        # worker instead of letting it wind down on its own.
+        self._stop_audio_waveform_cache_worker(wait=True)
+        self._close_database_connection()
+
+        def _worker(ctx):
+            ctx.set_status("Compacting the database...")
+            conn = self.sqlite_connection_factory.open(current_db_path)
+            try:
+                # The window reopens the profile itself once the task finishes.
+                result = self.database_maintenance.maintain_database(
+                    conn,
+                    current_db_path,
+                    close_connection=conn.close,
+                    reopen_connection=lambda: None,
+                )
+            finally:
+                conn.close()
+            return {"method": result.method, "freed_pages": result.freed_pages}
+
+        def _success(result):
+            self.open_database(current_db_path)
+            if self.history_manager is not None:
+                self.history_manager.record_event(
+                    label="Compact Database",
+                    action_type="db.compact",
+                    entity_type="DB",
+                    entity_id=current_db_path,
+                    payload={"path": current_db_path, **result},
+                )
+            self._refresh_history_actions()
+            QMessageBox.information(
+                self,
+                "Compact Database",
+                f"Released {result['freed_pages']} free pages ({result['method']}).",
+            )
+            self._log_event(
+                "db.compact",
+                "Database compacted",
+                path=current_db_path,
+                method=result["method"],
+                freed_pages=result["freed_pages"],
+            )
+            try:
+                self._audit(
+                    "COMPACT",
+                    "DB",
+                    ref_id=current_db_path,
+                    details=f"method={result['method']}, freed_pages={result['freed_pages']}",
+                )
+                self._audit_commit()
+            except Exception:
+                pass
+
+        def _error(failure):
+            try:
+                self.open_database(current_db_path)
+            except Exception as reopen_error:
+                self.logger.exception(
+                    "Failed to reopen database after compaction error: %s", reopen_error
+                )
+            self._show_background_task_error(
+                "Compact Error",
+                failure,
+                user_message="Failed to compact the database:",
+            )
+
+        self._submit_background_task(
+            title="Compact Database",
+            description="Releasing free pages from the current database...",
+            task_fn=_worker,
+            kind="exclusive",
+            unique_key="db.compact",
+            requires_profile=False,
+            on_success=_success,
+            on_error=_error,
+        )
+
     def restore_database(self):
         """Restore the database from a backup .db file.
 
@@ -8922,20 +9071,26 @@ class App(QMainWindow):
             on_error=_error,
         )
 
+    # Handler names are resolved per key press so instance-level overrides keep working.
+    _KEY_PRESS_HANDLERS = {
+        Qt.Key_Delete: "delete_entry",
+        Qt.Key_Escape: "reset_search",
+        Qt.Key_Return: "_save_from_add_data_key",
+        Qt.Key_Enter: "_save_from_add_data_key",
+    }
+
     def keyPressEvent(self, event):
-        if event.key() == Qt.Key_Delete:
-            self.delete_entry()
-        elif event.key() == Qt.Key_Escape:
-            self.reset_search()
-        elif event.key() in (Qt.Key_Return, Qt.Key_Enter):
-            # Only save when the Add Data panel is active AND focus is inside that panel
-            panel_enabled = (
-                getattr(self, "add_data_action", None) and self.add_data_action.isChecked()
-            )
-            if panel_enabled and self._form_has_focus():
-                self.save()
-        else:
+        handler_name = self._KEY_PRESS_HANDLERS.get(event.key())
+        if handler_name is None:
             super().keyPressEvent(event)
+            return
+        getattr(self, handler_name)()
+
+    def _save_from_add_data_key(self):
+        # Only save when the Add Data panel is active AND focus is inside that panel
+        panel_enabled = getattr(self, "add_data_action", None) and self.add_data_action.isChecked()
+        if panel_enabled and self._form_has_focus():
+            self.save()
 
     def _configure_media_attach_drop_targets(self, *args, **kwargs):
         return catalog_media_routing._configure_media_attach_drop_targets(self, *args, **kwargs)
@@ -9271,7 +9426,7 @@ class App(QMainWindow):
             self.refresh_table_preserve_view(focus_id=track_id)
         except Exception as e:
             self.conn.rollback()
-            self.logger.exception(f"Attach blob failed: {e}")
+            self.logger.exception("Attach blob failed: %s", e)
             QMessageBox.critical(self, "Custom Field Error", f"Failed to attach file:\n{e}")
 
     # ---------------------- BLOB CF helpers v2 (get/export/delete/format) ----------------------
@@ -9291,6 +9446,13 @@ class App(QMainWindow):
     def cf_has_blob(self, track_id: int, field_def_id: int) -> bool:
         return self.custom_field_values.has_blob(track_id, field_def_id)
 
+    def cf_track_ids_with_blob(self, track_ids, field_def_id: int) -> set[int]:
+        meta_map = self.custom_field_values.get_value_meta_map(
+            [field_def_id],
+            track_ids=track_ids,
+        )
+        return {track_id for (track_id, _field_id), meta in meta_map.items() if meta["has_blob"]}
+
     def cf_blob_size(self, track_id: int, field_def_id: int) -> int:
         return self.custom_field_values.blob_size(track_id, field_def_id)
 
@@ -9304,70 +9466,54 @@ class App(QMainWindow):
         parent_widget=None,
         suggested_basename: str | None = None,
     ):
-        if self.cf_get_field_type(field_def_id) == "blob_audio":
-            meta = self.cf_get_value_meta(
-                track_id,
-                field_def_id,
-                include_storage_details=True,
-            )
-            if suggested_basename is None:
-                suggested_basename = self.custom_field_definitions.get_field_name(field_def_id)
-            default_filename = self._default_export_filename(
-                suggested_basename,
-                str(meta.get("mime_type") or ""),
-            )
-            dest_path, _ = QFileDialog.getSaveFileName(
-                parent_widget or self,
-                "Export file",
-                default_filename,
-                "All files (*)",
-            )
-            if not dest_path:
-                return
-            try:
-                resolved_dest_path = self._resolve_file_export_target(
-                    dest_path,
-                    default_filename=default_filename,
-                )
-            except ValueError as exc:
-                QMessageBox.warning(parent_widget or self, "Export", str(exc))
-                return
-
-            self._submit_background_audio_file_export(
-                task_title="Export Audio File",
-                task_description=("Exporting stored custom audio and recording export history..."),
-                dialog_title="Export",
-                resolved_dest_path=resolved_dest_path,
-                action_label="Export Custom File: {filename}",
-                action_type="file.export_custom_blob",
-                entity_type="CustomFieldValue",
-                entity_id=f"{track_id}:{field_def_id}",
-                payload={"track_id": track_id, "field_id": field_def_id},
-                load_source=lambda bundle: bundle.custom_field_values.fetch_blob(
-                    int(track_id),
-                    int(field_def_id),
-                ),
-                parent_widget=parent_widget or self,
-            )
+        media_label = "audio" if self.cf_get_field_type(field_def_id) == "blob_audio" else "image"
+        meta = self.cf_get_value_meta(
+            track_id,
+            field_def_id,
+            include_storage_details=True,
+        )
+        if suggested_basename is None:
+            suggested_basename = self.custom_field_definitions.get_field_name(field_def_id)
+        default_filename = self._default_export_filename(
+            suggested_basename,
+            str(meta.get("mime_type") or ""),
+        )
+        dest_path, _ = QFileDialog.getSaveFileName(
+            parent_widget or self,
+            "Export file",
+            default_filename,
+            "All files (*)",
+        )
+        if not dest_path:
             return
-
         try:
-            data, mime = self.cf_fetch_blob(track_id, field_def_id)
-        except Exception as e:
-            QMessageBox.critical(parent_widget or None, "Export failed", str(e))
+            resolved_dest_path = self._resolve_file_export_target(
+                dest_path,
+                default_filename=default_filename,
+            )
+        except ValueError as exc:
+            QMessageBox.warning(parent_widget or self, "Export", str(exc))
             return
-        if suggested_basename is None:
-            suggested_basename = self.custom_field_definitions.get_field_name(field_def_id)
-        self._export_bytes_with_picker(
-            data,
-            mime=mime or "",
-            suggested_basename=suggested_basename,
-            parent_widget=parent_widget or self,
+
+        self._submit_background_audio_file_export(
+            task_title=f"Export {media_label.title()} File",
+            task_description=(
+                f"Exporting stored custom {media_label} and recording export history..."
+            ),
+            dialog_title="Export",
+            resolved_dest_path=resolved_dest_path,
             action_label="Export Custom File: {filename}",
             action_type="file.export_custom_blob",
             entity_type="CustomFieldValue",
             entity_id=f"{track_id}:{field_def_id}",
             payload={"track_id": track_id, "field_id": field_def_id},
+            write_source=lambda bundle, path: bundle.custom_field_values.export_blob_to_path(
+                int(track_id),
+                int(field_def_id),
+                path,
+            ),
+            media_label=media_label,
+            parent_widget=parent_widget or self,
         )
 
     def cf_delete_blob(self, track_id: int, field_def_id: int):
@@ -9811,21 +9957,21 @@ class App(QMainWindow):
         return -1
 
     def _get_track_title(self, track_id: int) -> str:
+        # The loaded catalog snapshot is rebuilt on every refresh, so it doubles as the title
+        # cache; only tracks outside it need a single-row query.
+        model = self._catalog_source_model()
+        if model is not None:
+            cell = model.cell_for_track_id(track_id, "base:track_title")
+            title = cell.display_text.strip() if cell is not None else ""
+            if title:
+                return title
         return self.track_service.fetch_track_title(track_id, cursor=self.cursor)
 
     def _sanitize_filename(self, text: str) -> str:
         return sanitize_export_basename(text)
 
     def _make_default_export_filename(self, track_id: int, field_def: dict, mime: str) -> str:
-        # Use track title only
-        title = self._get_track_title(track_id)
-        base = self._sanitize_filename(title)
-
-        # Extension from MIME type
-        ext = mimetypes.guess_extension(mime or "")
-        if not ext:
-            ext = ".bin"
-        return base + ext
+        return self._default_export_filename(self._get_track_title(track_id), mime)
 
     def _open_audio_preview_for_track(self, *args, **kwargs):
         return media_player_controller._open_audio_preview_for_track(self, *args, **kwargs)
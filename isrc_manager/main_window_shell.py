@@ -619,6 +619,12 @@ def _build_actions_and_menus(app: Any, *, movable: bool) -> None:
     )
     database_submenu.addAction(app.backup_action)
 
+    app.compact_action = app._create_action(
+        "Compact Database",
+        slot=app.compact_database,
+    )
+    database_submenu.addAction(app.compact_action)
+
     app.restore_action = app._create_action(
         "Restore from Backup…",
         slot=app.restore_database,
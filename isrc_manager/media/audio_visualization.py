@@ -11,6 +11,13 @@ from isrc_manager.media.equalizer import (
 )
 from isrc_manager.media.waveform import WaveformWidget
 
+# Power-of-two reciprocals: scaling float32 PCM in place by these is exact, and it
+# avoids the extra full-length temporary that ``array / full_scale`` allocates.
+_PCM8_SCALE = 1.0 / 128.0
+_PCM16_SCALE = 1.0 / 32768.0
+_PCM24_SCALE = 1.0 / 8388608.0
+_PCM32_SCALE = 1.0 / 2147483648.0
+
 
 class StereoPeakMeterWidget(QWidget):
     BAR_WIDTH = 5
@@ -627,9 +634,12 @@ def load_audio_harmonic_frames(path: str, *, target_sr: int = 22050):
             if not raw:
                 return None
             if sample_width == 1:
-                values = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+                values = np.frombuffer(raw, dtype=np.uint8).astype(np.float32)
+                values -= 128.0
+                values *= _PCM8_SCALE
             elif sample_width == 2:
-                values = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+                values = np.frombuffer(raw, dtype="<i2").astype(np.float32)
+                values *= _PCM16_SCALE
             elif sample_width == 3:
                 data = np.frombuffer(raw, dtype=np.uint8)
                 usable = (len(data) // 3) * 3
@@ -637,10 +647,11 @@ def load_audio_harmonic_frames(path: str, *, target_sr: int = 22050):
                     return None
                 triples = data[:usable].reshape(-1, 3).astype(np.int32)
                 values = triples[:, 0] | (triples[:, 1] << 8) | (triples[:, 2] << 16)
-                values = np.where(values & 0x800000, values - 0x1000000, values).astype(np.float32)
-                values = values / 8388608.0
+                values = ((values ^ 0x800000) - 0x800000).astype(np.float32)
+                values *= _PCM24_SCALE
             elif sample_width == 4:
-                values = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+                values = np.frombuffer(raw, dtype="<i4").astype(np.float32)
+                values *= _PCM32_SCALE
             else:
                 return None
             if channels > 1:
@@ -681,7 +692,8 @@ def load_audio_harmonic_frames(path: str, *, target_sr: int = 22050):
             )
             if not output:
                 return None
-            values = np.frombuffer(output, dtype="<i2").astype(np.float32) / 32768.0
+            values = np.frombuffer(output, dtype="<i2").astype(np.float32)
+            values *= _PCM16_SCALE
             return np.clip(values, -1.0, 1.0), int(target_sr)
         except Exception:
             return None
@@ -849,9 +861,12 @@ def load_audio_peak_meter_frames(path: str, *, target_sr: int = 22050):
             if not raw:
                 return None
             if sample_width == 1:
-                values = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+                values = np.frombuffer(raw, dtype=np.uint8).astype(np.float32)
+                values -= 128.0
+                values *= _PCM8_SCALE
             elif sample_width == 2:
-                values = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+                values = np.frombuffer(raw, dtype="<i2").astype(np.float32)
+                values *= _PCM16_SCALE
             elif sample_width == 3:
                 data = np.frombuffer(raw, dtype=np.uint8)
                 usable = (len(data) // 3) * 3
@@ -859,10 +874,11 @@ def load_audio_peak_meter_frames(path: str, *, target_sr: int = 22050):
                     return None
                 triples = data[:usable].reshape(-1, 3).astype(np.int32)
                 values = triples[:, 0] | (triples[:, 1] << 8) | (triples[:, 2] << 16)
-                values = np.where(values & 0x800000, values - 0x1000000, values).astype(np.float32)
-                values = values / 8388608.0
+                values = ((values ^ 0x800000) - 0x800000).astype(np.float32)
+                values *= _PCM24_SCALE
             elif sample_width == 4:
-                values = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+                values = np.frombuffer(raw, dtype="<i4").astype(np.float32)
+                values *= _PCM32_SCALE
             else:
                 return None
             stereo = _stereo(values, channels)
@@ -901,7 +917,8 @@ def load_audio_peak_meter_frames(path: str, *, target_sr: int = 22050):
             )
             if not output:
                 return None
-            values = np.frombuffer(output, dtype="<i2").astype(np.float32) / 32768.0
+            values = np.frombuffer(output, dtype="<i2").astype(np.float32)
+            values *= _PCM16_SCALE
             stereo = _stereo(values, 2)
             if stereo is None:
                 return None
@@ -934,24 +951,16 @@ def load_audio_peak_meter_frames(path: str, *, target_sr: int = 22050):
     sample_rate = max(1, int(sample_rate or target_sr))
     frame_ms = 33
     hop = max(1, int(sample_rate * (frame_ms / 1000.0)))
-    frames = []
-    for start in range(0, len(samples), hop):
-        segment = samples[start : start + hop]
-        if len(segment) <= 0:
-            continue
-        peaks = np.max(np.abs(segment), axis=0)
-        frame = []
-        for peak in peaks[:2]:
-            peak = float(peak)
-            if peak <= 0.000001:
-                db_value = db_floor
-            else:
-                db_value = 20.0 * math.log10(peak)
-            frame.append(max(db_floor, min(db_top, db_value)))
-        if len(frame) == 1:
-            frame.append(frame[0])
-        frames.append((float(frame[0]), float(frame[1])))
-    return frames
+    # One reduceat sweep yields every hop's per-channel peak; the last hop may be short.
+    peaks = np.maximum.reduceat(np.abs(samples), np.arange(0, len(samples), hop), axis=0)
+    peaks = peaks[:, :2].astype(np.float64)
+    audible = peaks > 0.000001
+    db_values = np.full(peaks.shape, db_floor)
+    db_values[audible] = 20.0 * np.log10(peaks[audible])
+    db_values = np.clip(db_values, db_floor, db_top)
+    if db_values.shape[1] == 1:
+        db_values = np.repeat(db_values, 2, axis=1)
+    return [(left, right) for left, right in db_values.tolist()]
 
 
 def load_audio_spectrum_frames(path: str, *, target_sr: int = 22050, bin_count: int = 192):
@@ -1023,9 +1032,12 @@ def load_audio_spectrum_frames(path: str, *, target_sr: int = 22050, bin_count:
             if not raw:
                 return None
             if sample_width == 1:
-                values = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+                values = np.frombuffer(raw, dtype=np.uint8).astype(np.float32)
+                values -= 128.0
+                values *= _PCM8_SCALE
             elif sample_width == 2:
-                values = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+                values = np.frombuffer(raw, dtype="<i2").astype(np.float32)
+                values *= _PCM16_SCALE
             elif sample_width == 3:
                 data = np.frombuffer(raw, dtype=np.uint8)
                 usable = (len(data) // 3) * 3
@@ -1033,10 +1045,11 @@ def load_audio_spectrum_frames(path: str, *, target_sr: int = 22050, bin_count:
                     return None
                 triples = data[:usable].reshape(-1, 3).astype(np.int32)
                 values = triples[:, 0] | (triples[:, 1] << 8) | (triples[:, 2] << 16)
-                values = np.where(values & 0x800000, values - 0x1000000, values).astype(np.float32)
-                values = values / 8388608.0
+                values = ((values ^ 0x800000) - 0x800000).astype(np.float32)
+                values *= _PCM24_SCALE
             elif sample_width == 4:
-                values = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+                values = np.frombuffer(raw, dtype="<i4").astype(np.float32)
+                values *= _PCM32_SCALE
             else:
                 return None
             if channels > 1:
@@ -1077,7 +1090,8 @@ def load_audio_spectrum_frames(path: str, *, target_sr: int = 22050, bin_count:
             )
             if not output:
                 return None
-            values = np.frombuffer(output, dtype="<i2").astype(np.float32) / 32768.0
+            values = np.frombuffer(output, dtype="<i2").astype(np.float32)
+            values *= _PCM16_SCALE
             return np.clip(values, -1.0, 1.0), int(target_sr)
         except Exception:
             return None
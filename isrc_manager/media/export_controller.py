@@ -14,6 +14,7 @@ from PySide6.QtWidgets import QDialog, QFileDialog, QMessageBox
 from isrc_manager.catalog_table import ColumnKeyRole
 from isrc_manager.file_storage import (
     STORAGE_MODE_DATABASE,
+    bytes_from_blob,
     normalize_storage_mode,
     resolve_directory_export_target,
     resolve_file_export_target,
@@ -28,6 +29,30 @@ if TYPE_CHECKING:
     from isrc_manager.releases import ReleaseService
     from isrc_manager.services.tracks import TrackService
 
+# Export extensions for the media types the catalog stores. A fixed table gives the same
+# names on every platform and skips the mimetypes registry for the common cases.
+_MIME_EXPORT_EXTENSIONS = {
+    "audio/aac": ".aac",
+    "audio/aiff": ".aif",
+    "audio/flac": ".flac",
+    "audio/mp4": ".m4a",
+    "audio/mpeg": ".mp3",
+    "audio/ogg": ".ogg",
+    "audio/opus": ".opus",
+    "audio/wav": ".wav",
+    "audio/wave": ".wav",
+    "audio/x-aac": ".aac",
+    "audio/x-aiff": ".aif",
+    "audio/x-flac": ".flac",
+    "audio/x-wav": ".wav",
+    "image/bmp": ".bmp",
+    "image/gif": ".gif",
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/tiff": ".tiff",
+    "image/webp": ".webp",
+}
+
 
 def _root_attr(name: str, fallback):
     main_window_module = sys.modules.get("isrc_manager.main_window")
@@ -443,10 +468,7 @@ def _export_bytes_with_picker(
     payload: dict | None = None,
     dialog_title: str = "Export file",
 ) -> None:
-    if isinstance(data, memoryview):
-        data = data.tobytes()
-    elif isinstance(data, bytearray):
-        data = bytes(data)
+    # write_bytes takes any bytes-like object, so memoryview payloads are written as-is.
     default_filename = self._default_export_filename(suggested_basename, mime or "")
     dest_path, _ = _file_dialog().getSaveFileName(
         parent_widget or self, dialog_title, default_filename, "All files (*)"
@@ -495,7 +517,7 @@ def _export_bytes_with_picker(
 
 def _coerce_export_bytes(data) -> bytes:
     if isinstance(data, memoryview):
-        return data.tobytes()
+        return bytes_from_blob(data)
     if isinstance(data, bytearray):
         return bytes(data)
     return bytes(data)
@@ -513,8 +535,10 @@ def _submit_background_audio_file_export(
     entity_type: str | None,
     entity_id: str | None,
     payload: dict | None,
-    load_source,
+    load_source=None,
+    write_source=None,
     metadata_track_id: int | None = None,
+    media_label: str = "audio",
     parent_widget=None,
 ) -> None:
     def _worker(bundle, ctx):
@@ -522,19 +546,25 @@ def _submit_background_audio_file_export(
         ctx.report_progress(
             value=0,
             maximum=total_steps,
-            message=f"Loading source audio: {resolved_dest_path.name}",
+            message=f"Loading source {media_label}: {resolved_dest_path.name}",
         )
-        data, _mime_type = load_source(bundle)
-        export_bytes = self._coerce_export_bytes(data)
+        # write_source streams straight to the target; load_source returns the payload bytes.
+        export_bytes = None
+        if write_source is None:
+            data, _mime_type = load_source(bundle)
+            export_bytes = self._coerce_export_bytes(data)
 
         def _mutation():
             ctx.report_progress(
                 value=1,
                 maximum=total_steps,
-                message=f"Writing exported audio: {resolved_dest_path.name}",
+                message=f"Writing exported {media_label}: {resolved_dest_path.name}",
             )
             resolved_dest_path.parent.mkdir(parents=True, exist_ok=True)
-            resolved_dest_path.write_bytes(export_bytes)
+            if write_source is not None:
+                write_source(bundle, resolved_dest_path)
+            else:
+                resolved_dest_path.write_bytes(export_bytes)
             if metadata_track_id is not None:
                 ctx.report_progress(
                     value=2,
@@ -553,7 +583,7 @@ def _submit_background_audio_file_export(
             ctx.report_progress(
                 value=2,
                 maximum=total_steps,
-                message=f"Finalizing exported audio: {resolved_dest_path.name}",
+                message=f"Finalizing exported {media_label}: {resolved_dest_path.name}",
             )
             return None
 
@@ -574,7 +604,7 @@ def _submit_background_audio_file_export(
             ctx.report_progress(
                 value=3,
                 maximum=total_steps,
-                message=f"Finalizing exported audio: {resolved_dest_path.name}",
+                message=f"Finalizing exported {media_label}: {resolved_dest_path.name}",
             )
         return {
             "path": str(resolved_dest_path),
@@ -602,7 +632,7 @@ def _submit_background_audio_file_export(
         on_error=lambda failure: self._show_background_task_error(
             dialog_title,
             failure,
-            user_message="Could not export the selected audio:",
+            user_message=f"Could not export the selected {media_label}:",
         ),
     )
 
@@ -876,6 +906,9 @@ def _export_standard_media_for_track(
 
 
 def _export_extension_for_mime(mime: str) -> str:
+    known_ext = _MIME_EXPORT_EXTENSIONS.get(str(mime or "").strip().lower())
+    if known_ext is not None:
+        return known_ext
     ext = mimetypes.guess_extension(mime or "")
     if ext == ".jpe":
         ext = ".jpg"
@@ -1109,10 +1142,6 @@ def _export_focused_media_column(
                     "column_label": spec["column_label"],
                 }
                 entity_id = f"{track_id}:{field_id}"
-            if isinstance(data, memoryview):
-                data = data.tobytes()
-            elif isinstance(data, bytearray):
-                data = bytes(data)
             dest_path = self._deduplicate_export_destination(
                 output_root,
                 self._default_export_filename(suggested_basename, mime or ""),
@@ -10,6 +10,7 @@ from PySide6.QtCore import QPoint, QRect, QSize, Qt
 from PySide6.QtGui import QColor, QFontMetrics, QIcon, QImage, QPainter, QPalette, QPixmap
 from PySide6.QtWidgets import QDialog, QMessageBox
 
+from isrc_manager.file_storage import bytes_from_blob
 from isrc_manager.media.preview_dialogs import (
     _AudioPreviewDialog,
     _AudioPreviewPreparedMedia,
@@ -19,6 +20,16 @@ from isrc_manager.paths import RES_DIR
 
 MEDIA_PLAYER_ACTION_ICON_SCALE = 0.45
 
+# Leading four bytes (big-endian) -> MIME type, or a marker that needs a second check.
+_MAGIC4_MIME: dict[int, str] = {
+    int.from_bytes(b"\x89PNG", "big"): "image/png",
+    int.from_bytes(b"GIF8", "big"): "image/gif",
+    int.from_bytes(b"RIFF", "big"): "riff",
+    int.from_bytes(b"fLaC", "big"): "audio/flac",
+    int.from_bytes(b"OggS", "big"): "audio/ogg",
+}
+_RIFF_FORM_MIME = {b"WEBP": "image/webp", b"WAVE": "audio/wav"}
+
 
 def _root_attr(name: str, fallback):
     main_window_module = sys.modules.get("isrc_manager.main_window")
@@ -109,57 +120,57 @@ def _preview_blob_bytes(self, data, title: str) -> None:
             provided_mime = data[1]
         data = data_bytes
     if isinstance(data, memoryview):
-        data = data.tobytes()
+        data = bytes_from_blob(data)
 
     # Prefer provided MIME if present and plausible
     mime = provided_mime.lower().strip() if provided_mime else ""
     if not (mime.startswith("audio/") or mime.startswith("image/")):
         mime = (self._detect_mime(data) or "").lower()
 
-    # Try image decode first regardless of mime: cheap and robust
+    # Audio never needs the image probe, which would run every Qt decoder over the whole blob.
+    if mime.startswith("audio/"):
+        self._open_audio_preview(data, mime, title)
+        return
+
+    # Otherwise try an image decode first: robust against missing or wrong MIME types
     try:
         img = QImage.fromData(data)
         if not img.isNull():
-            self._open_image_preview(data, title)
+            # Hand the decoded image on so the preview dialog does not decode it again.
+            self._open_image_preview(data, title, image=img)
             return
     except Exception:
         pass
 
-    # Audio path if mime says audio, otherwise try common audio fallback
-    audio_mime = mime if mime.startswith("audio/") else ""
-    if not audio_mime:
-        # Heuristic: raw looks not like image and not empty -> try wav
-        audio_mime = "audio/wav"
-
-    self._open_audio_preview(data, audio_mime, title)
+    # Heuristic: raw looks not like image and not empty -> try wav
+    self._open_audio_preview(data, "audio/wav", title)
 
 
 def _detect_mime(self, b: bytes) -> str:
-    # --- images ---
-    if len(b) >= 8 and b[:8] == b"\x89PNG\r\n\x1a\n":
-        return "image/png"
-    if len(b) >= 2 and b[:2] == b"\xff\xd8":
-        return "image/jpeg"
-    if len(b) >= 6 and b[:6] in (b"GIF89a", b"GIF87a"):
-        return "image/gif"
-    if len(b) >= 12 and b[:4] == b"RIFF" and b[8:12] == b"WEBP":
-        return "image/webp"
-
-    # --- audio ---
-    if len(b) >= 12 and b[:4] == b"RIFF" and b[8:12] == b"WAVE":
-        return "audio/wav"
-    if len(b) >= 4 and b[:4] == b"fLaC":
-        return "audio/flac"
-    if len(b) >= 4 and b[:4] == b"OggS":
-        if b"OpusHead" in b[:64]:
-            return "audio/opus"
-        return "audio/ogg"
-    # MP3: ID3 header or MPEG frame sync (common cases)
+    if len(b) >= 4:
+        # One dict lookup on the big-endian first four bytes replaces a chain of slice compares;
+        # only PNG, GIF, RIFF and Ogg need a short second look.
+        magic = _MAGIC4_MIME.get(int.from_bytes(b[:4], "big"))
+        if magic is not None:
+            if magic == "image/png":
+                return magic if b[4:8] == b"\r\n\x1a\n" else ""
+            if magic == "image/gif":
+                return magic if b[4:6] in (b"9a", b"7a") else ""
+            if magic == "riff":
+                return _RIFF_FORM_MIME.get(bytes(b[8:12]), "") if len(b) >= 12 else ""
+            if magic == "audio/ogg" and b"OpusHead" in b[:64]:
+                return "audio/opus"
+            return magic
+    if len(b) >= 2 and b[0] == 0xFF:
+        if b[1] == 0xD8:
+            return "image/jpeg"
+        # MP3 MPEG frame sync
+        if (b[1] & 0xE0) == 0xE0:
+            return "audio/mpeg"
+        return ""
+    # MP3 with an ID3 header
     if len(b) >= 3 and b[:3] == b"ID3":
         return "audio/mpeg"
-    if len(b) >= 2 and (b[0] == 0xFF and (b[1] & 0xE0) == 0xE0):
-        return "audio/mpeg"
-
     return ""
 
 
@@ -225,17 +236,23 @@ def _audio_preview_navigation_track_ids(
     if not source_spec:
         return self._normalize_track_ids(visible_ids)
     kind = str(source_spec.get("kind") or "").strip().lower()
+    if kind == "custom":
+        # One batched lookup instead of a blob query per visible row.
+        try:
+            field_id = int(source_spec.get("field_id") or 0)
+            if field_id <= 0:
+                return []
+            track_ids = self._normalize_track_ids(visible_ids)
+            with_blob = self.cf_track_ids_with_blob(track_ids, field_id)
+        except Exception:
+            return []
+        return [track_id for track_id in track_ids if track_id in with_blob]
     ordered: list[int] = []
     for track_id in visible_ids:
         try:
-            if kind == "custom":
-                field_id = int(source_spec.get("field_id") or 0)
-                if field_id <= 0 or not self.cf_has_blob(int(track_id), field_id):
-                    continue
-            else:
-                media_key = str(source_spec.get("media_key") or "audio_file").strip()
-                if not self.track_has_media(int(track_id), media_key):
-                    continue
+            media_key = str(source_spec.get("media_key") or "audio_file").strip()
+            if not self.track_has_media(int(track_id), media_key):
+                continue
             ordered.append(int(track_id))
         except Exception:
             continue
@@ -558,13 +575,13 @@ def _audio_preview_state_for_raw_bytes(
     }
 
 
-def _open_image_preview(self, data: bytes, title: str) -> None:
+def _open_image_preview(self, data: bytes, title: str, *, image: QImage | None = None) -> None:
     if self.image_preview_dialog is None:
         self.image_preview_dialog = _root_attr("_ImagePreviewDialog", _ImagePreviewDialog)(
             self, parent=None
         )
     try:
-        self.image_preview_dialog.set_preview(data, title)
+        self.image_preview_dialog.set_preview(data, title, image=image)
     except ValueError:
         _message_box().warning(self, "Preview", "Could not decode image data.")
         return
@@ -82,6 +82,7 @@ from isrc_manager.media.equalizer import (
 )
 from isrc_manager.media.equalizer_player import LiveEqualizerPlayer, _decode_audio_file
 from isrc_manager.media.waveform import WaveformWidget, load_wav_peaks
+from isrc_manager.media.waveform_cache import AudioWaveformCacheService
 from isrc_manager.paths import RES_DIR
 from isrc_manager.services import TrackService, TrackSnapshot
 from isrc_manager.services.db_access import SQLiteConnectionFactory
@@ -94,6 +95,9 @@ from isrc_manager.ui_common import (
     _create_standard_section,
 )
 
+IMAGE_PREVIEW_SMOOTH_ZOOM_DELAY_MS = 120
+IMAGE_PREVIEW_SMOOTH_CACHE_SIZE = 4
+
 
 class _ImagePreviewDialog(QDialog):
     def __init__(self, app, parent=None):
@@ -105,6 +109,11 @@ class _ImagePreviewDialog(QDialog):
         self._current_data = b""
         self._current_mime = "image/png"
         self._user_zoomed = False
+        self._smoothed_pixmaps: dict[tuple[int, int], QPixmap] = {}
+        self._smooth_zoom_timer = QTimer(self)
+        self._smooth_zoom_timer.setSingleShot(True)
+        self._smooth_zoom_timer.setInterval(IMAGE_PREVIEW_SMOOTH_ZOOM_DELAY_MS)
+        self._smooth_zoom_timer.timeout.connect(self._apply_smooth_zoom)
 
         self.setObjectName("imagePreviewDialog")
         self.setWindowFlags(
@@ -182,15 +191,19 @@ class _ImagePreviewDialog(QDialog):
 
         self._zoom_slider.valueChanged.connect(self._apply_zoom)
         self._zoom_slider.sliderPressed.connect(self._mark_user_zoomed)
+        self._zoom_slider.sliderReleased.connect(self._apply_smooth_zoom)
 
-    def set_preview(self, data: bytes, title: str) -> None:
-        image = QImage.fromData(data)
+    def set_preview(self, data: bytes, title: str, *, image: QImage | None = None) -> None:
+        if image is None:
+            image = QImage.fromData(data)
         if image.isNull():
             raise ValueError("Could not decode image data.")
         self._current_data = bytes(data)
         self._current_mime = self.app._detect_mime(self._current_data) or "image/png"
         self._current_title = str(title or "Image Preview").strip() or "Image Preview"
         self._base_pix = QPixmap.fromImage(image)
+        self._smoothed_pixmaps.clear()
+        self._smooth_zoom_timer.stop()
         self.setWindowTitle(f"Image Preview — {self._current_title}")
         self._user_zoomed = False
         self._reset_view_to_fit()
@@ -297,12 +310,44 @@ class _ImagePreviewDialog(QDialog):
         if self._base_pix.isNull():
             self._image_label.clear()
             return
-        width = max(1, int(self._base_pix.width() * (self._current_pct / 100.0)))
-        height = max(1, int(self._base_pix.height() * (self._current_pct / 100.0)))
-        self._image_label.setPixmap(
-            self._base_pix.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        size = self._zoomed_size()
+        smoothed = self._smoothed_pixmaps.get(size)
+        if smoothed is not None:
+            self._smooth_zoom_timer.stop()
+            self._image_label.setPixmap(smoothed)
+            return
+        if self._zoom_slider.isSliderDown() or self._smooth_zoom_timer.isActive():
+            # Zoom is still moving (slider drag, wheel or pinch burst): show a cheap scale now
+            # and replace it with the smooth one once the input settles.
+            self._image_label.setPixmap(
+                self._base_pix.scaled(*size, Qt.KeepAspectRatio, Qt.FastTransformation)
+            )
+            self._smooth_zoom_timer.start()
+            return
+        self._apply_smooth_zoom()
+        # Keep a short window open so the next step of a burst takes the fast path.
+        self._smooth_zoom_timer.start()
+
+    def _zoomed_size(self) -> tuple[int, int]:
+        scale = self._current_pct / 100.0
+        return (
+            max(1, int(self._base_pix.width() * scale)),
+            max(1, int(self._base_pix.height() * scale)),
         )
 
+    def _apply_smooth_zoom(self) -> None:
+        self._smooth_zoom_timer.stop()
+        if self._base_pix.isNull():
+            return
+        size = self._zoomed_size()
+        smoothed = self._smoothed_pixmaps.get(size)
+        if smoothed is None:
+            smoothed = self._base_pix.scaled(*size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            if len(self._smoothed_pixmaps) >= IMAGE_PREVIEW_SMOOTH_CACHE_SIZE:
+                self._smoothed_pixmaps.pop(next(iter(self._smoothed_pixmaps)))
+            self._smoothed_pixmaps[size] = smoothed
+        self._image_label.setPixmap(smoothed)
+
     def _export_current_image(self) -> None:
         if not self._current_data:
             return
@@ -441,6 +486,7 @@ class _AudioPreviewPreloadBridge(QWidget):
     ready = Signal(object)
     track_ready = Signal(object)
     failed = Signal(object)
+    waveform_peaks = Signal(object)
 
 
 class _AudioPreviewPreloadCancelled(Exception):
@@ -637,6 +683,37 @@ def _audio_preview_fetch_source_for_preload(
             pass
 
 
+def _audio_preview_cached_waveform_peaks(
+    task: _AudioPreviewPreloadTask,
+) -> list[tuple[float, float]] | None:
+    """Return stored primary-audio peaks when the persistent cache still matches the source."""
+    kind = str(task.source_spec.get("kind") or "").strip().lower()
+    media_key = str(task.source_spec.get("media_key") or "audio_file").strip()
+    if kind != "standard" or media_key != "audio_file":
+        return None
+    if not task.db_path or not Path(task.db_path).exists():
+        return None
+    try:
+        conn = SQLiteConnectionFactory().open(task.db_path)
+    except Exception:
+        return None
+    try:
+        cached = AudioWaveformCacheService(conn).get_cached_waveform(
+            int(task.track_id),
+            track_service=TrackService(conn, task.data_root),
+            validate_source=True,
+        )
+    except Exception:
+        return None
+    finally:
+        try:
+            conn.close()
+        except Exception:
+            pass
+    peaks = list(cached.peaks or []) if cached is not None else []
+    return peaks or None
+
+
 def _audio_preview_write_preload_temp_file(data: bytes, suffix: str) -> str:
     with tempfile.NamedTemporaryFile(delete=False, suffix=suffix or ".bin") as handle:
         handle.write(bytes(data or b""))
@@ -803,8 +880,10 @@ def _build_audio_preview_preload(task: _AudioPreviewPreloadTask) -> _AudioPrevie
         if task.cancel_event.is_set():
             raise _AudioPreviewPreloadCancelled()
 
-        waveform_width = max(480, int(task.waveform_width or 480))
-        waveform_peaks = load_wav_peaks(source_path, waveform_width)
+        waveform_peaks = _audio_preview_cached_waveform_peaks(task)
+        if waveform_peaks is None:
+            waveform_width = max(480, int(task.waveform_width or 480))
+            waveform_peaks = load_wav_peaks(source_path, waveform_width)
         if task.cancel_event.is_set():
             raise _AudioPreviewPreloadCancelled()
         spectrum_frames = load_audio_spectrum_frames(source_path)
@@ -1072,6 +1151,10 @@ class _AudioPreviewDialog(QDialog):
         self._audio_preload_cache: dict[tuple[int, str], _AudioPreviewPreparedMedia] = {}
         self._audio_preload_jobs: dict[tuple[int, str], tuple[Future, threading.Event, int]] = {}
         self._audio_preload_executor = None
+        self._audio_torn_down = False
+        self._waveform_stream_generation = 0
+        self._waveform_stream_job: tuple[Future, threading.Event] | None = None
+        self._streamed_waveform_peaks: list[tuple[float, float]] = []
         self._audio_load_request_id = 0
         self._audio_load_jobs: dict[int, tuple[Future, threading.Event]] = {}
         self._audio_load_waiting_for_preload: dict[str, object] | None = None
@@ -1082,6 +1165,7 @@ class _AudioPreviewDialog(QDialog):
         self._audio_preload_bridge = _AudioPreviewPreloadBridge(self)
         self._audio_preload_bridge.ready.connect(self._on_audio_preload_result)
         self._audio_preload_bridge.track_ready.connect(self._on_audio_track_load_result)
+        self._audio_preload_bridge.waveform_peaks.connect(self._on_waveform_stream_update)
 
         self.setObjectName("audioPreviewDialog")
         self.setWindowFlags(
@@ -2907,13 +2991,10 @@ class _AudioPreviewDialog(QDialog):
         prepared_media: _AudioPreviewPreparedMedia | None,
         autoplay: bool,
     ) -> None:
-        executor = getattr(self, "_audio_load_executor", None)
-        if executor is None or bool(getattr(executor, "_shutdown", False)):
-            executor = ThreadPoolExecutor(
-                max_workers=1,
-                thread_name_prefix="audio-preview-load",
-            )
-            self._audio_load_executor = executor
+        # The waveform decode shares the single load worker, so a running one would hold
+        # this load back; the loaded track requests its own waveform afterwards anyway.
+        self._cancel_waveform_stream()
+        executor = self._ensure_audio_load_executor()
         cancel_event = threading.Event()
         source_key = self._audio_preload_source_key(source_spec)
         task = _AudioPreviewTrackLoadTask(
@@ -3468,6 +3549,8 @@ class _AudioPreviewDialog(QDialog):
         prepared_media: _AudioPreviewPreparedMedia | None = None,
     ) -> None:
         cached = None
+        # Any newer waveform request supersedes a decode that is still streaming.
+        self._cancel_waveform_stream()
         prepared_peaks = list(prepared_media.waveform_peaks or []) if prepared_media else []
         source_spec = self._source_spec if isinstance(self._source_spec, dict) else {}
         if prepared_media is not None:
@@ -3490,14 +3573,81 @@ class _AudioPreviewDialog(QDialog):
                 cache_key=getattr(cached, "source_fingerprint", None),
             )
         elif prepared_media is None:
-            peaks = load_wav_peaks(path, max(self.wave.width(), 480))
-            self.wave.set_peaks(peaks)
-        has_peaks = bool(peaks)
+            self._start_waveform_stream(path, max(self.wave.width(), 480))
+            return
+        self._show_waveform_peaks_state(bool(peaks))
+
+    def _show_waveform_peaks_state(self, has_peaks: bool) -> None:
         self.wave.setVisible(has_peaks)
         if not has_peaks:
             self.wave_status_label.setText("Waveform unavailable")
         self.wave_status_label.setVisible(not has_peaks)
 
+    def _ensure_audio_load_executor(self) -> ThreadPoolExecutor:
+        executor = getattr(self, "_audio_load_executor", None)
+        if executor is None or bool(getattr(executor, "_shutdown", False)):
+            executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="audio-preview-load",
+            )
+            self._audio_load_executor = executor
+        return executor
+
+    def _cancel_waveform_stream(self) -> None:
+        # The generation bump drops batches still in flight; the event stops the decode
+        # itself, including its ffmpeg processes.
+        self._waveform_stream_generation = getattr(self, "_waveform_stream_generation", 0) + 1
+        job = getattr(self, "_waveform_stream_job", None)
+        self._waveform_stream_job = None
+        if job is not None:
+            future, cancel_event = job
+            cancel_event.set()
+            future.cancel()
+
+    def _start_waveform_stream(self, path: str, width_px: int) -> None:
+        generation = self._waveform_stream_generation
+        bridge = self._audio_preload_bridge
+        cancel_event = threading.Event()
+        # The current peaks stay on screen until the first batch replaces them.
+        self._streamed_waveform_peaks = []
+        self.wave.setVisible(True)
+        self.wave_status_label.setVisible(False)
+
+        def _publish(peaks, expected_count, done: bool) -> None:
+            if cancel_event.is_set():
+                return
+            try:
+                bridge.waveform_peaks.emit((generation, list(peaks), expected_count, done))
+            except RuntimeError:
+                pass  # The dialog was destroyed while the decode was running.
+
+        def _decode() -> None:
+            try:
+                peaks = load_wav_peaks(
+                    path,
+                    width_px,
+                    on_peaks=lambda batch, expected_count: _publish(batch, expected_count, False),
+                    cancel_event=cancel_event,
+                )
+            except Exception:
+                peaks = []
+            _publish(peaks, None, True)
+
+        future = self._ensure_audio_load_executor().submit(_decode)
+        self._waveform_stream_job = (future, cancel_event)
+
+    def _on_waveform_stream_update(self, payload) -> None:
+        generation, peaks, expected_count, done = payload
+        if generation != self._waveform_stream_generation:
+            return
+        if done:
+            self._streamed_waveform_peaks = list(peaks)
+            self.wave.set_peaks(self._streamed_waveform_peaks)
+            self._show_waveform_peaks_state(bool(peaks))
+            return
+        self._streamed_waveform_peaks.extend(peaks)
+        self.wave.set_peaks(list(self._streamed_waveform_peaks), expected_count=expected_count)
+
     def _reload_peaks_for_current_width(self) -> None:
         if not self._tmp_path:
             return
@@ -3882,7 +4032,13 @@ class _AudioPreviewDialog(QDialog):
         self._source_tmp_path = None
         self._tmp_path_owned = False
 
-    def closeEvent(self, event):
+    def _teardown_audio(self) -> None:
+        # close() reaches QDialog.closeEvent, which rejects the still-visible
+        # dialog, so the same shutdown would otherwise run twice per close.
+        if getattr(self, "_audio_torn_down", False):
+            return
+        self._audio_torn_down = True
+        self._cancel_waveform_stream()
         self._visualization_timer.stop()
         self._cancel_audio_load_jobs(reason="dialog-close")
         self._cancel_audio_preload_jobs(reason="dialog-close")
@@ -3901,8 +4057,15 @@ class _AudioPreviewDialog(QDialog):
                 pass
             setattr(self, executor_name, None)
         self._audio_preload_executor = None
+
+    def closeEvent(self, event):
+        self._teardown_audio()
         super().closeEvent(event)
 
+    def done(self, result):
+        self._teardown_audio()
+        super().done(result)
+
     def changeEvent(self, event):
         super().changeEvent(event)
         if event.type() in (QEvent.FontChange, QEvent.ApplicationFontChange):
@@ -3925,6 +4088,7 @@ class _AudioPreviewDialog(QDialog):
 
     def showEvent(self, event):
         super().showEvent(event)
+        self._audio_torn_down = False
         self._apply_stop_button_font()
         self._refresh_media_button_icons()
         QTimer.singleShot(0, lambda: self._apply_stop_button_font())
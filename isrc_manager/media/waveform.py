@@ -1,4 +1,9 @@
 import math
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from PySide6.QtCore import (
     QEvent,
@@ -16,6 +21,30 @@ from PySide6.QtGui import QColor, QImage, QPen, QPixmap
 from PySide6.QtMultimedia import QAudioDecoder, QAudioFormat
 from PySide6.QtWidgets import QWidget
 
+from isrc_manager.media.waveform_cache import (
+    _PCM_PIPE_BUFFER_BYTES,
+    _PCM_PIPE_READ_BYTES,
+    _bytes_edge_fingerprint,
+    _container_duration_seconds,
+    _fallback_waveform_column_rgb,
+    _PcmPeakAccumulator,
+    _read_edge_bytes,
+    _shade_waveform_pixels,
+    _wave_reader_peaks,
+    _which,
+)
+
+_WAV_PEAKS_MEMO_MAX_ENTRIES = 32
+_wav_peaks_memo: OrderedDict[tuple[str, int], list[tuple[float, float]]] = OrderedDict()
+_wav_peaks_memo_lock = threading.Lock()
+
+# Long sources are decoded as parallel ffmpeg segments; short ones are not worth the
+# extra process startups.
+_FFMPEG_SEGMENT_MIN_SECONDS = 30.0
+_FFMPEG_MAX_SEGMENTS = 4
+# Streamed decodes report completed buckets in batches of this size.
+_PEAK_STREAM_BATCH_BUCKETS = 256
+
 
 class WaveformWidget(QWidget):
     scrubRequested = Signal(int)
@@ -43,6 +72,7 @@ class WaveformWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._peaks = []
+        self._peak_slot_count = 0
         self._peaks_version = 0
         self._waveform_cache = QPixmap()
         self._waveform_cache_key = None
@@ -52,6 +82,8 @@ class WaveformWidget(QWidget):
         self._bookmarks_ms: list[int] = []
         self._duration = 1
         self._playhead = 0
+        self._overlay_pen_cache: dict[str, QPen] = {}
+        self._overlay_pen_cache_key: int | None = None
         self._preferred_height = 120
         self.setMinimumHeight(120)
         self.setCursor(Qt.SizeHorCursor)
@@ -69,8 +101,11 @@ class WaveformWidget(QWidget):
     def minimumSizeHint(self) -> QSize:
         return QSize(120, max(1, self.minimumHeight()))
 
-    def set_peaks(self, peaks):
+    def set_peaks(self, peaks, *, expected_count: int | None = None):
         self._peaks = peaks or []
+        # While a decode is still streaming, reserve room for the buckets still to come so
+        # the partial waveform fills in from the left instead of stretching to full width.
+        self._peak_slot_count = max(len(self._peaks), int(expected_count or 0))
         self._peaks_version += 1
         self._stored_waveform_pixmaps = {}
         self._stored_waveform_cache_key = None
@@ -86,6 +121,7 @@ class WaveformWidget(QWidget):
         cache_key: object | None = None,
     ) -> None:
         self._peaks = peaks or []
+        self._peak_slot_count = len(self._peaks)
         self._peaks_version += 1
         self._stored_waveform_pixmaps = {}
         for theme_key, payload in (
@@ -328,38 +364,15 @@ class WaveformWidget(QWidget):
             int(round((blue * (1.0 - amount)) + (luma * amount))),
         )
 
-    def _shade_static_waveform_color(
-        self,
-        rgb: tuple[int, int, int],
-        *,
-        peak: float,
-        edge_ratio: float,
-    ) -> QColor:
-        background = self._window_background_color()
-        light_background = self._relative_luminance(background) >= 0.5
-        peak = max(0.0, min(1.0, float(peak)))
-        edge_ratio = max(0.0, min(1.0, float(edge_ratio)))
-        if light_background:
-            base_scale = 0.42 + (0.22 * peak)
-            edge_lift = 0.26 * (edge_ratio**0.7)
-        else:
-            base_scale = 0.58 + (0.18 * peak)
-            edge_lift = 0.30 * (edge_ratio**0.7)
-        scale = min(1.18, base_scale + edge_lift)
-        highlight = 0.10 * (edge_ratio**1.8) if not light_background else 0.04 * edge_ratio
-        red = int(max(0, min(255, (rgb[0] * scale) + (255 * highlight))))
-        green = int(max(0, min(255, (rgb[1] * scale) + (255 * highlight))))
-        blue = int(max(0, min(255, (rgb[2] * scale) + (255 * highlight))))
-        return QColor(red, green, blue, 255)
-
     def _render_static_waveform_cache(self, rect: QRectF) -> QPixmap:
         if not self._peaks or self.size().isEmpty():
             return QPixmap()
+        import numpy as np
+
         pixmap = self._empty_waveform_pixmap()
         dpr = max(1.0, float(pixmap.devicePixelRatioF()))
-        image = QImage(pixmap.size(), QImage.Format_ARGB32_Premultiplied)
-        image.setDevicePixelRatio(dpr)
-        image.fill(Qt.transparent)
+        image_width = pixmap.width()
+        image_height = pixmap.height()
         physical_rect = QRectF(
             float(rect.left()) * dpr,
             float(rect.top()) * dpr,
@@ -367,51 +380,64 @@ class WaveformWidget(QWidget):
             float(rect.height()) * dpr,
         )
         mid = float(physical_rect.center().y())
-        center_y = max(0, min(image.height() - 1, int(round(mid))))
+        center_y = max(0, min(image_height - 1, int(round(mid))))
         amplitude = max(1.0, float(physical_rect.height()) * 0.47)
         width = max(1, int(round(physical_rect.width())))
-        peak_count = max(1, len(self._peaks))
-        for x_offset in range(width):
-            peak_index = min(peak_count - 1, int((x_offset / max(1, width - 1)) * (peak_count - 1)))
-            low, high = self._peaks[peak_index]
-            top_peak = max(0.0, min(1.0, float(high)))
-            bottom_peak = max(0.0, min(1.0, -float(low)))
-            dominant_peak = max(top_peak, bottom_peak)
-            if dominant_peak <= 0.0:
-                continue
-            base_rgb = self._fallback_waveform_rgb_for_peak(dominant_peak)
-            x_pos = int(round(physical_rect.left())) + x_offset
-            if x_pos < 0 or x_pos >= image.width():
-                continue
-            if top_peak > 0.0:
-                start_y = max(0, int(round(mid - (top_peak * amplitude))))
-                end_y = center_y
-                for y_pos in range(start_y, end_y + 1):
-                    edge_ratio = abs(float(y_pos) - mid) / max(1.0, top_peak * amplitude)
-                    image.setPixelColor(
-                        x_pos,
-                        y_pos,
-                        self._shade_static_waveform_color(
-                            base_rgb,
-                            peak=top_peak,
-                            edge_ratio=edge_ratio,
-                        ),
-                    )
-            if bottom_peak > 0.0:
-                start_y = center_y
-                end_y = max(0, min(image.height() - 1, int(round(mid + (bottom_peak * amplitude)))))
-                for y_pos in range(start_y, end_y + 1):
-                    edge_ratio = abs(float(y_pos) - mid) / max(1.0, bottom_peak * amplitude)
-                    image.setPixelColor(
-                        x_pos,
-                        y_pos,
-                        self._shade_static_waveform_color(
-                            base_rgb,
-                            peak=bottom_peak,
-                            edge_ratio=edge_ratio,
-                        ),
-                    )
+        peaks = np.asarray(self._peaks, dtype=np.float64).reshape(-1, 2)
+        peak_count = max(1, len(peaks))
+        slot_count = max(peak_count, int(getattr(self, "_peak_slot_count", 0)))
+
+        # One column per physical pixel; every pixel in a column's bar is shaded in one pass
+        # instead of allocating a QColor per setPixelColor call.
+        x_offsets = np.arange(width)
+        slot_index = np.minimum(
+            slot_count - 1, ((x_offsets / max(1, width - 1)) * (slot_count - 1)).astype(np.int64)
+        )
+        peak_index = np.minimum(peak_count - 1, slot_index)
+        top_peak = np.clip(peaks[peak_index, 1], 0.0, 1.0)
+        bottom_peak = np.clip(-peaks[peak_index, 0], 0.0, 1.0)
+        dominant_peak = np.maximum(top_peak, bottom_peak)
+        x_pos = int(round(physical_rect.left())) + x_offsets
+        visible = (
+            (dominant_peak > 0.0) & (slot_index < len(peaks)) & (x_pos >= 0) & (x_pos < image_width)
+        )
+        top_start = np.maximum(0, np.round(mid - (top_peak * amplitude)).astype(np.int64))
+        bottom_end = np.clip(np.round(mid + (bottom_peak * amplitude)), 0, image_height - 1)
+        rows = np.arange(image_height)[:, None]
+        in_top = visible & (top_peak > 0.0) & (rows >= top_start) & (rows <= center_y)
+        in_bottom = visible & (bottom_peak > 0.0) & (rows >= center_y) & (rows <= bottom_end)
+        pixel_rows, pixel_columns = np.nonzero(in_top | in_bottom)
+
+        column_rgb = _fallback_waveform_column_rgb(
+            dominant_peak, self._fallback_waveform_rgb_for_peak
+        )
+        # The bottom bar is drawn last, so it owns the shared center row.
+        peak = np.where(
+            in_bottom[pixel_rows, pixel_columns],
+            bottom_peak[pixel_columns],
+            top_peak[pixel_columns],
+        )
+        edge_ratio = np.abs(pixel_rows - mid) / np.maximum(1.0, peak * amplitude)
+        channels = _shade_waveform_pixels(
+            column_rgb[pixel_columns],
+            peak,
+            edge_ratio,
+            light_background=self._relative_luminance(self._window_background_color()) >= 0.5,
+        ).astype(np.uint32)
+
+        argb = np.zeros((image_height, image_width), dtype=np.uint32)
+        argb[pixel_rows, x_pos[pixel_columns]] = (
+            np.uint32(0xFF000000) | (channels[:, 0] << 16) | (channels[:, 1] << 8) | channels[:, 2]
+        )
+        image = QImage(
+            argb.data,
+            image_width,
+            image_height,
+            image_width * 4,
+            QImage.Format_ARGB32_Premultiplied,
+        )
         pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
         return pixmap
 
     def _static_waveform_pixmap(self, rect: QRectF) -> QPixmap:
@@ -556,20 +582,31 @@ class WaveformWidget(QWidget):
             )
         painter.restore()
 
+    def _overlay_pens(self) -> dict[str, QPen]:
+        """Return playhead and bookmark pens for the current window background."""
+        background_rgba = self._window_background_color().rgba()
+        if self._overlay_pen_cache_key != background_rgba:
+            light_mode = self._relative_luminance(QColor.fromRgba(background_rgba)) >= 0.5
+            self._overlay_pen_cache = {
+                "playhead": QPen(QColor(255, 255, 255) if light_mode else QColor(0, 0, 0)),
+                "marker": QPen(QColor("#0A84FF" if light_mode else "#4DA3FF"), 2),
+                "marker_shadow": QPen(
+                    QColor(0, 0, 0, 70) if light_mode else QColor(255, 255, 255, 60), 3
+                ),
+            }
+            self._overlay_pen_cache_key = background_rgba
+        return self._overlay_pen_cache
+
     def paintEvent(self, e):
-        from PySide6.QtGui import QColor, QPainter, QPen
+        from PySide6.QtGui import QPainter
 
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing, False)
         r = self.rect()
         waveform_rect = self._waveform_rect(r)
 
-        # Decide colors based on window background brightness
-        bg = self._window_background_color()
-        lum = self._relative_luminance(bg)
-        light_mode = lum >= 0.5
-
-        playhead_color = QColor(255, 255, 255) if light_mode else QColor(0, 0, 0)
+        # Colors follow the window background brightness; pens are rebuilt only when it changes.
+        pens = self._overlay_pens()
 
         # waveform (vertical min–max bars)
         if self._peaks:
@@ -584,37 +621,79 @@ class WaveformWidget(QWidget):
             p.restore()
 
         if self._bookmarks_ms and self._duration > 0:
-            marker_color = QColor("#0A84FF" if light_mode else "#4DA3FF")
-            marker_shadow = QColor(0, 0, 0, 70) if light_mode else QColor(255, 255, 255, 60)
             for position_ms in self._bookmarks_ms:
                 ratio = max(0.0, min(1.0, position_ms / self._duration))
                 x = r.left() + (r.width() - 1) * ratio
                 x_pos = int(round(x))
-                p.setPen(QPen(marker_shadow, 3))
+                p.setPen(pens["marker_shadow"])
                 p.drawLine(x_pos, int(waveform_rect.top()), x_pos, int(waveform_rect.bottom()))
-                p.setPen(QPen(marker_color, 2))
+                p.setPen(pens["marker"])
                 p.drawLine(x_pos, int(waveform_rect.top()), x_pos, int(waveform_rect.bottom()))
 
         # playhead
         if self._duration > 0:
             x = r.left() + (r.width() - 1) * (self._playhead / self._duration)
-            p.setPen(QPen(playhead_color))
+            p.setPen(pens["playhead"])
             p.drawLine(int(x), int(waveform_rect.top()), int(x), int(waveform_rect.bottom()))
 
 
-def load_wav_peaks(path: str, width_px: int):
+def _wav_peaks_memo_key(path: str, width_px: int) -> tuple[str, int] | None:
+    # Keyed on content rather than path/mtime: database-stored audio is written to a
+    # fresh temp file for every preview, so only a content fingerprint can hit.
+    try:
+        source = Path(path)
+        size = int(source.stat().st_size)
+        first, last = _read_edge_bytes(source, size)
+    except OSError, TypeError, ValueError:
+        return None
+    return _bytes_edge_fingerprint(first + last, size), max(1, int(width_px))
+
+
+def _clear_wav_peaks_memo() -> None:
+    with _wav_peaks_memo_lock:
+        _wav_peaks_memo.clear()
+
+
+def load_wav_peaks(path: str, width_px: int, *, on_peaks=None, cancel_event=None):
     """
     Build stereo peaks for drawing a waveform.
     - Fast path: RIFF/WAVE (16, 24, 32-bit PCM) via `wave`.
     - Generic path: decode any compressed format to stereo s16le via ffmpeg (if present),
       else fallback to QtMultimedia's decoder, then `audioread` as a last resort.
+    Recent results are memoized per (content fingerprint, width) so reopening or resizing
+    a preview, including one materialized from a database blob, does not decode again.
+    `on_peaks(new_peaks, expected_count)` is called from the decoding thread as ffmpeg
+    completes buckets; the returned list stays authoritative.
+    Setting `cancel_event` (a threading.Event) kills a running ffmpeg decode; a cancelled
+    call returns [] and is not memoized.
     Returns: list[(-right_peak, left_peak)] in [-1.0, 1.0].
     """
-    import os
-    import shutil
+    key = _wav_peaks_memo_key(path, width_px)
+    if key is not None:
+        with _wav_peaks_memo_lock:
+            memoized = _wav_peaks_memo.get(key)
+            if memoized is not None:
+                _wav_peaks_memo.move_to_end(key)
+                return list(memoized)
+    peaks = _decode_wav_peaks(path, width_px, on_peaks=on_peaks, cancel_event=cancel_event)
+    if cancel_event is not None and cancel_event.is_set():
+        return []
+    if key is not None and peaks:
+        with _wav_peaks_memo_lock:
+            _wav_peaks_memo[key] = list(peaks)
+            _wav_peaks_memo.move_to_end(key)
+            while len(_wav_peaks_memo) > _WAV_PEAKS_MEMO_MAX_ENTRIES:
+                _wav_peaks_memo.popitem(last=False)
+    return peaks
+
+
+def _decode_wav_peaks(path: str, width_px: int, *, on_peaks=None, cancel_event=None):
     import struct
     import subprocess
 
+    def _cancelled() -> bool:
+        return cancel_event is not None and cancel_event.is_set()
+
     width_px = max(1, int(width_px))
     buckets = width_px * 4  # ~4 samples/bucket for smooth lines
 
@@ -765,41 +844,6 @@ def load_wav_peaks(path: str, width_px: int):
 
         return None
 
-    # --- helper: best-effort find a binary on common paths ---
-    def _which(name: str):
-        import os
-        import platform
-
-        p = shutil.which(name)
-        if p:
-            return p
-
-        sysname = platform.system().lower()
-        search_dirs = []
-        if sysname == "darwin":
-            search_dirs = ["/opt/homebrew/bin", "/usr/local/bin", "/usr/bin"]
-        elif sysname == "linux":
-            search_dirs = ["/usr/bin", "/usr/local/bin"]
-        elif sysname == "windows":
-            search_dirs = [
-                r"C:\Program Files\ffmpeg\bin",
-                r"C:\ffmpeg\bin",
-                r"C:\ProgramData\chocolatey\bin",
-                os.path.expandvars(r"%USERPROFILE%\scoop\shims"),
-            ]
-
-        # try plain name and .exe on Windows
-        candidates = [name]
-        if sysname == "windows" and not name.lower().endswith(".exe"):
-            candidates.append(name + ".exe")
-
-        for d in search_dirs:
-            for cand in candidates:
-                full = os.path.join(d, cand)
-                if os.path.exists(full):
-                    return full
-        return None
-
     # --- WAV fast path -------------------------------------------------------
     try:
         with open(path, "rb") as f:
@@ -808,85 +852,23 @@ def load_wav_peaks(path: str, width_px: int):
             import wave
 
             with wave.open(path, "rb") as w:
-                ch = max(1, w.getnchannels())
-                sampwidth = w.getsampwidth()  # bytes: 2, 3, 4
-                nframes = w.getnframes()
-                if nframes <= 0:
-                    return []
-
-                step = max(1, nframes // buckets)
-                fs = 32768.0 if sampwidth == 2 else (8388608.0 if sampwidth == 3 else 2147483648.0)
-
-                peaks = []
-                for i in range(0, nframes, step):
-                    w.setpos(i)
-                    frames = min(step, nframes - i)
-                    raw = w.readframes(frames)
-                    if not raw:
-                        continue
-
-                    if sampwidth == 2:
-                        count = len(raw) // 2
-                        if count == 0:
-                            continue
-                        vals = struct.unpack("<" + "h" * count, raw)
-                        usable = (len(vals) // ch) * ch
-                        if usable <= 0:
-                            continue
-                        left_vals = vals[:usable:ch]
-                        right_vals = vals[1:usable:ch] if ch > 1 else left_vals
-                        left_peak = max(abs(value) for value in left_vals) / fs
-                        right_peak = max(abs(value) for value in right_vals) / fs
-                    elif sampwidth == 3:
-                        b = raw
-                        count = len(b) // (3 * ch)
-                        if count <= 0:
-                            continue
-                        step_bytes = 3 * ch
-                        left_peak_value = 0
-                        right_peak_value = 0
-
-                        def _read_s24(offset: int) -> int:
-                            b0, b1, b2 = b[offset], b[offset + 1], b[offset + 2]
-                            value = b0 | (b1 << 8) | (b2 << 16)
-                            if value & 0x800000:
-                                value -= 0x1000000
-                            return value
-
-                        for off in range(0, count * step_bytes, step_bytes):
-                            left_value = _read_s24(off)
-                            right_value = _read_s24(off + 3) if ch > 1 else left_value
-                            left_peak_value = max(left_peak_value, abs(left_value))
-                            right_peak_value = max(right_peak_value, abs(right_value))
-                        left_peak = left_peak_value / fs
-                        right_peak = right_peak_value / fs
-                    elif sampwidth == 4:
-                        count = len(raw) // 4
-                        if count == 0:
-                            continue
-                        vals = struct.unpack("<" + "i" * count, raw)
-                        usable = (len(vals) // ch) * ch
-                        if usable <= 0:
-                            continue
-                        left_vals = vals[:usable:ch]
-                        right_vals = vals[1:usable:ch] if ch > 1 else left_vals
-                        left_peak = max(abs(value) for value in left_vals) / fs
-                        right_peak = max(abs(value) for value in right_vals) / fs
-                    else:
-                        continue
-
-                    peaks.append((-min(1.0, float(right_peak)), min(1.0, float(left_peak))))
-                return peaks
+                return _wave_reader_peaks(w, buckets)
     except Exception:
         pass
 
     # --- Generic path A: ffmpeg streaming to stereo s16le --------------------
+    # Raw PCM is piped on purpose rather than parsing per-segment astats metadata from
+    # ffmpeg's log: the PCM contract is stable across ffmpeg builds, the log format is
+    # not and cannot be validated against real ffmpeg output in CI, and the bucket
+    # reduction already runs in NumPy.
     ffmpeg = _which("ffmpeg")
     if ffmpeg:
         sr = 44100
-        # Try to get duration for bucket sizing
+        # Try to get duration for bucket sizing; the container header is read in-process
+        # first so ffprobe is only spawned for files mutagen cannot parse.
         total_samples = None
-        ffprobe = _which("ffprobe")
+        d = _container_duration_seconds(path)
+        ffprobe = None if d else _which("ffprobe")
         if ffprobe:
             try:
                 out = (
@@ -908,99 +890,106 @@ def load_wav_peaks(path: str, width_px: int):
                 )
                 if out:
                     d = float(out)
-                    if d > 0:
-                        total_samples = int(sr * d)
             except Exception:
-                total_samples = None
+                d = None
+        if d and math.isfinite(d) and d > 0:
+            # Let ffmpeg decimate to ~64 samples per bucket instead of piping
+            # 44.1 kHz; the 8 kHz floor keeps transients visible in the peaks.
+            sr = max(8000, min(sr, int(buckets * 64 / d)))
+            total_samples = int(sr * d)
 
         target_step = max(
             1, (total_samples // buckets) if total_samples else (sr // 100)
         )  # ~10 ms if unknown
+        expected_count = -(-total_samples // target_step) if total_samples else None
 
-        try:
+        def _ffmpeg_segment_peaks(
+            start_frame: int, frame_limit: int | None, *, stream: bool = False
+        ):
+            command = [ffmpeg, "-v", "error", "-nostdin", "-vn"]
+            if start_frame:
+                command += ["-ss", f"{start_frame / sr:.6f}"]
+            command += ["-i", os.fspath(path)]
+            if frame_limit is not None:
+                # Ask for one spare bucket; the reader trims to the exact frame count.
+                command += ["-t", f"{(frame_limit + target_step) / sr:.6f}"]
+            # Stereo on purpose: the WAV fast path keeps left and right peaks apart too, and
+            # -ac 2 lets ffmpeg duplicate mono sources the same way that path does.
+            command += ["-f", "s16le", "-acodec", "pcm_s16le", "-ac", "2", "-ar", str(sr), "-"]
+            if _cancelled():
+                return []
             p = subprocess.Popen(
-                [
-                    ffmpeg,
-                    "-v",
-                    "error",
-                    "-nostdin",
-                    "-vn",
-                    "-i",
-                    os.fspath(path),
-                    "-f",
-                    "s16le",
-                    "-acodec",
-                    "pcm_s16le",
-                    "-ac",
-                    "2",
-                    "-ar",
-                    str(sr),
-                    "-",
-                ],
+                command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
+                bufsize=_PCM_PIPE_BUFFER_BYTES,
             )
 
-            peaks = []
-            fs = 32768.0
-            need = target_step
-            left_peak, right_peak = 0.0, 0.0
-            bucket_had_sample = False
-            buf = bytearray()
-
-            while True:
-                chunk = p.stdout.read(8192)
-                if not chunk:
-                    break
-                buf.extend(chunk)
-
-                frame_bytes = 4
-                n_frames = len(buf) // frame_bytes
-                if n_frames <= 0:
-                    continue
-
-                off_frames = 0
-                import struct as _st
-
-                while n_frames > 0:
-                    take = min(need, n_frames)
-                    data_len = take * frame_bytes
-                    data = bytes(
-                        buf[off_frames * frame_bytes : off_frames * frame_bytes + data_len]
-                    )  # copy; safe to resize buf
-                    for i in range(0, len(data), frame_bytes):
-                        left_value = _st.unpack_from("<h", data, i)[0] / fs
-                        right_value = _st.unpack_from("<h", data, i + 2)[0] / fs
-                        left_peak = max(left_peak, abs(left_value))
-                        right_peak = max(right_peak, abs(right_value))
-                        bucket_had_sample = True
-                    need -= take
-                    off_frames += take
-                    n_frames -= take
-
-                    if need == 0:
-                        if bucket_had_sample:
-                            peaks.append((-min(1.0, right_peak), min(1.0, left_peak)))
-                        left_peak, right_peak = 0.0, 0.0
-                        bucket_had_sample = False
-                        need = target_step
-
-                # drop consumed bytes
-                del buf[: off_frames * frame_bytes]
-
-            p.stdout.close()
+            accumulator = _PcmPeakAccumulator(target_step)
+            remaining = None if frame_limit is None else frame_limit * 4
+            streamed = 0
             try:
-                p.wait(timeout=2)
-            except Exception:
-                p.kill()
-
-            if bucket_had_sample:
-                peaks.append((-min(1.0, right_peak), min(1.0, left_peak)))
+                while remaining is None or remaining > 0:
+                    if _cancelled():
+                        p.kill()
+                        break
+                    chunk = p.stdout.read(_PCM_PIPE_READ_BYTES)
+                    if not chunk:
+                        break
+                    if remaining is not None:
+                        chunk = chunk[:remaining]
+                        remaining -= len(chunk)
+                    accumulator.feed(chunk)
+                    if stream and len(accumulator.peaks) - streamed >= _PEAK_STREAM_BATCH_BUCKETS:
+                        on_peaks(accumulator.peaks[streamed:], expected_count)
+                        streamed = len(accumulator.peaks)
+            finally:
+                p.stdout.close()
+                try:
+                    p.wait(timeout=2)
+                except Exception:
+                    p.kill()
+            segment_peaks = accumulator.finish()
+            if stream and len(segment_peaks) > streamed and not _cancelled():
+                on_peaks(segment_peaks[streamed:], expected_count)
+            return segment_peaks
+
+        segment_count = 1
+        if total_samples and total_samples >= _FFMPEG_SEGMENT_MIN_SECONDS * sr:
+            segment_count = max(1, min(_FFMPEG_MAX_SEGMENTS, os.cpu_count() or 1))
 
+        try:
+            if segment_count > 1:
+                # Segments span whole buckets so no partial bucket forms at a seam.
+                segment_buckets = -(-total_samples // (target_step * segment_count))
+                segment_frames = segment_buckets * target_step
+                ranges = [
+                    (index * segment_frames, segment_frames if index < segment_count - 1 else None)
+                    for index in range(segment_count)
+                ]
+                with ThreadPoolExecutor(
+                    max_workers=segment_count,
+                    thread_name_prefix="waveform-ffmpeg",
+                ) as executor:
+                    futures = [executor.submit(_ffmpeg_segment_peaks, *span) for span in ranges]
+                    peaks = []
+                    # Segments finish out of order; report them in timeline order.
+                    for future in futures:
+                        segment_peaks = future.result()
+                        peaks.extend(segment_peaks)
+                        if on_peaks is not None and segment_peaks and not _cancelled():
+                            on_peaks(segment_peaks, expected_count)
+            else:
+                peaks = _ffmpeg_segment_peaks(0, None, stream=on_peaks is not None)
+            if _cancelled():
+                return []
             return peaks or [(-0.0, 0.0)]
         except Exception:
             pass  # fall through to audioread
 
+    if _cancelled():
+        return []
+
     # --- Generic path B: QtMultimedia decoder fallback -----------------------
     try:
         peaks = _load_peaks_via_qt_decoder()
@@ -1013,65 +1002,23 @@ def load_wav_peaks(path: str, width_px: int):
     # audioread 3.0.1 still imports stdlib `aifc` via rawread, which breaks on
     # Python 3.13. Keep it only as a legacy fallback behind the Qt path.
     try:
-        import struct as _st
-
         import audioread
 
-        peaks = []
         with audioread.audio_open(path) as f:
             sr = f.samplerate or 44100
             duration = getattr(f, "duration", None)
             total_samples = int(sr * duration) if duration else None
             # frames = samples *per channel*; audioread blocks are interleaved across channels
             ch = max(1, getattr(f, "channels", 1))
-            frame_bytes = 2 * ch  # 16-bit signed little-endian per sample * channels
             target_step = max(
                 1, (total_samples // buckets) if total_samples else (sr // 100)
             )  # ~10 ms if unknown
 
-            fs = 32768.0
-            need = target_step
-            left_peak, right_peak = 0.0, 0.0
-            bucket_had_sample = False
-            buf = bytearray()
-
+            accumulator = _PcmPeakAccumulator(target_step, ch)
             for block in f:  # raw 16-bit little-endian PCM
-                buf.extend(block)
-                frames = len(buf) // frame_bytes
-                if frames <= 0:
-                    continue
-
-                off_frames = 0
-                while frames > 0:
-                    take = min(need, frames)
-                    data_len = take * frame_bytes
-                    data = bytes(
-                        buf[off_frames * frame_bytes : off_frames * frame_bytes + data_len]
-                    )  # copy
-                    for i in range(0, len(data), frame_bytes):
-                        left_value = _st.unpack_from("<h", data, i)[0] / fs
-                        right_value = (
-                            _st.unpack_from("<h", data, i + 2)[0] / fs if ch > 1 else left_value
-                        )
-                        left_peak = max(left_peak, abs(left_value))
-                        right_peak = max(right_peak, abs(right_value))
-                        bucket_had_sample = True
-                    need -= take
-                    off_frames += take
-                    frames -= take
-                    if need == 0:
-                        if bucket_had_sample:
-                            peaks.append((-min(1.0, right_peak), min(1.0, left_peak)))
-                        left_peak, right_peak = 0.0, 0.0
-                        bucket_had_sample = False
-                        need = target_step
-
-                del buf[: off_frames * frame_bytes]
-
-            if bucket_had_sample:
-                peaks.append((-min(1.0, right_peak), min(1.0, left_peak)))
+                accumulator.feed(block)
 
-            return peaks or [(-0.0, 0.0)]
+            return accumulator.finish() or [(-0.0, 0.0)]
     except Exception:
         pass
 
@@ -17,6 +17,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Protocol
 
+try:
+    from mutagen import File as MutagenFile
+except Exception:  # pragma: no cover - optional at runtime in constrained environments
+    MutagenFile = None
+
 from isrc_manager.file_storage import STORAGE_MODE_DATABASE
 
 WAVEFORM_CACHE_ANALYZER_VERSION = 4
@@ -27,6 +32,12 @@ WAVEFORM_DB_STOPS = (0.0, -3.0, -6.0, -12.0, -18.0, -30.0, -48.0, -72.0, -96.0)
 WAVEFORM_COLOR_SOFTEN_AMOUNT = 0.13
 _FINGERPRINT_EDGE_BYTES = 64 * 1024
 _MP3_FRAME_SYNC_SCAN_BYTES = 256 * 1024
+_WAVE_PEAK_BLOCK_FRAMES = 1 << 18
+# Larger pipe reads mean far fewer read() calls per decoded minute, at the cost of the
+# first bucket arriving a little later; peaks are only used once decoding finishes.
+_PCM_PIPE_BUFFER_BYTES = 1 << 20
+_PCM_PIPE_READ_BYTES = 1 << 18
+_resolved_tool_paths: dict[str, str] = {}
 
 
 class TrackMediaSourceHandle(Protocol):
@@ -178,6 +189,19 @@ def _peaks_to_json(peaks: list[tuple[float, float]]) -> str:
 
 
 def _which(name: str) -> str | None:
+    """Resolve an external tool, reusing the last hit while it still exists."""
+    cached = _resolved_tool_paths.get(name)
+    if cached and os.path.exists(cached):
+        return cached
+    path = _find_tool(name)
+    if path:
+        _resolved_tool_paths[name] = path
+    else:
+        _resolved_tool_paths.pop(name, None)
+    return path
+
+
+def _find_tool(name: str) -> str | None:
     path = shutil.which(name)
     if path:
         return path
@@ -206,12 +230,155 @@ def _which(name: str) -> str | None:
     return None
 
 
+def _container_duration_seconds(path: str) -> float | None:
+    """Read the declared duration from the file header without spawning ffprobe."""
+    if MutagenFile is None:
+        return None
+    try:
+        info = getattr(MutagenFile(os.fspath(path)), "info", None)
+        duration = float(getattr(info, "length", 0.0) or 0.0)
+    except Exception:
+        return None
+    if not math.isfinite(duration) or duration <= 0:
+        return None
+    return duration
+
+
 def _append_peak(peaks: list[tuple[float, float]], left_peak: float, right_peak: float) -> None:
     left = max(0.0, min(1.0, abs(float(left_peak))))
     right = max(0.0, min(1.0, abs(float(right_peak))))
     peaks.append((-right, left))
 
 
+def _extend_peaks(peaks: list[tuple[float, float]], bucket_peaks) -> None:
+    """Append ``(buckets, 2)`` left/right magnitudes the way ``_append_peak`` would."""
+    import numpy as np
+
+    clipped = np.clip(bucket_peaks, 0.0, 1.0)
+    peaks.extend(zip((-clipped[:, 1]).tolist(), clipped[:, 0].tolist()))
+
+
+def _pcm_frame_magnitudes(raw: bytes, sample_width: int, channels: int):
+    """Return absolute left/right sample values as an ``(frames, 2)`` integer array."""
+    import numpy as np
+
+    frame_count = len(raw) // (sample_width * channels)
+    if frame_count <= 0:
+        return None
+    sample_count = frame_count * channels
+    if sample_width == 2:
+        samples = np.frombuffer(raw, dtype="<i2", count=sample_count).astype(np.int32)
+    elif sample_width == 3:
+        # Place each 24-bit sample in the top three bytes of an int32 so the
+        # arithmetic shift sign-extends it without a per-sample branch.
+        packed = np.frombuffer(raw, dtype=np.uint8, count=sample_count * 3)
+        widened = np.zeros((sample_count, 4), dtype=np.uint8)
+        widened[:, 1:] = packed.reshape(sample_count, 3)
+        samples = widened.view("<i4").reshape(sample_count) >> 8
+    elif sample_width == 4:
+        # Widen before abs() so the most negative 32-bit sample does not overflow.
+        samples = np.frombuffer(raw, dtype="<i4", count=sample_count).astype(np.int64)
+    else:
+        return None
+    frames = np.abs(samples).reshape(frame_count, channels)
+    return frames[:, :2] if channels > 1 else frames[:, [0, 0]]
+
+
+def _wave_reader_peaks(wav, buckets: int) -> list[tuple[float, float]]:
+    """Reduce an open ``wave`` reader to ``(-right_peak, left_peak)`` buckets."""
+    import numpy as np
+
+    channels = max(1, wav.getnchannels())
+    sample_width = wav.getsampwidth()
+    frame_count = wav.getnframes()
+    if frame_count <= 0 or sample_width not in (2, 3, 4):
+        return []
+    step = max(1, frame_count // max(1, int(buckets)))
+    full_scale = (
+        32768.0 if sample_width == 2 else (8388608.0 if sample_width == 3 else 2147483648.0)
+    )
+    # Blocks hold whole buckets so reduceat boundaries line up with bucket boundaries.
+    block_frames = step * max(1, _WAVE_PEAK_BLOCK_FRAMES // step)
+    peaks: list[tuple[float, float]] = []
+    for block_start in range(0, frame_count, block_frames):
+        raw = wav.readframes(min(block_frames, frame_count - block_start))
+        magnitudes = _pcm_frame_magnitudes(raw, sample_width, channels)
+        if magnitudes is None:
+            break
+        bucket_starts = np.arange(0, magnitudes.shape[0], step)
+        _extend_peaks(peaks, np.maximum.reduceat(magnitudes, bucket_starts, axis=0) / full_scale)
+    return peaks
+
+
+class _PcmPeakAccumulator:
+    """Fold interleaved signed 16-bit PCM into ``target_step``-frame peak buckets.
+
+    Chunks may split buckets and frames arbitrarily; a trailing partial frame is
+    carried into the next ``feed`` call instead of buffering the whole stream.
+    """
+
+    __slots__ = (
+        "bucket_had_sample",
+        "channels",
+        "left_peak",
+        "need",
+        "peaks",
+        "pending",
+        "right_peak",
+        "target_step",
+    )
+
+    def __init__(self, target_step: int, channels: int = 2) -> None:
+        self.target_step = max(1, int(target_step))
+        self.channels = max(1, int(channels))
+        self.peaks: list[tuple[float, float]] = []
+        self.need = self.target_step
+        self.left_peak = 0
+        self.right_peak = 0
+        self.bucket_had_sample = False
+        self.pending = b""
+
+    def _fold_into_bucket(self, magnitudes) -> None:
+        left_peak, right_peak = magnitudes.max(axis=0).tolist()
+        self.left_peak = max(self.left_peak, left_peak)
+        self.right_peak = max(self.right_peak, right_peak)
+        self.bucket_had_sample = True
+        self.need -= magnitudes.shape[0]
+        if self.need == 0:
+            self.finish()
+            self.need = self.target_step
+
+    def feed(self, chunk: bytes) -> None:
+        import numpy as np
+
+        data = self.pending + chunk if self.pending else chunk
+        frame_bytes = 2 * self.channels
+        self.pending = bytes(data[len(data) - len(data) % frame_bytes :])
+        magnitudes = _pcm_frame_magnitudes(data, 2, self.channels)
+        if magnitudes is None:
+            return
+        head = min(self.need, magnitudes.shape[0])
+        self._fold_into_bucket(magnitudes[:head])
+        rest = magnitudes[head:]
+        full = (rest.shape[0] // self.target_step) * self.target_step
+        if full:
+            bucket_peaks = np.maximum.reduceat(
+                rest[:full], np.arange(0, full, self.target_step), axis=0
+            )
+            _extend_peaks(self.peaks, bucket_peaks / 32768.0)
+        if full < rest.shape[0]:
+            self._fold_into_bucket(rest[full:])
+
+    def finish(self) -> list[tuple[float, float]]:
+        """Flush the pending partial bucket and return the collected peaks."""
+        if self.bucket_had_sample:
+            _append_peak(self.peaks, self.left_peak / 32768.0, self.right_peak / 32768.0)
+        self.left_peak = 0
+        self.right_peak = 0
+        self.bucket_had_sample = False
+        return self.peaks
+
+
 def _load_wave_peaks(path: str, buckets: int) -> list[tuple[float, float]] | None:
     import wave
 
@@ -227,73 +394,7 @@ def _load_wave_peaks(path: str, buckets: int) -> list[tuple[float, float]] | Non
     except Exception:
         return []
     with wav_file as wav:
-        channels = max(1, wav.getnchannels())
-        sample_width = wav.getsampwidth()
-        frame_count = wav.getnframes()
-        if frame_count <= 0:
-            return []
-        step = max(1, frame_count // max(1, int(buckets)))
-        full_scale = (
-            32768.0 if sample_width == 2 else (8388608.0 if sample_width == 3 else 2147483648.0)
-        )
-        peaks: list[tuple[float, float]] = []
-        for frame_start in range(0, frame_count, step):
-            wav.setpos(frame_start)
-            raw = wav.readframes(min(step, frame_count - frame_start))
-            if not raw:
-                continue
-            if sample_width == 2:
-                count = len(raw) // 2
-                if count <= 0:
-                    continue
-                values = struct.unpack("<" + "h" * count, raw)
-                usable = (len(values) // channels) * channels
-                if usable <= 0:
-                    continue
-                left_values = values[:usable:channels]
-                right_values = values[1:usable:channels] if channels > 1 else left_values
-                _append_peak(
-                    peaks,
-                    max(abs(value) for value in left_values) / full_scale,
-                    max(abs(value) for value in right_values) / full_scale,
-                )
-            elif sample_width == 3:
-                count = len(raw) // (3 * channels)
-                if count <= 0:
-                    continue
-                step_bytes = 3 * channels
-                left_peak = 0
-                right_peak = 0
-
-                def _read_s24(offset: int) -> int:
-                    b0, b1, b2 = raw[offset], raw[offset + 1], raw[offset + 2]
-                    value = b0 | (b1 << 8) | (b2 << 16)
-                    if value & 0x800000:
-                        value -= 0x1000000
-                    return value
-
-                for offset in range(0, count * step_bytes, step_bytes):
-                    left = _read_s24(offset)
-                    right = _read_s24(offset + 3) if channels > 1 else left
-                    left_peak = max(left_peak, abs(left))
-                    right_peak = max(right_peak, abs(right))
-                _append_peak(peaks, left_peak / full_scale, right_peak / full_scale)
-            elif sample_width == 4:
-                count = len(raw) // 4
-                if count <= 0:
-                    continue
-                values = struct.unpack("<" + "i" * count, raw)
-                usable = (len(values) // channels) * channels
-                if usable <= 0:
-                    continue
-                left_values = values[:usable:channels]
-                right_values = values[1:usable:channels] if channels > 1 else left_values
-                _append_peak(
-                    peaks,
-                    max(abs(value) for value in left_values) / full_scale,
-                    max(abs(value) for value in right_values) / full_scale,
-                )
-        return peaks
+        return _wave_reader_peaks(wav, buckets)
 
 
 def _load_ffmpeg_peaks(path: str, buckets: int) -> list[tuple[float, float]] | None:
@@ -302,7 +403,10 @@ def _load_ffmpeg_peaks(path: str, buckets: int) -> list[tuple[float, float]] | N
         return None
     sample_rate = 44100
     total_samples = None
-    ffprobe = _which("ffprobe")
+    container_duration = _container_duration_seconds(path)
+    if container_duration is not None:
+        total_samples = int(sample_rate * container_duration)
+    ffprobe = None if total_samples else _which("ffprobe")
     if ffprobe:
         with suppress(Exception):
             duration_text = (
@@ -350,6 +454,7 @@ def _load_ffmpeg_peaks(path: str, buckets: int) -> list[tuple[float, float]] | N
             ],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
+            bufsize=_PCM_PIPE_BUFFER_BYTES,
         )
     except Exception:
         return None
@@ -358,49 +463,14 @@ def _load_ffmpeg_peaks(path: str, buckets: int) -> list[tuple[float, float]] | N
             process.kill()
         return None
 
-    peaks: list[tuple[float, float]] = []
-    frame_bytes = 4
-    full_scale = 32768.0
-    need = target_step
-    left_peak = 0.0
-    right_peak = 0.0
-    bucket_had_sample = False
-    buffer = bytearray()
+    accumulator = _PcmPeakAccumulator(target_step)
     try:
         while True:
-            chunk = process.stdout.read(8192)
+            chunk = process.stdout.read(_PCM_PIPE_READ_BYTES)
             if not chunk:
                 break
-            buffer.extend(chunk)
-            frame_count = len(buffer) // frame_bytes
-            if frame_count <= 0:
-                continue
-            offset_frames = 0
-            while frame_count > 0:
-                take = min(need, frame_count)
-                data_len = take * frame_bytes
-                data = bytes(
-                    buffer[offset_frames * frame_bytes : offset_frames * frame_bytes + data_len]
-                )
-                for index in range(0, len(data), frame_bytes):
-                    left_value = struct.unpack_from("<h", data, index)[0] / full_scale
-                    right_value = struct.unpack_from("<h", data, index + 2)[0] / full_scale
-                    left_peak = max(left_peak, abs(left_value))
-                    right_peak = max(right_peak, abs(right_value))
-                    bucket_had_sample = True
-                need -= take
-                offset_frames += take
-                frame_count -= take
-                if need == 0:
-                    if bucket_had_sample:
-                        _append_peak(peaks, left_peak, right_peak)
-                    left_peak = 0.0
-                    right_peak = 0.0
-                    bucket_had_sample = False
-                    need = target_step
-            del buffer[: offset_frames * frame_bytes]
-        if bucket_had_sample:
-            _append_peak(peaks, left_peak, right_peak)
+            accumulator.feed(chunk)
+        peaks = accumulator.finish()
     finally:
         with suppress(Exception):
             process.stdout.close()
@@ -790,15 +860,37 @@ def _soften_waveform_rgb(rgb: tuple[int, int, int]) -> tuple[int, int, int]:
     )
 
 
-def _shade_waveform_rgb(
-    rgb: tuple[int, int, int],
+def _fallback_waveform_column_rgb(
+    dominant_peak: Any,
+    rgb_for_peak: Callable[[float], tuple[int, int, int]] = _fallback_waveform_rgb_for_peak,
+) -> Any:
+    """Pick each column's fallback color in bulk, using the bands of `rgb_for_peak`."""
+    import numpy as np
+
+    rgb_levels = np.array(
+        [rgb_for_peak(level) for level in (1.0, 0.5, 0.3, 0.0)],
+        dtype=np.float64,
+    )
+    return rgb_levels[
+        np.select(
+            [dominant_peak >= 0.72, dominant_peak >= 0.46, dominant_peak >= 0.24], [0, 1, 2], 3
+        )
+    ]
+
+
+def _shade_waveform_pixels(
+    base_rgb: Any,
+    peak: Any,
+    edge_ratio: Any,
     *,
-    peak: float,
-    edge_ratio: float,
     light_background: bool,
-) -> tuple[int, int, int, int]:
-    peak = max(0.0, min(1.0, float(peak)))
-    edge_ratio = max(0.0, min(1.0, float(edge_ratio)))
+) -> Any:
+    """Shade waveform bar pixels in one pass; returns an (N, 3) uint8 array of RGB channels."""
+    import numpy as np
+
+    base_rgb = np.asarray(base_rgb, dtype=np.float64).reshape(-1, 3)
+    peak = np.clip(np.asarray(peak, dtype=np.float64), 0.0, 1.0)
+    edge_ratio = np.clip(np.asarray(edge_ratio, dtype=np.float64), 0.0, 1.0)
     if light_background:
         base_scale = 0.42 + (0.22 * peak)
         edge_lift = 0.26 * (edge_ratio**0.7)
@@ -807,35 +899,9 @@ def _shade_waveform_rgb(
         base_scale = 0.58 + (0.18 * peak)
         edge_lift = 0.30 * (edge_ratio**0.7)
         highlight = 0.10 * (edge_ratio**1.8)
-    scale = min(1.18, base_scale + edge_lift)
-    return (
-        int(max(0, min(255, (rgb[0] * scale) + (255 * highlight)))),
-        int(max(0, min(255, (rgb[1] * scale) + (255 * highlight)))),
-        int(max(0, min(255, (rgb[2] * scale) + (255 * highlight)))),
-        255,
-    )
-
-
-def _build_waveform_path(peaks: list[tuple[float, float]], rect):
-    from PySide6.QtGui import QPainterPath
-
-    path = QPainterPath()
-    if not peaks:
-        return path
-    mid = rect.center().y()
-    xscale = (rect.width() - 1.0) / max(1, len(peaks) - 1)
-    amplitude = rect.height() * 0.45
-    for index, (lo, hi) in enumerate(peaks):
-        x_pos = rect.left() + (index * xscale)
-        top_peak = max(0.0, min(1.0, float(hi)))
-        bottom_peak = max(0.0, min(1.0, -float(lo)))
-        if top_peak > 0.0:
-            path.moveTo(x_pos, mid)
-            path.lineTo(x_pos, mid - (top_peak * amplitude))
-        if bottom_peak > 0.0:
-            path.moveTo(x_pos, mid)
-            path.lineTo(x_pos, mid + (bottom_peak * amplitude))
-    return path
+    scale = np.minimum(1.18, base_scale + edge_lift)
+    channels = np.clip((base_rgb * scale[:, None]) + (255 * highlight)[:, None], 0, 255)
+    return channels.astype(np.uint8)
 
 
 def _resample_peaks_to_width(
@@ -874,51 +940,53 @@ def render_waveform_cache_png(
 ) -> bytes:
     if not peaks:
         return b""
+    import numpy as np
     from PIL import Image
 
     width_px = max(1, int(width_px))
     height_px = max(1, int(height_px))
     peaks = _resample_peaks_to_width(peaks, width_px)
     waveform_colors = _resample_waveform_colors(list(waveform_colors or []), width_px)
-    image = Image.new("RGBA", (width_px, height_px), (0, 0, 0, 0))
     center_y = (height_px - 1) / 2.0
     amplitude_px = max(1.0, height_px * 0.47)
+    center_index = max(0, min(height_px - 1, int(round(center_y))))
+
+    # Shade every bar pixel of every column in one pass and hand PIL the finished
+    # buffer, instead of a Python-level shade and pixel store per pixel.
+    peak_pairs = np.asarray(peaks, dtype=np.float64).reshape(-1, 2)
+    top_peak = np.clip(peak_pairs[:, 1], 0.0, 1.0)
+    bottom_peak = np.clip(-peak_pairs[:, 0], 0.0, 1.0)
+    dominant_peak = np.maximum(top_peak, bottom_peak)
+    top_start = np.clip(np.round(center_y - (top_peak * amplitude_px)), 0, height_px - 1)
+    bottom_end = np.clip(np.round(center_y + (bottom_peak * amplitude_px)), 0, height_px - 1)
+    rows = np.arange(height_px)[:, None]
+    visible = dominant_peak > 0.0
+    in_top = visible & (top_peak > 0.0) & (rows >= top_start) & (rows <= center_index)
+    in_bottom = visible & (bottom_peak > 0.0) & (rows >= center_index) & (rows <= bottom_end)
+    pixel_rows, pixel_columns = np.nonzero(in_top | in_bottom)
+
+    if waveform_colors:
+        column_rgb = np.asarray(waveform_colors, dtype=np.float64).reshape(-1, 3)
+    else:
+        column_rgb = _fallback_waveform_column_rgb(dominant_peak)
+    # The bottom bar is drawn last, so it owns the shared center row.
+    peak = np.where(
+        in_bottom[pixel_rows, pixel_columns],
+        bottom_peak[pixel_columns],
+        top_peak[pixel_columns],
+    )
+    edge_ratio = np.abs(pixel_rows - center_y) / np.maximum(1.0, peak * amplitude_px)
+    channels = _shade_waveform_pixels(
+        column_rgb[pixel_columns],
+        peak,
+        edge_ratio,
+        light_background=light_background,
+    )
 
-    pixels = image.load()
-    center_index = int(round(center_y))
-    for x_pos, (low, high) in enumerate(peaks):
-        top_peak = max(0.0, min(1.0, float(high)))
-        bottom_peak = max(0.0, min(1.0, -float(low)))
-        dominant_peak = max(top_peak, bottom_peak)
-        if dominant_peak <= 0.0:
-            continue
-        base_rgb = (
-            waveform_colors[x_pos]
-            if x_pos < len(waveform_colors)
-            else _fallback_waveform_rgb_for_peak(dominant_peak)
-        )
-        if top_peak > 0.0:
-            start_y = max(0, min(height_px - 1, int(round(center_y - (top_peak * amplitude_px)))))
-            end_y = max(0, min(height_px - 1, center_index))
-            for y_pos in range(start_y, end_y + 1):
-                edge_ratio = abs(float(y_pos) - center_y) / max(1.0, top_peak * amplitude_px)
-                pixels[x_pos, y_pos] = _shade_waveform_rgb(
-                    base_rgb,
-                    peak=top_peak,
-                    edge_ratio=edge_ratio,
-                    light_background=light_background,
-                )
-        if bottom_peak > 0.0:
-            start_y = max(0, min(height_px - 1, center_index))
-            end_y = max(0, min(height_px - 1, int(round(center_y + (bottom_peak * amplitude_px)))))
-            for y_pos in range(start_y, end_y + 1):
-                edge_ratio = abs(float(y_pos) - center_y) / max(1.0, bottom_peak * amplitude_px)
-                pixels[x_pos, y_pos] = _shade_waveform_rgb(
-                    base_rgb,
-                    peak=bottom_peak,
-                    edge_ratio=edge_ratio,
-                    light_background=light_background,
-                )
+    rgba = np.zeros((height_px, width_px, 4), dtype=np.uint8)
+    rgba[pixel_rows, pixel_columns, :3] = channels
+    rgba[pixel_rows, pixel_columns, 3] = 255
+    image = Image.fromarray(rgba)
 
     buffer = io.BytesIO()
     image.save(buffer, "PNG")
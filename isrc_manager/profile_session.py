@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import traceback
 from datetime import datetime
 from pathlib import Path
@@ -49,6 +50,14 @@ BACKUP_SIDECAR_SUFFIX = ".backup.json"
 STARTUP_RECOVERY_PROFILE_NAME = "startup_recovery.db"
 
 
+def _existing_child_directories(root: Path) -> frozenset[str]:
+    try:
+        with os.scandir(root) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_dir())
+    except OSError:
+        return frozenset()
+
+
 def _apply_storage_layout(app, *, active_data_root: str | Path | None = None) -> None:
     app._report_storage_startup_progress(86, 100, "Applying active storage root...")
     app.storage_layout = resolve_app_storage_layout(
@@ -78,12 +87,17 @@ def _apply_storage_layout(app, *, active_data_root: str | Path | None = None) ->
         app.history_dir,
         app.help_dir,
     )
+    # One listing of the data root covers the usual warm start where every
+    # storage folder already exists, instead of a mkdir/stat pair per folder.
+    existing_children = _existing_child_directories(Path(app.data_root))
     for directory_index, directory in enumerate(storage_directories, start=1):
         app._report_storage_startup_progress(
             86 + int((directory_index / len(storage_directories)) * 10),
             100,
             f"Ensuring storage folder: {directory.name}",
         )
+        if directory.parent == app.data_root and directory.name in existing_children:
+            continue
         directory.mkdir(parents=True, exist_ok=True)
 
     today_stamp = datetime.now().strftime("%Y-%m-%d")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import csv
 import json
+import re
 import sqlite3
 from collections import Counter
 from dataclasses import asdict
@@ -30,6 +31,11 @@ from isrc_manager.works import WorkContributorPayload, WorkPayload, WorkService
 from ..services.track_artist_sql import track_main_artist_join_sql
 from .models import QualityIssue, QualityScanResult
 
+# Accepted release-date shapes. The match picks the one strptime format to try instead of
+# attempting every format in turn.
+_YEAR_FIRST_DATE_RE = re.compile(r"\d{4}([-/])\d{1,2}\1\d{1,2}")
+_DAY_FIRST_DATE_RE = re.compile(r"\d{1,2}([-/])\d{1,2}\1\d{4}")
+
 
 class QualityDashboardService:
     """Runs deterministic quality checks and exposes safe repair operations."""
@@ -1369,12 +1375,18 @@ class QualityDashboardService:
         text = str(value or "").strip()
         if not text:
             return None
-        for fmt in ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y", "%Y/%m/%d"):
-            try:
-                return datetime.strptime(text, fmt).strftime("%Y-%m-%d")
-            except Exception:
-                continue
-        return None
+        if match := _YEAR_FIRST_DATE_RE.fullmatch(text):
+            separator = match.group(1)
+            fmt = f"%Y{separator}%m{separator}%d"
+        elif match := _DAY_FIRST_DATE_RE.fullmatch(text):
+            separator = match.group(1)
+            fmt = f"%d{separator}%m{separator}%Y"
+        else:
+            return None
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            return None
 
     def _find_media_by_name(self, basename: str) -> Path | None:
         if self.data_root is None:
@@ -150,6 +150,7 @@ from .custom_fields import (
 )
 from .database_admin import (
     BackupResult,
+    CompactionResult,
     DatabaseMaintenanceService,
     ProfileStoreService,
     RestoreResult,
@@ -271,6 +272,7 @@ __all__ = [
     "CodeRegistryEntryRecord",
     "CodeRegistryService",
     "CodeRegistryUsageLink",
+    "CompactionResult",
     "CONTRACT_STATUS_CHOICES",
     "CustomFieldDefinitionService",
     "CustomFieldValueService",
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import json
-import mimetypes
+import shutil
 import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 
 from isrc_manager.blob_icons import blob_icon_spec_from_storage, blob_icon_spec_to_storage
+from isrc_manager.constants import MAX_BLOB_BYTES
 from isrc_manager.domain.standard_fields import promoted_field_spec_by_label_lower
 from isrc_manager.file_storage import (
     STORAGE_MODE_DATABASE,
@@ -20,11 +21,44 @@ from isrc_manager.file_storage import (
     normalize_storage_mode,
 )
 from isrc_manager.media.blob_files import (
+    _guess_mime,
     _is_valid_audio_path,
     _is_valid_image_path,
     _read_blob_from_path,
 )
 
+from .sqlite_utils import bulk_write_transaction
+
+# SQLite's historical default for SQLITE_MAX_VARIABLE_NUMBER.
+_MAX_SQL_VARIABLES = 999
+# Bytes moved per step when streaming BLOBs between disk and the database.
+BLOB_IO_CHUNK_SIZE = 1024 * 1024
+
+_BLOB_ROW_SQL = """
+    SELECT
+        value,
+        {blob_column},
+        managed_file_path,
+        storage_mode,
+        filename,
+        COALESCE(NULLIF(size_bytes, 0), length(blob_value), 0),
+        mime_type
+    FROM CustomFieldValues
+    WHERE track_id=? AND field_def_id=?
+"""
+# Both variants are built once instead of being formatted on every per-cell read. The
+# connection's statement cache then hands back the already prepared SELECT, so each read
+# only binds new parameters rather than having SQLite parse and plan the query again.
+# Metadata reads only need to know whether a database BLOB exists, so that variant swaps
+# the payload for a presence marker.
+_BLOB_ROW_META_SQL = _BLOB_ROW_SQL.format(blob_column="CASE WHEN blob_value IS NOT NULL THEN 1 END")
+_BLOB_ROW_PAYLOAD_SQL = _BLOB_ROW_SQL.format(blob_column="blob_value")
+
+
+def _sql_variable_chunks(items: list, variables_per_item: int) -> list[list]:
+    size = max(1, _MAX_SQL_VARIABLES // max(1, variables_per_item))
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
 
 @dataclass(slots=True)
 class LegacyPromotedFieldRepairCandidate:
@@ -106,16 +140,14 @@ class CustomFieldDefinitionService:
     def sync_fields(self, existing_fields: list[dict], new_fields: list[dict]) -> None:
         keep_ids = {field["id"] for field in new_fields if field["id"] is not None}
         supports_blob_icon_payload = self._has_blob_icon_payload_column()
-        with self.conn:
-            for old in existing_fields:
-                if old["id"] not in keep_ids:
-                    self.conn.execute("DELETE FROM CustomFieldDefs WHERE id=?", (old["id"],))
-
-            order = 0
-            for field in new_fields:
-                name = field["name"].strip()
-                field_type = (field.get("field_type") or "text").strip()
-                options = field.get("options")
+        deleted_ids = [old["id"] for old in existing_fields if old["id"] not in keep_ids]
+        inserts: list[tuple] = []
+        updates: list[tuple] = []
+        for order, field in enumerate(new_fields):
+            name = field["name"].strip()
+            field_type = (field.get("field_type") or "text").strip()
+            values = [name, order, field_type, field.get("options")]
+            if supports_blob_icon_payload:
                 blob_icon_payload = None
                 if field_type in {"blob_audio", "blob_image"}:
                     blob_icon_payload = blob_icon_spec_to_storage(
@@ -123,44 +155,42 @@ class CustomFieldDefinitionService:
                         kind="audio" if field_type == "blob_audio" else "image",
                         allow_inherit=True,
                     )
-                if field["id"] is None:
-                    if supports_blob_icon_payload:
-                        self.conn.execute(
-                            """
-                            INSERT INTO CustomFieldDefs
-                                (name, active, sort_order, field_type, options, blob_icon_payload)
-                            VALUES (?, 1, ?, ?, ?, ?)
-                            """,
-                            (name, order, field_type, options, blob_icon_payload),
-                        )
-                    else:
-                        self.conn.execute(
-                            """
-                            INSERT INTO CustomFieldDefs (name, active, sort_order, field_type, options)
-                            VALUES (?, 1, ?, ?, ?)
-                            """,
-                            (name, order, field_type, options),
-                        )
-                else:
-                    if supports_blob_icon_payload:
-                        self.conn.execute(
-                            """
-                            UPDATE CustomFieldDefs
-                            SET name=?, active=1, sort_order=?, field_type=?, options=?, blob_icon_payload=?
-                            WHERE id=?
-                            """,
-                            (name, order, field_type, options, blob_icon_payload, field["id"]),
-                        )
-                    else:
-                        self.conn.execute(
-                            """
-                            UPDATE CustomFieldDefs
-                            SET name=?, active=1, sort_order=?, field_type=?, options=?
-                            WHERE id=?
-                            """,
-                            (name, order, field_type, options, field["id"]),
-                        )
-                order += 1
+                values.append(blob_icon_payload)
+            if field["id"] is None:
+                inserts.append(tuple(values))
+            else:
+                updates.append((*values, field["id"]))
+
+        if supports_blob_icon_payload:
+            insert_columns = "name, sort_order, field_type, options, blob_icon_payload, active"
+            update_sql = """
+                UPDATE CustomFieldDefs
+                SET name=?, active=1, sort_order=?, field_type=?, options=?, blob_icon_payload=?
+                WHERE id=?
+                """
+        else:
+            insert_columns = "name, sort_order, field_type, options, active"
+            update_sql = """
+                UPDATE CustomFieldDefs
+                SET name=?, active=1, sort_order=?, field_type=?, options=?
+                WHERE id=?
+                """
+
+        with bulk_write_transaction(self.conn, immediate=True):
+            for chunk in _sql_variable_chunks(deleted_ids, 1):
+                self.conn.execute(
+                    f"DELETE FROM CustomFieldDefs WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+            self.conn.executemany(update_sql, updates)
+            if inserts:
+                row_sql = f"({','.join('?' * len(inserts[0]))}, 1)"
+                for chunk in _sql_variable_chunks(inserts, len(inserts[0])):
+                    self.conn.execute(
+                        f"INSERT INTO CustomFieldDefs ({insert_columns}) "
+                        f"VALUES {','.join([row_sql] * len(chunk))}",
+                        [value for row in chunk for value in row],
+                    )
 
     def ensure_fields(
         self, fields: list[dict], *, cursor: sqlite3.Cursor | None = None
@@ -335,12 +365,21 @@ class CustomFieldDefinitionService:
         with self.conn:
             return _apply(self.conn.cursor())
 
-    def update_dropdown_options(self, field_def_id: int, options: list[str]) -> None:
+    def update_dropdown_options(
+        self,
+        field_def_id: int,
+        options: list[str],
+        *,
+        cursor: sqlite3.Cursor | None = None,
+    ) -> None:
+        options_json = json.dumps(options)
+        params = (options_json, int(field_def_id), options_json)
+        query = "UPDATE CustomFieldDefs SET options=? WHERE id=? AND options IS NOT ?"
+        if cursor is not None:
+            cursor.execute(query, params)
+            return
         with self.conn:
-            self.conn.execute(
-                "UPDATE CustomFieldDefs SET options=? WHERE id=?",
-                (json.dumps(options), int(field_def_id)),
-            )
+            self.conn.execute(query, params)
 
     def get_field_type(self, field_def_id: int) -> str:
         row = self.conn.execute(
@@ -586,13 +625,14 @@ class CustomFieldValueService:
     def _blob_subdir(field_type: str) -> str:
         return "audio" if field_type == "blob_audio" else "images"
 
-    def _validate_blob_source(self, field_type: str, blob_path: str) -> None:
+    def _validate_blob_source(self, field_type: str, blob_path: str) -> str | None:
+        """Validate the source path and return its guessed MIME type."""
         if field_type == "blob_image":
             if not _is_valid_image_path(blob_path):
                 raise ValueError("Selected file is not a recognized image")
-            return
-        if not _is_valid_audio_path(blob_path):
+        elif not _is_valid_audio_path(blob_path):
             raise ValueError("Selected file is not a recognized audio format")
+        return _guess_mime(blob_path) or None
 
     def _resolve_managed_path(self, stored_path: str | None) -> Path | None:
         return self.file_store.resolve(stored_path)
@@ -625,20 +665,9 @@ class CustomFieldValueService:
         except Exception:
             pass
 
-    def _fetch_blob_row(self, track_id: int, field_def_id: int):
+    def _fetch_blob_row(self, track_id: int, field_def_id: int, *, include_payload: bool = False):
         return self.conn.execute(
-            """
-            SELECT
-                value,
-                blob_value,
-                managed_file_path,
-                storage_mode,
-                filename,
-                size_bytes,
-                mime_type
-            FROM CustomFieldValues
-            WHERE track_id=? AND field_def_id=?
-            """,
+            _BLOB_ROW_PAYLOAD_SQL if include_payload else _BLOB_ROW_META_SQL,
             (int(track_id), int(field_def_id)),
         ).fetchone()
 
@@ -650,22 +679,33 @@ class CustomFieldValueService:
         value=None,
         blob_path: str | None = None,
         storage_mode: str | None = None,
+        dropdown_options: list[str] | None = None,
     ) -> None:
         field_type = self.definitions.get_field_type(field_def_id)
         if field_type in ("blob_image", "blob_audio"):
             if blob_path is None:
                 return
-            self._validate_blob_source(field_type, blob_path)
+            mime = self._validate_blob_source(field_type, blob_path)
             clean_mode = normalize_storage_mode(storage_mode, default=STORAGE_MODE_DATABASE)
             source = Path(blob_path)
-            mime = mimetypes.guess_type(source.name)[0]
             filename = coalesce_filename(
                 source.name, default_stem=self.definitions.get_field_name(field_def_id)
             )
-            if clean_mode == STORAGE_MODE_DATABASE:
+            stream_source = False
+            if clean_mode == STORAGE_MODE_DATABASE and hasattr(self.conn, "blobopen"):
+                # The payload is streamed into a zeroblob after the upsert instead of being
+                # read into memory and bound as one parameter.
+                size = source.stat().st_size
+                if size > MAX_BLOB_BYTES:
+                    raise ValueError(f"Selected file is too large (> {MAX_BLOB_BYTES} bytes)")
+                rel_path = None
+                sqlite_blob = None
+                stream_source = True
+            elif clean_mode == STORAGE_MODE_DATABASE:
                 blob_data = _read_blob_from_path(blob_path)
                 rel_path = None
                 sqlite_blob = sqlite3.Binary(blob_data)
+                size = len(blob_data)
             else:
                 if self.file_store.data_root is None:
                     raise ValueError("Managed custom-field storage is not configured")
@@ -676,7 +716,7 @@ class CustomFieldValueService:
                     subdir=self._blob_subdir(field_type),
                 )
                 sqlite_blob = None
-            size = len(blob_data)
+                size = len(blob_data)
             with self.conn:
                 current = self._fetch_blob_row(track_id, field_def_id)
                 self.conn.execute(
@@ -714,6 +754,8 @@ class CustomFieldValueService:
                         size,
                     ),
                 )
+                if stream_source:
+                    self._stream_file_into_blob(track_id, field_def_id, source, size)
                 if current:
                     stale_path = str(current[2] or "").strip()
                     if stale_path and stale_path != str(rel_path or "").strip():
@@ -723,6 +765,10 @@ class CustomFieldValueService:
             return
 
         with self.conn:
+            if dropdown_options is not None:
+                self.definitions.update_dropdown_options(
+                    field_def_id, dropdown_options, cursor=self.conn.cursor()
+                )
             self.conn.execute(
                 """
                 INSERT INTO CustomFieldValues (
@@ -749,6 +795,28 @@ class CustomFieldValueService:
                 (int(track_id), int(field_def_id), value),
             )
 
+    def _stream_file_into_blob(
+        self, track_id: int, field_def_id: int, source: Path, size: int
+    ) -> None:
+        rowid = self.conn.execute(
+            "SELECT rowid FROM CustomFieldValues WHERE track_id=? AND field_def_id=?",
+            (int(track_id), int(field_def_id)),
+        ).fetchone()[0]
+        self.conn.execute(
+            "UPDATE CustomFieldValues SET blob_value=zeroblob(?) WHERE rowid=?",
+            (int(size), rowid),
+        )
+        written = 0
+        with self.conn.blobopen("CustomFieldValues", "blob_value", rowid) as blob:
+            with source.open("rb") as handle:
+                while chunk := handle.read(BLOB_IO_CHUNK_SIZE):
+                    if written + len(chunk) > size:
+                        raise ValueError("Selected file changed while it was being stored")
+                    blob.write(chunk)
+                    written += len(chunk)
+        if written != size:
+            raise ValueError("Selected file changed while it was being stored")
+
     def get_text_value(self, track_id: int, field_def_id: int) -> str:
         row = self.conn.execute(
             "SELECT value FROM CustomFieldValues WHERE track_id=? AND field_def_id=?",
@@ -818,11 +886,11 @@ class CustomFieldValueService:
                 track_id,
                 field_def_id,
                 value,
-                blob_value,
+                CASE WHEN blob_value IS NOT NULL THEN 1 END,
                 managed_file_path,
                 storage_mode,
                 filename,
-                size_bytes,
+                COALESCE(NULLIF(size_bytes, 0), length(blob_value), 0),
                 mime_type
             FROM CustomFieldValues
             WHERE field_def_id IN ({field_placeholders})
@@ -885,14 +953,20 @@ class CustomFieldValueService:
         return bool(meta["has_blob"])
 
     def blob_size(self, track_id: int, field_def_id: int) -> int:
+        # length() is answered from the record header, so rows saved before size_bytes was
+        # tracked still report a size without reading the payload.
         row = self.conn.execute(
-            "SELECT size_bytes FROM CustomFieldValues WHERE track_id=? AND field_def_id=?",
+            """
+            SELECT COALESCE(NULLIF(size_bytes, 0), length(blob_value), 0)
+            FROM CustomFieldValues
+            WHERE track_id=? AND field_def_id=?
+            """,
             (int(track_id), int(field_def_id)),
         ).fetchone()
         return int(row[0] or 0) if row else 0
 
     def fetch_blob(self, track_id: int, field_def_id: int):
-        row = self._fetch_blob_row(track_id, field_def_id)
+        row = self._fetch_blob_row(track_id, field_def_id, include_payload=True)
         if not row:
             raise FileNotFoundError("No file stored for this field.")
         _, blob_value, managed_file_path, storage_mode, filename, _, mime_type = row
@@ -912,6 +986,61 @@ class CustomFieldValueService:
             raise FileNotFoundError("No file stored for this field.")
         return bytes_from_blob(blob_value), mime_type
 
+    def export_blob_to_path(
+        self,
+        track_id: int,
+        field_def_id: int,
+        dest_path: str | Path,
+        *,
+        chunk_size: int = BLOB_IO_CHUNK_SIZE,
+    ) -> str | None:
+        """Write a stored file to ``dest_path`` without holding the whole payload in memory."""
+
+        row = self.conn.execute(
+            """
+            SELECT
+                rowid,
+                CASE WHEN blob_value IS NOT NULL THEN 1 END,
+                managed_file_path,
+                storage_mode,
+                filename,
+                mime_type
+            FROM CustomFieldValues
+            WHERE track_id=? AND field_def_id=?
+            """,
+            (int(track_id), int(field_def_id)),
+        ).fetchone()
+        if not row:
+            raise FileNotFoundError("No file stored for this field.")
+        rowid, has_blob, managed_file_path, storage_mode, filename, mime_type = row
+        effective_mode = infer_storage_mode(
+            explicit_mode=storage_mode,
+            stored_path=managed_file_path,
+            blob_value=has_blob,
+        )
+        target = Path(dest_path)
+        if effective_mode == STORAGE_MODE_MANAGED_FILE:
+            resolved = self._resolve_managed_path(managed_file_path)
+            if resolved is None or not resolved.exists():
+                raise FileNotFoundError(
+                    managed_file_path or filename or "managed custom field file"
+                )
+            shutil.copyfile(resolved, target)
+            return mime_type
+        if has_blob is None:
+            raise FileNotFoundError("No file stored for this field.")
+        blobopen = getattr(self.conn, "blobopen", None)
+        if blobopen is None:
+            data, _mime = self.fetch_blob(track_id, field_def_id)
+            target.write_bytes(data)
+            return mime_type
+        # Incremental BLOB I/O keeps memory at one chunk however large the stored audio is.
+        with blobopen("CustomFieldValues", "blob_value", rowid, readonly=True) as blob:
+            with target.open("wb") as handle:
+                while chunk := blob.read(max(1, int(chunk_size))):
+                    handle.write(chunk)
+        return mime_type
+
     def convert_storage_mode(
         self,
         track_id: int,
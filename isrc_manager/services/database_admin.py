@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+import os
 import re
 import shutil
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Callable
 
+from .sqlite_utils import safe_wal_checkpoint
+
+# SQLite names its companions "<db>-wal", "<db>-shm" and "<db>-journal" (see
+# HistoryManager.DATABASE_ARTIFACT_COMPANION_SUFFIXES).
+_COMPANION_SUFFIXES = ("-wal", "-shm", "-journal")
+# Pages copied per Online Backup step when progress is reported (4 MiB at the default page size).
+BACKUP_PAGES_PER_STEP = 1024
+# Upper bound on free pages released by one incremental vacuum pass.
+INCREMENTAL_VACUUM_PAGES = 1000
+_AUTO_VACUUM_INCREMENTAL = 2
+
 
 @dataclass(slots=True)
 class BackupResult:
@@ -17,6 +30,12 @@ class BackupResult:
     method: str
 
 
+@dataclass(slots=True)
+class CompactionResult:
+    method: str
+    freed_pages: int
+
+
 @dataclass(slots=True)
 class RestoreResult:
     restored_path: Path
@@ -74,6 +93,8 @@ class DatabaseMaintenanceService:
         *,
         close_connection: Callable[[], None] | None = None,
         reopen_connection: Callable[[], None] | None = None,
+        prefer_vacuum: bool = False,
+        progress_callback: Callable[[int, int, str], None] | None = None,
     ) -> BackupResult:
         src = Path(src_path)
         if not src.exists():
@@ -87,50 +108,246 @@ class DatabaseMaintenanceService:
             conn.commit()
         except Exception:
             pass
-
+        # Fold committed WAL frames into the main file so the copy reads plain pages.
         try:
+            safe_wal_checkpoint(conn, mode="TRUNCATE")
+        except Exception:
+            pass
+
+        integrity: str | None = None
+
+        def _backup_api() -> None:
+            nonlocal integrity
             backup_conn = sqlite3.connect(str(dst))
             try:
-                conn.backup(backup_conn)
+                # The destination is a fresh file that is verified and discarded on failure, so
+                # the copy skips journaling and per-commit syncs; one fsync follows below.
+                backup_conn.execute("PRAGMA journal_mode=OFF")
+                backup_conn.execute("PRAGMA synchronous=OFF")
+                self._preallocate_database(backup_conn, dst, src.stat().st_size)
+                if callable(progress_callback):
+
+                    def _report_pages(_status: int, remaining: int, total: int) -> None:
+                        progress_callback(
+                            total - remaining,
+                            total,
+                            f"Copied {total - remaining} of {total} database pages.",
+                        )
+
+                    conn.backup(backup_conn, pages=BACKUP_PAGES_PER_STEP, progress=_report_pages)
+                else:
+                    conn.backup(backup_conn)
                 backup_conn.commit()
+                # Check through the connection that just wrote the pages while its cache is warm.
+                integrity = self.verify_integrity(dst, quick=True, conn=backup_conn)
             finally:
                 backup_conn.close()
-            method = "backup_api"
-        except Exception as backup_error:
+            with dst.open("r+b") as handle:
+                os.fsync(handle.fileno())
+
+        def _vacuum_into() -> None:
+            conn.execute(f"VACUUM INTO '{dst.as_posix()}'")
+
+        # VACUUM INTO writes a defragmented, usually smaller file but rebuilds every table and
+        # index, so it only goes first when the caller opts in.
+        strategies = [
+            ("backup_api", "backup API", _backup_api),
+            ("vacuum_into", "VACUUM INTO", _vacuum_into),
+        ]
+        if prefer_vacuum:
+            strategies.reverse()
+
+        method = None
+        failures: list[str] = []
+        last_error: Exception | None = None
+        for strategy_method, strategy_label, strategy in strategies:
             try:
-                conn.execute(f"VACUUM INTO '{dst.as_posix()}'")
-                method = "vacuum_into"
-            except Exception as vacuum_error:
-                if close_connection is None or reopen_connection is None:
-                    raise RuntimeError(
-                        f"Backup failed using backup API ({backup_error}) and VACUUM INTO ({vacuum_error})"
-                    ) from vacuum_error
-                close_connection()
-                try:
-                    shutil.copy2(src, dst)
-                    for ext in (".wal", ".shm"):
-                        companion = src.with_suffix(src.suffix + ext)
-                        if companion.exists():
-                            shutil.copy2(companion, dst.with_suffix(dst.suffix + ext))
-                    method = "file_copy"
-                finally:
-                    reopen_connection()
-
-        integrity = self.verify_integrity(dst)
+                strategy()
+            except Exception as exc:
+                failures.append(f"{strategy_label} ({exc})")
+                last_error = exc
+                # VACUUM INTO refuses to overwrite, so drop any partial file before the next try.
+                dst.unlink(missing_ok=True)
+                continue
+            method = strategy_method
+            break
+
+        if method is None:
+            if close_connection is None or reopen_connection is None:
+                raise RuntimeError("Backup failed using " + " and ".join(failures)) from last_error
+            close_connection()
+            try:
+                self._copy_file_with_companions(src, dst)
+                method = "file_copy"
+            finally:
+                reopen_connection()
+
+        if integrity is None:
+            # A file copy may carry WAL frames that an immutable open would ignore.
+            integrity = self.verify_integrity(dst, quick=True, immutable=method != "file_copy")
         if integrity.lower() != "ok":
             raise RuntimeError(f"Integrity check failed for backup: {integrity}")
         return BackupResult(backup_path=dst, method=method)
 
-    def verify_integrity(self, db_path: str | Path) -> str:
-        conn = sqlite3.connect(str(db_path))
+    @staticmethod
+    def _copy_file_with_companions(source_path: Path, target_path: Path) -> None:
+        # shutil.copy2 already takes the kernel fast path where one exists (copy_file_range
+        # or sendfile on Linux, fcopyfile on macOS), so no hand-rolled copy loop is needed.
+        copies = [(source_path, target_path)]
+        for ext in _COMPANION_SUFFIXES:
+            companion = source_path.with_name(source_path.name + ext)
+            if companion.exists():
+                copies.append((companion, target_path.with_name(target_path.name + ext)))
+        if len(copies) == 1:
+            shutil.copy2(source_path, target_path)
+            return
+        # The companions are small, so copying them alongside the main file hides their cost.
+        with ThreadPoolExecutor(
+            max_workers=len(copies),
+            thread_name_prefix="db-file-copy",
+        ) as executor:
+            futures = [executor.submit(shutil.copy2, source, target) for source, target in copies]
+        for future in futures:
+            future.result()
+
+    @staticmethod
+    def _preallocate_database(conn: sqlite3.Connection, path: Path, size: int) -> None:
+        # Reserving the final size up front lets the filesystem hand out contiguous extents
+        # instead of growing the file page by page. SQLite rejects a non-empty file without a
+        # valid header, so page 1 is written first; the backup truncates any excess when done.
+        if not hasattr(os, "posix_fallocate") or size <= 0:
+            return
+        conn.execute("PRAGMA user_version=0")
+        conn.commit()
+        try:
+            fd = os.open(path, os.O_RDWR)
+        except OSError:
+            return
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _copy_with_backup_api(source_path: Path, target_path: Path) -> None:
+        # pages=-1 copies every page in one step through SQLite's pager, so the target
+        # is a consistent single file without separate WAL/SHM companions.
+        source_conn = sqlite3.connect(str(source_path))
+        try:
+            target_conn = sqlite3.connect(str(target_path))
+            try:
+                DatabaseMaintenanceService._preallocate_database(
+                    target_conn, target_path, source_path.stat().st_size
+                )
+                source_conn.backup(target_conn, pages=-1)
+                target_conn.commit()
+            finally:
+                target_conn.close()
+        finally:
+            source_conn.close()
+
+    def verify_integrity(
+        self,
+        db_path: str | Path,
+        *,
+        quick: bool = False,
+        conn: sqlite3.Connection | None = None,
+        immutable: bool = False,
+        read_only: bool = False,
+    ) -> str:
+        owns_connection = conn is None
+        if conn is None:
+            if immutable:
+                # Only for private copies nobody else has open: SQLite skips locking, ignores
+                # any WAL and never creates journal or WAL index files for the check.
+                uri = Path(db_path).resolve().as_uri() + "?mode=ro&immutable=1"
+                conn = sqlite3.connect(uri, uri=True)
+            elif read_only:
+                # Sees the file the way the app will open it, WAL and locks included.
+                uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+                conn = sqlite3.connect(uri, uri=True)
+            else:
+                conn = sqlite3.connect(str(db_path))
         try:
             try:
-                row = conn.execute("PRAGMA integrity_check").fetchone()
+                # quick_check skips the index-vs-table cross scan; backup and restore use it
+                # for their sanity passes while user-initiated checks keep the full scan.
+                pragma = "quick_check" if quick else "integrity_check"
+                row = conn.execute(f"PRAGMA {pragma}").fetchone()
             except sqlite3.DatabaseError as exc:
                 return f"database error: {exc}"
             return row[0] if row else "unknown"
         finally:
-            conn.close()
+            if owns_connection:
+                conn.close()
+
+    def maintain_database(
+        self,
+        conn: sqlite3.Connection,
+        db_path: str | Path,
+        *,
+        pages: int = INCREMENTAL_VACUUM_PAGES,
+        close_connection: Callable[[], None] | None = None,
+        reopen_connection: Callable[[], None] | None = None,
+    ) -> CompactionResult:
+        """Release free pages without holding writers off for a full in-place VACUUM.
+
+        Databases created with ``auto_vacuum=INCREMENTAL`` give back at most ``pages`` free
+        pages per call. Other databases are compacted with ``VACUUM INTO`` a sibling file that
+        replaces the original while the caller's connection is closed; every other connection
+        to the file must already be closed.
+        """
+        path = Path(db_path)
+        if not path.exists():
+            raise FileNotFoundError(path)
+        try:
+            conn.commit()
+        except Exception:
+            pass
+        free_before = int(conn.execute("PRAGMA freelist_count").fetchone()[0])
+        auto_vacuum = int(conn.execute("PRAGMA auto_vacuum").fetchone()[0])
+        if auto_vacuum == _AUTO_VACUUM_INCREMENTAL:
+            # incremental_vacuum frees one page per VM step; Connection.execute stops after the
+            # first step for row-less statements, while executescript runs it to completion.
+            conn.executescript(f"PRAGMA incremental_vacuum({max(1, int(pages))});")
+            free_after = int(conn.execute("PRAGMA freelist_count").fetchone()[0])
+            return CompactionResult(
+                method="incremental_vacuum",
+                freed_pages=max(0, free_before - free_after),
+            )
+
+        if close_connection is None or reopen_connection is None:
+            raise RuntimeError(
+                "Compacting a database without incremental auto-vacuum requires "
+                "closing and reopening its connection."
+            )
+        compacted = path.with_name(path.name + ".compact.tmp")
+        compacted.unlink(missing_ok=True)
+        try:
+            conn.execute(f"VACUUM INTO '{compacted.as_posix()}'")
+            integrity = self.verify_integrity(compacted, quick=True, immutable=True)
+            if integrity.lower() != "ok":
+                raise RuntimeError(f"Integrity check failed for compacted copy: {integrity}")
+            close_connection()
+            try:
+                # SQLite removes the WAL when its last connection closes. One left behind means
+                # another connection is still open and would replay stale frames onto the copy.
+                wal_path = path.with_name(path.name + "-wal")
+                if wal_path.exists():
+                    raise RuntimeError(
+                        f"Refusing to replace {path.name} while another connection still has "
+                        f"it open ({wal_path.name} is present)."
+                    )
+                compacted.replace(path)
+                for ext in _COMPANION_SUFFIXES:
+                    path.with_name(path.name + ext).unlink(missing_ok=True)
+            finally:
+                reopen_connection()
+        finally:
+            compacted.unlink(missing_ok=True)
+        return CompactionResult(method="vacuum_into", freed_pages=free_before)
 
     def restore_database(
         self, backup_path: str | Path, current_db_path: str | Path
@@ -139,26 +356,12 @@ class DatabaseMaintenanceService:
         dst = Path(current_db_path)
         if not src.exists():
             raise FileNotFoundError(src)
-        source_integrity = self.verify_integrity(src)
+        source_integrity = self.verify_integrity(src, quick=True)
         if source_integrity.lower() != "ok":
             raise RuntimeError(f"Integrity check failed for selected backup: {source_integrity}")
 
-        safety_copy_path = None
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        try:
-            pre_restore_dir = self.backups_dir / "pre_restore"
-            pre_restore_dir.mkdir(parents=True, exist_ok=True)
-            safety_copy_path = pre_restore_dir / f"{dst.stem}_pre_restore_{timestamp}.db"
-            if dst.exists():
-                shutil.copy2(dst, safety_copy_path)
-                for ext in (".wal", ".shm"):
-                    companion = dst.with_suffix(dst.suffix + ext)
-                    if companion.exists():
-                        shutil.copy2(
-                            companion, safety_copy_path.with_suffix(safety_copy_path.suffix + ext)
-                        )
-        except Exception:
-            safety_copy_path = None
+        safety_copy_path = self._create_pre_restore_copy(dst, timestamp)
 
         staged_restore = dst.with_suffix(dst.suffix + f".restore_{timestamp}.tmp")
         if staged_restore.exists():
@@ -166,22 +369,13 @@ class DatabaseMaintenanceService:
 
         try:
             try:
-                src_conn = sqlite3.connect(str(src))
-                try:
-                    staged_conn = sqlite3.connect(str(staged_restore))
-                    try:
-                        src_conn.backup(staged_conn)
-                        staged_conn.commit()
-                    finally:
-                        staged_conn.close()
-                finally:
-                    src_conn.close()
+                self._copy_with_backup_api(src, staged_restore)
             except Exception:
                 if staged_restore.exists():
                     staged_restore.unlink()
                 shutil.copy2(src, staged_restore)
 
-            integrity = self.verify_integrity(staged_restore)
+            integrity = self.verify_integrity(staged_restore, quick=True, immutable=True)
             if integrity.lower() != "ok":
                 raise RuntimeError(f"Integrity check failed after staging restore: {integrity}")
             staged_restore.replace(dst)
@@ -190,31 +384,40 @@ class DatabaseMaintenanceService:
                 staged_restore.unlink()
 
         try:
-            for ext in (".wal", ".shm"):
-                stale = dst.with_suffix(dst.suffix + ext)
-                if stale.exists():
-                    try:
-                        stale.unlink()
-                    except Exception:
-                        pass
+            for ext in _COMPANION_SUFFIXES:
+                try:
+                    dst.with_name(dst.name + ext).unlink(missing_ok=True)
+                except Exception:
+                    pass
 
-            integrity = self.verify_integrity(dst)
+            # dst is the live profile path, so it is not opened immutable.
+            integrity = self.verify_integrity(dst, quick=True, read_only=True)
             if integrity.lower() != "ok":
                 raise RuntimeError(f"Integrity check failed after restore: {integrity}")
         except Exception:
             if safety_copy_path is not None and safety_copy_path.exists():
                 shutil.copy2(safety_copy_path, dst)
-                for ext in (".wal", ".shm"):
-                    original = safety_copy_path.with_suffix(safety_copy_path.suffix + ext)
-                    target = dst.with_suffix(dst.suffix + ext)
-                    if target.exists():
-                        try:
-                            target.unlink()
-                        except Exception:
-                            pass
+                for ext in _COMPANION_SUFFIXES:
+                    original = safety_copy_path.with_name(safety_copy_path.name + ext)
+                    target = dst.with_name(dst.name + ext)
+                    try:
+                        target.unlink(missing_ok=True)
+                    except Exception:
+                        pass
                     if original.exists():
                         shutil.copy2(original, target)
             raise
         return RestoreResult(
             restored_path=dst, integrity_result=integrity, safety_copy_path=safety_copy_path
         )
+
+    def _create_pre_restore_copy(self, dst: Path, timestamp: str) -> Path | None:
+        try:
+            pre_restore_dir = self.backups_dir / "pre_restore"
+            pre_restore_dir.mkdir(parents=True, exist_ok=True)
+            safety_copy_path = pre_restore_dir / f"{dst.stem}_pre_restore_{timestamp}.db"
+            if dst.exists():
+                self._copy_file_with_companions(dst, safety_copy_path)
+        except Exception:
+            return None
+        return safety_copy_path
@@ -17,6 +17,12 @@ from .database_security import (
 
 SQLITE_TIMEOUT_SECONDS = 30.0
 SQLITE_BUSY_TIMEOUT_MS = 30_000
+# sqlite3 keeps this many prepared statements per connection (the stdlib default is 128).
+SQLITE_CACHED_STATEMENTS = 256
+# Page cache budget per connection in KiB (applied as a negative cache_size).
+SQLITE_CACHE_SIZE_KIB = 64 * 1024
+# Maximum bytes of the database file SQLite may memory-map for reads.
+SQLITE_MMAP_SIZE_BYTES = 256 * 1024 * 1024
 
 
 def configure_sqlite_connection(
@@ -34,6 +40,10 @@ def configure_sqlite_connection(
     conn.execute(f"PRAGMA journal_mode = {clean_journal_mode}")
     conn.execute("PRAGMA synchronous = NORMAL")
     conn.execute(f"PRAGMA busy_timeout = {max(1, int(busy_timeout_ms))}")
+    # Large catalog refreshes and media BLOB reads stay in memory instead of re-reading pages.
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute(f"PRAGMA cache_size = -{int(SQLITE_CACHE_SIZE_KIB)}")
+    conn.execute(f"PRAGMA mmap_size = {int(SQLITE_MMAP_SIZE_BYTES)}")
     return conn
 
 
@@ -48,6 +58,7 @@ class SQLiteConnectionFactory:
 
     timeout_seconds: float = SQLITE_TIMEOUT_SECONDS
     busy_timeout_ms: int = SQLITE_BUSY_TIMEOUT_MS
+    cached_statements: int = SQLITE_CACHED_STATEMENTS
     password_provider: DatabasePasswordProvider | None = None
 
     def open(self, path: str | Path) -> sqlite3.Connection:
@@ -73,7 +84,11 @@ class SQLiteConnectionFactory:
             raise DatabasePasswordRequiredError(
                 "This profile database is encrypted and requires a password."
             )
-        conn = sqlite3.connect(str(db_path), timeout=float(self.timeout_seconds))
+        conn = sqlite3.connect(
+            str(db_path),
+            timeout=float(self.timeout_seconds),
+            cached_statements=max(0, int(self.cached_statements)),
+        )
         return configure_sqlite_connection(conn, busy_timeout_ms=self.busy_timeout_ms)
 
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
 from datetime import datetime
 from pathlib import Path
 
@@ -11,6 +10,64 @@ from isrc_manager.domain.timecode import seconds_to_hms
 
 from .track_artist_sql import track_additional_artists_expr, track_main_artist_join_sql
 
+_XML_DECLARATION = b'<?xml version="1.0" encoding="utf-8"?>\n'
+_XML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+_XML_ATTR_ESCAPE_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "\n": "&#10;",
+        "\r": "&#13;",
+        "\t": "&#09;",
+    }
+)
+
+
+def _xml_tags(tag: str) -> tuple[bytes, bytes]:
+    return f"<{tag}>".encode("ascii"), f"</{tag}>".encode("ascii")
+
+
+def _xml_escape(value: str) -> str:
+    return value.translate(_XML_ESCAPE_TABLE)
+
+
+def _xml_text(value) -> bytes:
+    return _xml_escape(str(value)).encode("utf-8")
+
+
+def _xml_attr(value) -> bytes:
+    return str(value).translate(_XML_ATTR_ESCAPE_TABLE).encode("utf-8")
+
+
+_SELECTED_TRACK_TAGS = tuple(
+    _xml_tags(tag)
+    for tag in (
+        "ISRC",
+        "DBEntryDate",
+        "Title",
+        "MainArtist",
+        "AdditionalArtists",
+        "Album",
+        "ReleaseDate",
+        "TrackLength",
+        "ISWC",
+        "UPCEAN",
+        "Genre",
+        "CatalogNumber",
+        "BUMAWorkNumber",
+        "AudioFileMimeType",
+        "AudioFileSizeBytes",
+        "AlbumArtMimeType",
+        "AlbumArtSizeBytes",
+    )
+)
+_TRACK_LENGTH_TAGS = _xml_tags("TrackLength")
+_MIME_TYPE_TAGS = _xml_tags("MimeType")
+_SIZE_BYTES_TAGS = _xml_tags("SizeBytes")
+_VALUE_TAGS = _xml_tags("Value")
+
 
 class XMLExportService:
     """Centralizes full and selected-track XML exports."""
@@ -39,7 +96,10 @@ class XMLExportService:
         track_ids = [row[0] for row in rows]
         custom_by_track = self._fetch_custom_by_track(track_ids)
 
-        root = ET.Element("DeclarationOfSoundRecordingRightsClaimMessage")
+        parts = [_XML_DECLARATION, b"<DeclarationOfSoundRecordingRightsClaimMessage>"]
+        append = parts.append
+        column_tags = [_xml_tags(col) for col in cols]
+        length_index = cols.index("track_length_sec")
         total_rows = max(len(rows), 1)
         for index, row in enumerate(rows, start=1):
             self._report_progress(
@@ -47,20 +107,23 @@ class XMLExportService:
                 10 + int(((index - 1) / total_rows) * 75),
                 f"Writing XML tracks ({index} of {total_rows})...",
             )
-            item = ET.SubElement(root, "SoundRecording")
-            row_dict = dict(zip(cols, row))
-            for col in cols:
-                if col == "track_length_sec":
-                    ET.SubElement(item, "TrackLength").text = seconds_to_hms(
-                        int(row_dict[col] or 0)
-                    )
-                sub = ET.SubElement(item, col)
-                sub.text = "" if row_dict[col] is None else str(row_dict[col])
-
-            self._append_custom_fields(item, custom_by_track.get(row_dict["id"], []))
+            append(b"<SoundRecording>")
+            for position, ((open_tag, close_tag), value) in enumerate(zip(column_tags, row)):
+                if position == length_index:
+                    append(_TRACK_LENGTH_TAGS[0])
+                    append(_xml_text(seconds_to_hms(int(value or 0))))
+                    append(_TRACK_LENGTH_TAGS[1])
+                append(open_tag)
+                if value is not None:
+                    append(_xml_text(value))
+                append(close_tag)
+
+            self._append_custom_fields(append, custom_by_track.get(row[0], []))
+            append(b"</SoundRecording>")
+        append(b"</DeclarationOfSoundRecordingRightsClaimMessage>")
 
         self._report_progress(progress_callback, 90, "Writing XML export file...")
-        self._write_xml(path, root)
+        self._write_xml(path, parts)
         return len(rows)
 
     def export_selected(
@@ -75,12 +138,15 @@ class XMLExportService:
         _, rows = self._fetch_base_rows(track_ids)
         custom_by_track = self._fetch_custom_by_track(track_ids)
 
-        root = ET.Element("ISRCExport")
-        meta = ET.SubElement(root, "Meta")
-        ET.SubElement(meta, "CreatedAt").text = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-        ET.SubElement(meta, "ProfileDB").text = str(current_db_path)
-
-        tracks_element = ET.SubElement(root, "Tracks")
+        parts = [
+            _XML_DECLARATION,
+            b"<ISRCExport><Meta><CreatedAt>",
+            _xml_text(datetime.now().strftime("%Y-%m-%dT%H:%M:%S")),
+            b"</CreatedAt><ProfileDB>",
+            _xml_text(current_db_path),
+            b"</ProfileDB></Meta><Tracks>",
+        ]
+        append = parts.append
         total_rows = max(len(rows), 1)
         for index, (
             tid,
@@ -107,31 +173,39 @@ class XMLExportService:
                 10 + int(((index - 1) / total_rows) * 75),
                 f"Writing selected XML tracks ({index} of {total_rows})...",
             )
-            track = ET.SubElement(tracks_element, "Track", id=str(tid))
-            ET.SubElement(track, "ISRC").text = (
-                to_iso_isrc(isrc) or to_compact_isrc(isrc) or (isrc or "")
+            values = (
+                to_iso_isrc(isrc) or to_compact_isrc(isrc) or (isrc or ""),
+                db_entry_date or "",
+                title or "",
+                artist or "",
+                addl or "",
+                album or "",
+                release_date or "",
+                seconds_to_hms(int(track_length_sec or 0)),
+                iswc or "",
+                upc or "",
+                genre or "",
+                catalog_number or "",
+                buma_work_number or "",
+                audio_file_mime_type or "",
+                str(int(audio_file_size_bytes or 0)),
+                album_art_mime_type or "",
+                str(int(album_art_size_bytes or 0)),
             )
-            ET.SubElement(track, "DBEntryDate").text = db_entry_date or ""
-            ET.SubElement(track, "Title").text = title or ""
-            ET.SubElement(track, "MainArtist").text = artist or ""
-            ET.SubElement(track, "AdditionalArtists").text = addl or ""
-            ET.SubElement(track, "Album").text = album or ""
-            ET.SubElement(track, "ReleaseDate").text = release_date or ""
-            ET.SubElement(track, "TrackLength").text = seconds_to_hms(int(track_length_sec or 0))
-            ET.SubElement(track, "ISWC").text = iswc or ""
-            ET.SubElement(track, "UPCEAN").text = upc or ""
-            ET.SubElement(track, "Genre").text = genre or ""
-            ET.SubElement(track, "CatalogNumber").text = catalog_number or ""
-            ET.SubElement(track, "BUMAWorkNumber").text = buma_work_number or ""
-            ET.SubElement(track, "AudioFileMimeType").text = audio_file_mime_type or ""
-            ET.SubElement(track, "AudioFileSizeBytes").text = str(int(audio_file_size_bytes or 0))
-            ET.SubElement(track, "AlbumArtMimeType").text = album_art_mime_type or ""
-            ET.SubElement(track, "AlbumArtSizeBytes").text = str(int(album_art_size_bytes or 0))
-
-            self._append_custom_fields(track, custom_by_track.get(tid, []))
+            append(b'<Track id="')
+            append(_xml_attr(tid))
+            append(b'">')
+            for (open_tag, close_tag), text in zip(_SELECTED_TRACK_TAGS, values):
+                append(open_tag)
+                append(_xml_text(text))
+                append(close_tag)
+
+            self._append_custom_fields(append, custom_by_track.get(tid, []))
+            append(b"</Track>")
+        append(b"</Tracks></ISRCExport>")
 
         self._report_progress(progress_callback, 90, "Writing selected XML export file...")
-        self._write_xml(path, root)
+        self._write_xml(path, parts)
         return len(rows)
 
     def _fetch_base_rows(self, track_ids: list[int] | None = None):
@@ -271,24 +345,31 @@ class XMLExportService:
         return custom_by_track
 
     @staticmethod
-    def _append_custom_fields(parent, custom_values: list[dict]) -> None:
-        custom_fields = ET.SubElement(parent, "CustomFields")
+    def _append_custom_fields(append, custom_values: list[dict]) -> None:
+        append(b"<CustomFields>")
         for custom in custom_values:
-            field = ET.SubElement(
-                custom_fields,
-                "Field",
-                name=custom["name"],
-                type=custom["field_type"],
-            )
+            append(b'<Field name="')
+            append(_xml_attr(custom["name"]))
+            append(b'" type="')
+            append(_xml_attr(custom["field_type"]))
+            append(b'">')
             if custom["field_type"] in ("blob_image", "blob_audio"):
                 if custom.get("mime_type"):
-                    ET.SubElement(field, "MimeType").text = custom["mime_type"]
-                ET.SubElement(field, "SizeBytes").text = str(int(custom.get("size_bytes", 0)))
+                    append(_MIME_TYPE_TAGS[0])
+                    append(_xml_text(custom["mime_type"]))
+                    append(_MIME_TYPE_TAGS[1])
+                append(_SIZE_BYTES_TAGS[0])
+                append(str(int(custom.get("size_bytes", 0))).encode("ascii"))
+                append(_SIZE_BYTES_TAGS[1])
             else:
-                ET.SubElement(field, "Value").text = custom["value"] or ""
+                append(_VALUE_TAGS[0])
+                append(_xml_text(custom["value"] or ""))
+                append(_VALUE_TAGS[1])
+            append(b"</Field>")
+        append(b"</CustomFields>")
 
     @staticmethod
-    def _write_xml(path: str | Path, root) -> None:
+    def _write_xml(path: str | Path, parts: list[bytes]) -> None:
         output_path = Path(path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        ET.ElementTree(root).write(output_path, encoding="utf-8", xml_declaration=True)
+        output_path.write_bytes(b"".join(parts))
@@ -24,10 +24,45 @@ from isrc_manager.works import WorkService
 from .custom_fields import CustomFieldDefinitionService
 from .import_governance import GovernedImportCoordinator
 from .import_repair_queue import TrackImportRepairQueueService
+from .sqlite_utils import bulk_write_transaction
 from .tracks import TrackCreatePayload, TrackService
 
 PROMOTED_TEXT_CUSTOM_FIELDS = promoted_text_value_columns_by_label_lower()
 
+_FULL_RECORD_TAGS = frozenset(
+    {
+        "isrc",
+        "track_title",
+        "artist_name",
+        "additional_artists",
+        "album_title",
+        "release_date",
+        "iswc",
+        "upc",
+        "genre",
+        "tracklength",
+        "catalog_number",
+        "buma_work_number",
+    }
+)
+_SELECTED_RECORD_TAGS = frozenset(
+    {
+        "isrc",
+        "title",
+        "mainartist",
+        "additionalartists",
+        "album",
+        "releasedate",
+        "iswc",
+        "upcean",
+        "upc",
+        "genre",
+        "tracklength",
+        "catalognumber",
+        "bumaworknumber",
+    }
+)
+
 
 @dataclass(slots=True)
 class ImportRecord:
@@ -45,6 +80,7 @@ class ImportRecord:
     catalog_number: str | None
     buma_work_number: str | None
     custom_fields: list[dict]
+    is_duplicate: bool = False
 
 
 @dataclass(slots=True)
@@ -121,11 +157,8 @@ class XMLImportService:
         )
 
     def inspect_file(self, file_path: str) -> ImportInspection:
-        schema, records, invalid_count = self._parse_file(file_path)
+        schema, records, invalid_count, duplicate_count = self._parse_file(file_path)
         missing_specs, conflicting = self._inspect_custom_field_requirements(records)
-        duplicate_count = sum(
-            1 for record in records if self.track_service.is_isrc_taken_normalized(record.iso_isrc)
-        )
         return ImportInspection(
             file_path=file_path,
             schema=schema,
@@ -217,8 +250,7 @@ class XMLImportService:
         duplicate_count = 0
         error_count = 0
 
-        self.conn.execute("BEGIN")
-        try:
+        with bulk_write_transaction(self.conn):
             cur = self.conn.cursor()
             if create_missing_custom_fields:
                 self.ensure_missing_custom_fields(inspection, cursor=cur)
@@ -228,8 +260,9 @@ class XMLImportService:
                 for field in self.custom_fields.list_active_fields()
             }
 
+            imported_isrcs: set[str] = set()
             for row_index, record in enumerate(inspection.records, start=1):
-                if self.track_service.is_isrc_taken_normalized(record.iso_isrc):
+                if record.is_duplicate or record.comp_isrc in imported_isrcs:
                     duplicate_count += 1
                     continue
 
@@ -257,6 +290,9 @@ class XMLImportService:
                     )
                     track_id = int(result.track_id)
 
+                    # The track row is brand new, so no stored values can conflict; keying by
+                    # field id keeps the last value when a record repeats a field.
+                    custom_values: dict[int, str] = {}
                     for custom in record.custom_fields:
                         if not custom["name"] or not custom["type"]:
                             continue
@@ -274,7 +310,9 @@ class XMLImportService:
                         field_id = name_to_id.get((custom["name"], custom["type"]))
                         if not field_id:
                             continue
-                        cur.execute(
+                        custom_values[int(field_id)] = custom.get("value") or ""
+                    if custom_values:
+                        cur.executemany(
                             """
                             INSERT INTO CustomFieldValues (
                                 track_id,
@@ -288,20 +326,17 @@ class XMLImportService:
                                 size_bytes
                             )
                             VALUES (?, ?, ?, NULL, '', '', '', '', 0)
-                            ON CONFLICT(track_id, field_def_id) DO UPDATE SET
-                                value=excluded.value,
-                                blob_value=NULL,
-                                managed_file_path=excluded.managed_file_path,
-                                storage_mode=excluded.storage_mode,
-                                filename=excluded.filename,
-                                mime_type=excluded.mime_type,
-                                size_bytes=excluded.size_bytes
                             """,
-                            (track_id, field_id, custom.get("value") or ""),
+                            [
+                                (track_id, field_id, value)
+                                for field_id, value in custom_values.items()
+                            ],
                         )
 
                     self.conn.execute("RELEASE SAVEPOINT row_import")
                     inserted += 1
+                    if record.comp_isrc:
+                        imported_isrcs.add(record.comp_isrc)
                 except Exception as exc:
                     self.conn.execute("ROLLBACK TO SAVEPOINT row_import")
                     self.conn.execute("RELEASE SAVEPOINT row_import")
@@ -321,10 +356,6 @@ class XMLImportService:
                             )
                         )
                     )
-            self.conn.commit()
-        except Exception:
-            self.conn.rollback()
-            raise
 
         return ImportExecutionResult(
             inserted=inserted,
@@ -385,7 +416,7 @@ class XMLImportService:
             return tag.split("}", 1)[1]
         return tag
 
-    def _parse_file(self, file_path: str) -> tuple[str, list[ImportRecord], int]:
+    def _parse_file(self, file_path: str) -> tuple[str, list[ImportRecord], int, int]:
         try:
             tree = ET.parse(file_path)
             root = tree.getroot()
@@ -422,37 +453,40 @@ class XMLImportService:
 
         parsed_records: list[ImportRecord] = []
         invalid_count = 0
+        duplicate_count = 0
+        taken_isrcs = self.track_service.taken_compact_isrcs()
 
+        wanted_tags = _FULL_RECORD_TAGS if schema == "full" else _SELECTED_RECORD_TAGS
         for record in records:
-            child_map = self._lower_map(record)
+            values = self._wanted_child_texts(record, wanted_tags)
             customs = self._parse_custom_fields(record)
 
             if schema == "full":
-                isrc_raw = self._get_any(child_map, "isrc")
-                title = self._get_any(child_map, "track_title")
-                artist = self._get_any(child_map, "artist_name")
-                additional = self._get_any(child_map, "additional_artists")
-                album = self._get_any(child_map, "album_title")
-                release_date = self._get_any(child_map, "release_date")
-                iswc_raw = self._get_any(child_map, "iswc")
-                upc = self._get_any(child_map, "upc")
-                genre = self._get_any(child_map, "genre")
-                track_length = self._get_any(child_map, "tracklength")
-                catalog_number = self._get_any(child_map, "catalog_number")
-                buma_work_number = self._get_any(child_map, "buma_work_number")
+                isrc_raw = values.get("isrc", "")
+                title = values.get("track_title", "")
+                artist = values.get("artist_name", "")
+                additional = values.get("additional_artists", "")
+                album = values.get("album_title", "")
+                release_date = values.get("release_date", "")
+                iswc_raw = values.get("iswc", "")
+                upc = values.get("upc", "")
+                genre = values.get("genre", "")
+                track_length = values.get("tracklength", "")
+                catalog_number = values.get("catalog_number", "")
+                buma_work_number = values.get("buma_work_number", "")
             else:
-                isrc_raw = self._get_any(child_map, "isrc")
-                title = self._get_any(child_map, "title")
-                artist = self._get_any(child_map, "mainartist")
-                additional = self._get_any(child_map, "additionalartists")
-                album = self._get_any(child_map, "album")
-                release_date = self._get_any(child_map, "releasedate")
-                iswc_raw = self._get_any(child_map, "iswc")
-                upc = self._get_any(child_map, "upcean", "upc")
-                genre = self._get_any(child_map, "genre")
-                track_length = self._get_any(child_map, "tracklength")
-                catalog_number = self._get_any(child_map, "catalognumber")
-                buma_work_number = self._get_any(child_map, "bumaworknumber")
+                isrc_raw = values.get("isrc", "")
+                title = values.get("title", "")
+                artist = values.get("mainartist", "")
+                additional = values.get("additionalartists", "")
+                album = values.get("album", "")
+                release_date = values.get("releasedate", "")
+                iswc_raw = values.get("iswc", "")
+                upc = values.get("upcean") or values.get("upc", "")
+                genre = values.get("genre", "")
+                track_length = values.get("tracklength", "")
+                catalog_number = values.get("catalognumber", "")
+                buma_work_number = values.get("bumaworknumber", "")
 
             raw_isrc = str(isrc_raw or "").strip()
             iso_isrc = ""
@@ -477,13 +511,10 @@ class XMLImportService:
             if release_date and not re.match(r"^\d{4}-\d{2}-\d{2}$", release_date):
                 release_date = None
 
-            track_length_sec = None
-            if track_length:
-                try:
-                    track_length_sec = parse_hms_text(track_length)
-                except Exception:
-                    track_length_sec = None
+            track_length_sec = parse_hms_text(track_length) if track_length else None
 
+            is_duplicate = bool(comp_isrc) and comp_isrc in taken_isrcs
+            duplicate_count += is_duplicate
             parsed_records.append(
                 ImportRecord(
                     iso_isrc=iso_isrc,
@@ -500,10 +531,11 @@ class XMLImportService:
                     catalog_number=catalog_number or None,
                     buma_work_number=buma_work_number or None,
                     custom_fields=customs,
+                    is_duplicate=is_duplicate,
                 )
             )
 
-        return schema, parsed_records, invalid_count
+        return schema, parsed_records, invalid_count, duplicate_count
 
     def ensure_missing_custom_fields(
         self,
@@ -605,21 +637,14 @@ class XMLImportService:
         return custom_fields
 
     @classmethod
-    def _lower_map(cls, element) -> dict[str, str]:
+    def _wanted_child_texts(cls, element, wanted: frozenset[str]) -> dict[str, str]:
         values = {}
         for child in element:
             key = cls._xml_local(child.tag or "").strip().lower()
-            values[key] = "" if child.text is None else child.text.strip()
+            if key in wanted:
+                values[key] = "" if child.text is None else child.text.strip()
         return values
 
-    @staticmethod
-    def _get_any(values: dict[str, str], *keys: str) -> str:
-        for key in keys:
-            value = values.get(key)
-            if value is not None and value != "":
-                return value
-        return ""
-
     @staticmethod
     def _exchange_supported_targets_hint() -> tuple[str, ...]:
         return (
@@ -742,6 +742,9 @@ class DatabaseSchemaService:
             elif version == 44:
                 self._apply_migration(44, self._mig_44_to_45)
                 version = 45
+            elif version == 45:
+                self._apply_migration(45, self._mig_45_to_46)
+                version = 46
             else:
                 self.logger.warning("Unknown migration path from version %s", version)
                 break
@@ -1683,6 +1686,17 @@ class DatabaseSchemaService:
     def _mig_44_to_45(self) -> None:
         self._ensure_invoicing_accounting_tables()
 
+    def _mig_45_to_46(self) -> None:
+        # Older writers left size_bytes at its default; persist the real length once so
+        # badge and meta reads never need to touch the payload.
+        if not {"blob_value", "size_bytes"} <= self._table_columns("CustomFieldValues"):
+            return
+        self.cursor.execute("""
+            UPDATE CustomFieldValues
+            SET size_bytes = length(blob_value)
+            WHERE blob_value IS NOT NULL AND COALESCE(size_bytes, 0) = 0
+            """)
+
     def _ensure_invoicing_accounting_tables(self) -> None:
         self.cursor.execute("""
             CREATE TABLE IF NOT EXISTS AccountingAccounts (
@@ -2789,10 +2803,9 @@ class DatabaseSchemaService:
                     f"ALTER TABLE CustomFieldValues ADD COLUMN {column_name} {column_sql}"
                 )
 
-        self.cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_cfvalues_track_field
-            ON CustomFieldValues(track_id, field_def_id)
-            """)
+        # The primary key already indexes (track_id, field_def_id), so a separate
+        # index on the same columns only adds write cost.
+        self.cursor.execute("DROP INDEX IF EXISTS idx_cfvalues_track_field")
         self.cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_cfvalues_field_track
             ON CustomFieldValues(field_def_id, track_id)
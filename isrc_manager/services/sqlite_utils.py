@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 
 _CHECKPOINT_MODES = {"PASSIVE", "FULL", "RESTART", "TRUNCATE"}
 
@@ -50,3 +52,37 @@ def safe_wal_checkpoint(
         return False
 
     return True
+
+
+@contextmanager
+def bulk_write_transaction(
+    conn: sqlite3.Connection,
+    *,
+    immediate: bool = False,
+    trace_callback: Callable[[str], object] | None = None,
+) -> Iterator[sqlite3.Connection]:
+    """Run a bulk write inside one explicit transaction on a hook-free connection.
+
+    Any statement trace callback is removed and the connection is switched to autocommit
+    mode for the duration, so the module neither calls back into Python nor manages
+    implicit transactions per statement. ``immediate`` takes the write lock up front
+    instead of on the first write. The previous isolation level is restored on exit.
+    sqlite3 cannot report the installed trace callback, so a caller that traces the
+    connection passes it as ``trace_callback`` to have it reinstalled on exit.
+    """
+
+    previous_isolation_level = conn.isolation_level
+    conn.set_trace_callback(None)
+    conn.isolation_level = None
+    try:
+        conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    finally:
+        conn.isolation_level = previous_isolation_level
+        conn.set_trace_callback(trace_callback)
@@ -667,15 +667,18 @@ class TrackService:
             return
         _main_column, additional_column = artist_columns
         cur.execute("DELETE FROM TrackArtists WHERE track_id=? AND role='additional'", (track_id,))
+        artist_ids: dict[int, None] = {}
         for name in names:
             try:
-                artist_id = self.get_or_create_artist(name, cursor=cur)
-                cur.execute(
-                    f"INSERT OR IGNORE INTO TrackArtists (track_id, {additional_column}, role) VALUES (?, ?, 'additional')",
-                    (track_id, artist_id),
-                )
+                artist_ids[self.get_or_create_artist(name, cursor=cur)] = None
             except ValueError:
                 pass
+        if not artist_ids:
+            return
+        cur.executemany(
+            f"INSERT OR IGNORE INTO TrackArtists (track_id, {additional_column}, role) VALUES (?, ?, 'additional')",
+            [(track_id, artist_id) for artist_id in artist_ids],
+        )
 
     def is_isrc_taken_normalized(
         self,
@@ -699,6 +702,15 @@ class TrackService:
             ).fetchone()
         return bool(row)
 
+    def taken_compact_isrcs(self, *, cursor: sqlite3.Cursor | None = None) -> set[str]:
+        cur = cursor or self.conn.cursor()
+        return {
+            str(row[0])
+            for row in cur.execute(
+                "SELECT isrc_compact FROM Tracks WHERE COALESCE(isrc_compact, '') != ''"
+            )
+        }
+
     def resolve_media_path(self, stored_path: str | None) -> Path | None:
         return self.media_store.resolve(stored_path)
 
@@ -18,6 +18,8 @@ TIB_IN_BYTES = GIB_IN_BYTES * 1024
 GIB_IN_MB = 1024
 TIB_IN_MB = GIB_IN_MB * 1024
 
+_STORAGE_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 _STORAGE_TEXT_RE = re.compile(
     r"^\s*(?P<number>\d+(?:[.,]\d+)?)\s*(?P<unit>mb?|gb?|tb?)?\s*$",
     re.IGNORECASE,
@@ -47,24 +49,12 @@ def bytes_to_megabytes_floor(size_bytes: int) -> int:
 
 def format_storage_bytes(size_bytes: int, *, max_decimals: int = 1) -> str:
     total = max(0, int(size_bytes or 0))
-    units = (
-        ("B", 1),
-        ("KB", KIB_IN_BYTES),
-        ("MB", MIB_IN_BYTES),
-        ("GB", GIB_IN_BYTES),
-        ("TB", TIB_IN_BYTES),
-    )
-    unit_label = "B"
-    divisor = 1
-    for label, candidate_divisor in units:
-        unit_label = label
-        divisor = candidate_divisor
-        if total < candidate_divisor * 1024 or label == "TB":
-            break
-    if unit_label == "B":
+    if total < KIB_IN_BYTES:
         return f"{total} B"
-    value = Decimal(total) / Decimal(divisor)
-    return f"{_format_decimal(value, max_decimals=max_decimals)} {unit_label}"
+    # Each binary unit step is 10 bits, so the bit length picks the unit directly.
+    unit_index = min((total.bit_length() - 1) // 10, len(_STORAGE_BYTE_UNITS) - 1)
+    value = Decimal(total) / Decimal(1 << (10 * unit_index))
+    return f"{_format_decimal(value, max_decimals=max_decimals)} {_STORAGE_BYTE_UNITS[unit_index]}"
 
 
 def format_budget_megabytes(megabytes: int) -> str:
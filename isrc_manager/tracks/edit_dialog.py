@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import QDate, QEvent, Qt, QTimer
+from PySide6.QtCore import QDate, QEvent, QStringListModel, Qt, QTimer
 from PySide6.QtWidgets import (
     QApplication,
     QCalendarWidget,
@@ -206,33 +206,28 @@ class EditDialog(QDialog):
             row.addWidget(widget)
             target_layout.addLayout(row)
 
+        # Combos backed by the same values (Artist and Additional Artist) share one
+        # completer model instead of each building its own copy and prefix index.
+        completer_models: dict[tuple[str, ...], QStringListModel] = {}
+
         def combo(
             target_layout,
             label,
             field_name,
             value,
-            source_query=None,
+            source_values,
             allow_empty=True,
-            source_values: list[str] | None = None,
         ):
             cb = FocusWheelComboBox()
             cb.setEditable(True)
             items: list[str] = []
             seen: set[str] = set()
-            if source_values is not None:
-                for raw_text in source_values:
-                    text = str(raw_text or "").strip()
-                    if not text or text in seen:
-                        continue
-                    seen.add(text)
-                    items.append(text)
-            elif source_query:
-                for row in self.parent.cursor.execute(source_query).fetchall():
-                    text = str(row[0] or "").strip()
-                    if not text or text in seen:
-                        continue
-                    seen.add(text)
-                    items.append(text)
+            for raw_text in source_values or ():
+                text = str(raw_text or "").strip()
+                if not text or text in seen:
+                    continue
+                seen.add(text)
+                items.append(text)
             display_value = self._display_value_for_field(field_name, value).strip()
             if (
                 display_value
@@ -243,7 +238,11 @@ class EditDialog(QDialog):
             if allow_empty:
                 cb.addItem("")
             cb.addItems(items)
-            comp = QCompleter(items)
+            completer_model = completer_models.get(tuple(items))
+            if completer_model is None:
+                completer_model = QStringListModel(items, self)
+                completer_models[tuple(items)] = completer_model
+            comp = QCompleter(completer_model, cb)
             comp.setCaseSensitivity(Qt.CaseInsensitive)
             cb.setCompleter(comp)
             self._configure_combo_field(cb, field_name, value)
@@ -330,27 +329,29 @@ class EditDialog(QDialog):
         self._configure_text_field(self.track_title, "track_title", self.snapshot.track_title)
         add_row(core_layout, "Track Title", self.track_title)
 
+        # One pass over the catalog lookup queries feeds every combo in the dialog.
+        lookup_values = self.parent._catalog_lookup_values()
         self.artist_name = combo(
             core_layout,
             "Artist",
             "artist_name",
             self.snapshot.artist_name,
+            lookup_values.get("artists"),
             allow_empty=False,
-            source_values=self.parent._artist_lookup_values(),
         )
         self.additional_artist = combo(
             core_layout,
             "Additional Artist(s)",
             "additional_artists",
             ", ".join(self.snapshot.additional_artists),
-            source_values=self.parent._artist_lookup_values(),
+            lookup_values.get("artists"),
         )
         self.album_title = combo(
             album_release_layout,
             "Album Title",
             "album_title",
             self.snapshot.album_title or "",
-            "SELECT DISTINCT title FROM Albums ORDER BY title",
+            lookup_values.get("albums"),
         )
         self.track_number = FocusWheelSpinBox()
         self.track_number.setRange(0, 9999)
@@ -382,7 +383,7 @@ class EditDialog(QDialog):
             "Genre",
             "genre",
             self.snapshot.genre or "",
-            "SELECT DISTINCT genre FROM Tracks WHERE genre IS NOT NULL AND genre != '' ORDER BY genre",
+            lookup_values.get("genres"),
         )
 
         self.audio_file = QLineEdit()
@@ -674,15 +675,7 @@ class EditDialog(QDialog):
             "UPC/EAN",
             "upc",
             self.snapshot.upc or "",
-            """
-            SELECT value
-            FROM (
-                SELECT upc AS value FROM Tracks WHERE upc IS NOT NULL AND upc != ''
-                UNION
-                SELECT upc AS value FROM Releases WHERE upc IS NOT NULL AND upc != ''
-            )
-            ORDER BY value
-            """,
+            lookup_values.get("upcs"),
         )
         self.upc.setInsertPolicy(QComboBox.NoInsert)
         add_row(registration_layout, "BUMA Wnr.", buma_work_number_widget)
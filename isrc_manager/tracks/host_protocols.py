@@ -68,6 +68,7 @@ class TrackEditorHost(Protocol):
     def _audit(self, *args: Any, **kwargs: Any) -> Any: ...
     def _audit_commit(self, *args: Any, **kwargs: Any) -> Any: ...
     def _capture_catalog_refresh_request(self, *args: Any, **kwargs: Any) -> Any: ...
+    def _catalog_lookup_values(self, *args: Any, **kwargs: Any) -> Any: ...
     def _choose_track_media_storage_modes(self, *args: Any, **kwargs: Any) -> Any: ...
     def _collect_catalog_cleanup_targets(self, *args: Any, **kwargs: Any) -> Any: ...
     def _confirm_lossy_primary_audio_selection(self, *args: Any, **kwargs: Any) -> Any: ...
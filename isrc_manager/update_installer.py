@@ -233,6 +233,9 @@ def locate_replacement_candidate(extract_dir: Path, platform_key: str) -> Path:
                 return candidate
         raise UpdateInstallerError("The macOS update package did not contain a valid app bundle.")
     if key == "windows":
+        for candidate in sorted(path for path in extract_dir.iterdir() if path.is_dir()):
+            if (candidate / "_internal").is_dir() and _find_executable_in_directory(candidate):
+                return candidate
         candidates = sorted(path for path in extract_dir.rglob("*.exe") if path.is_file())
         if not candidates:
             raise UpdateInstallerError("The Windows update package did not contain an executable.")
@@ -263,9 +266,7 @@ def resolve_installed_target_path(
             if parent.suffix == ".app" and parent.is_dir():
                 return parent
         return exe_path
-    if key == "windows":
-        return exe_path
-    if key == "linux" and (exe_path.parent / "_internal").exists():
+    if key in {"windows", "linux"} and (exe_path.parent / "_internal").exists():
         return exe_path.parent
     return exe_path
 
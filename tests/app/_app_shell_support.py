@@ -16,6 +16,7 @@ from isrc_manager import history_retention_controller
 from isrc_manager.constants import APP_NAME
 from isrc_manager.file_storage import STORAGE_MODE_DATABASE, STORAGE_MODE_MANAGED_FILE
 from isrc_manager.media.derivatives import DerivativeLedgerService
+from isrc_manager.media.waveform_cache import _shade_waveform_pixels
 from isrc_manager.paths import AppStorageLayout
 from isrc_manager.services import (
     AssetVersionPayload,
@@ -1628,6 +1629,7 @@ class AppShellTestCase(unittest.TestCase):
             list(maintenance_snapshot.get("texts") or []),
             [
                 "Backup Database",
+                "Compact Database",
                 "Restore from Backup…",
             ],
         )
@@ -1903,6 +1905,7 @@ class AppShellTestCase(unittest.TestCase):
             [action.text() for action in maintenance_menu.actions() if action.text()],
             [
                 "Backup Database",
+                "Compact Database",
                 "Restore from Backup…",
             ],
         )
@@ -10591,19 +10594,13 @@ class AppShellTestCase(unittest.TestCase):
         self.assertGreater(loud_color[0], loud_color[1])
         self.assertGreater(mid_color[0], mid_color[2])
         self.assertGreater(quiet_color[1], quiet_color[0])
-        light_shaded = waveform_widget._shade_static_waveform_color(
-            loud_color,
-            peak=1.0,
-            edge_ratio=1.0,
+        light_shaded = app_module.QColor(
+            *_shade_waveform_pixels([loud_color], [1.0], [1.0], light_background=True)[0].tolist()
         )
         self.assertGreater(light_shaded.red(), light_shaded.green())
         self.assertLess(waveform_widget._relative_luminance(light_shaded), 0.45)
-        waveform_palette.setColor(app_module.QPalette.Window, app_module.QColor("#111827"))
-        waveform_widget.setPalette(waveform_palette)
-        dark_shaded = waveform_widget._shade_static_waveform_color(
-            loud_color,
-            peak=1.0,
-            edge_ratio=1.0,
+        dark_shaded = app_module.QColor(
+            *_shade_waveform_pixels([loud_color], [1.0], [1.0], light_background=False)[0].tolist()
         )
         self.assertGreater(
             waveform_widget._relative_luminance(dark_shaded),
@@ -129,6 +129,9 @@ class DatabaseSchemaServiceTestCase(unittest.TestCase):
         track_artist_indexes = {
             row[1] for row in self.conn.execute("PRAGMA index_list(TrackArtists)").fetchall()
         }
+        custom_field_value_indexes = {
+            row[1] for row in self.conn.execute("PRAGMA index_list(CustomFieldValues)").fetchall()
+        }
         gs1_indexes = {
             row[1] for row in self.conn.execute("PRAGMA index_list(GS1Metadata)").fetchall()
         }
@@ -558,6 +561,8 @@ class DatabaseSchemaServiceTestCase(unittest.TestCase):
         self.assertIn("idx_tracks_relationship_type", track_indexes)
         self.assertIn("idx_tracks_main_artist_party_id", track_indexes)
         self.assertIn("idx_track_artists_party_id", track_artist_indexes)
+        self.assertIn("idx_cfvalues_field_track", custom_field_value_indexes)
+        self.assertNotIn("idx_cfvalues_track_field", custom_field_value_indexes)
         self.assertIn("idx_work_track_links_unique_track", work_track_link_indexes)
         self.assertIn("idx_gs1_metadata_export_enabled", gs1_indexes)
         self.assertIn("idx_gs1_metadata_contract_number", gs1_indexes)
@@ -0,0 +1,59 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from isrc_manager.constants import SCHEMA_TARGET
+from isrc_manager.services import DatabaseSchemaService
+
+
+class DatabaseSchemaMigrations4546Tests(unittest.TestCase):
+    def test_migrate_45_to_46_backfills_custom_blob_sizes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            conn = sqlite3.connect(":memory:")
+            try:
+                service = DatabaseSchemaService(conn, data_root=Path(tmpdir))
+                service.init_db()
+                field_id = conn.execute(
+                    "INSERT INTO CustomFieldDefs(name, active, sort_order, field_type) "
+                    "VALUES ('Artwork', 1, 0, 'blob_image')"
+                ).lastrowid
+                text_field_id = conn.execute(
+                    "INSERT INTO CustomFieldDefs(name, active, sort_order, field_type) "
+                    "VALUES ('Mood', 1, 1, 'text')"
+                ).lastrowid
+                conn.execute("PRAGMA foreign_keys = OFF")
+                conn.executemany(
+                    """
+                    INSERT INTO CustomFieldValues(
+                        track_id, field_def_id, blob_value, storage_mode, mime_type, size_bytes
+                    )
+                    VALUES (?, ?, ?, 'database', 'image/png', ?)
+                    """,
+                    [
+                        (1, field_id, b"legacy-bytes", 0),
+                        (2, field_id, b"sized", 99),
+                    ],
+                )
+                conn.execute(
+                    "INSERT INTO CustomFieldValues(track_id, field_def_id, value) VALUES (3, ?, 'x')",
+                    (text_field_id,),
+                )
+                conn.execute("PRAGMA user_version = 45")
+                conn.commit()
+
+                service.migrate_schema()
+
+                sizes = dict(
+                    conn.execute(
+                        "SELECT track_id, size_bytes FROM CustomFieldValues ORDER BY track_id"
+                    ).fetchall()
+                )
+                self.assertEqual(service.get_db_version(), SCHEMA_TARGET)
+                self.assertEqual(sizes, {1: len(b"legacy-bytes"), 2: 99, 3: 0})
+            finally:
+                conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
+import io
 import json
 import os
 import plistlib
+import shutil
 import stat
 import subprocess
+import sys
 import tarfile
 import tempfile
 import unittest
@@ -24,6 +27,23 @@ def _completed_process(args, returncode=0, stdout="", stderr=""):
     )
 
 
+class _StreamingProcess:
+    def __init__(self, args, *, output="", returncode=0):
+        self.args = args
+        self.stdout = io.StringIO(output)
+        self.returncode = returncode
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stdout.close()
+        return False
+
+    def wait(self):
+        return self.returncode
+
+
 def _option_values(command, option):
     return [
         value for index, value in enumerate(command[1:], start=1) if command[index - 1] == option
@@ -425,6 +445,23 @@ class SplashResolutionTests(unittest.TestCase):
         self.assertEqual(resolved.kind, "fallback")
         self.assertIn("repo root", resolved.detail)
 
+    def test_splash_lookup_skips_directories_and_folds_case_on_macos(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            build_assets = root / "build_assets"
+            (build_assets / "splash.png").mkdir(parents=True)
+            fallback = root / "Splash.PNG"
+            fallback.write_bytes(b"png")
+
+            with (
+                mock.patch.object(build, "_is_windows", return_value=False),
+                mock.patch.object(build, "_is_macos", return_value=True),
+            ):
+                resolved = build._resolve_runtime_splash_asset(root)
+
+        self.assertEqual(resolved.path, fallback.resolve())
+        self.assertEqual(resolved.kind, "fallback")
+
     def test_missing_splash_returns_missing_resolution(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
@@ -559,7 +596,7 @@ class ReportingConfigResolutionTests(unittest.TestCase):
 
 
 class CommandConstructionTests(unittest.TestCase):
-    def test_windows_pyinstaller_command_uses_selected_executable_and_onefile(self):
+    def test_windows_pyinstaller_command_uses_selected_executable_and_onedir(self):
         entry_script = Path("/project/ISRC_manager.py")
         launcher = ("C:/repo/.venv/Scripts/pyinstaller.exe",)
 
@@ -576,8 +613,9 @@ class CommandConstructionTests(unittest.TestCase):
             )
 
         self.assertEqual(cmd[0], launcher[0])
-        self.assertIn("--onefile", cmd)
-        self.assertNotIn("--onedir", cmd)
+        self.assertIn("--onedir", cmd)
+        self.assertNotIn("--onefile", cmd)
+        self.assertIn("--noupx", cmd)
         self.assertNotIn("--splash", cmd)
         self.assertIn("--add-data", cmd)
         self.assertIn("/project/build_assets/splash.png;build_assets", cmd)
@@ -607,6 +645,38 @@ class CommandConstructionTests(unittest.TestCase):
         self.assertIn("--add-data", cmd)
         self.assertIn("/project/build_assets/splash.png:build_assets", cmd)
 
+    def test_pyinstaller_command_reuses_cached_workpath_unless_clean(self):
+        entry_script = Path("/project/ISRC_manager.py")
+        work_path = Path("/project") / build.PYINSTALLER_CACHE_DIRNAME / "work"
+
+        with (
+            mock.patch.object(build, "_is_windows", return_value=False),
+            mock.patch.object(build, "_is_macos", return_value=False),
+        ):
+            cached = build._pyinstaller_cmd(
+                pyinstaller_launcher=("pyinstaller",),
+                entry_script=entry_script,
+                app_name=build.PACKAGE_APP_NAME,
+                icon=None,
+                runtime_splash_asset=None,
+                work_path=work_path,
+                clean=False,
+            )
+            forced = build._pyinstaller_cmd(
+                pyinstaller_launcher=("pyinstaller",),
+                entry_script=entry_script,
+                app_name=build.PACKAGE_APP_NAME,
+                icon=None,
+                runtime_splash_asset=None,
+                work_path=work_path,
+                clean=True,
+            )
+
+        self.assertNotIn("--clean", cached)
+        self.assertEqual(cached[cached.index("--workpath") + 1], str(work_path))
+        self.assertIn("--clean", forced)
+        self.assertIn("--workpath", forced)
+
     def test_pyinstaller_command_bundles_reporting_proxy_config_when_available(self):
         entry_script = Path("/project/ISRC_manager.py")
 
@@ -657,6 +727,10 @@ class CommandConstructionTests(unittest.TestCase):
         self.assertIn("keyring.backends", _option_values(cmd, "--collect-submodules"))
         self.assertIn("keyring", _option_values(cmd, "--copy-metadata"))
         self.assertIn("sqlcipher3", _option_values(cmd, "--copy-metadata"))
+        excluded = _option_values(cmd, "--exclude-module")
+        self.assertIn("tkinter", excluded)
+        self.assertNotIn("unittest", excluded)
+        self.assertNotIn("http.server", excluded)
 
     def test_macos_pyinstaller_command_keeps_runtime_splash_without_bootloader_splash(self):
         entry_script = Path("/project/ISRC_manager.py")
@@ -742,10 +816,11 @@ class MainFlowTests(unittest.TestCase):
                     detail="no icon asset found",
                 )
 
-            def run_pyinstaller(cmd, cwd, text, capture_output):
+            def run_pyinstaller(cmd, **kwargs):
+                self.assertEqual(kwargs["stderr"], subprocess.STDOUT)
                 artifact.parent.mkdir(parents=True, exist_ok=True)
                 artifact.write_bytes(b"binary")
-                return _completed_process(cmd, stdout="", stderr="")
+                return _StreamingProcess(cmd, output="INFO: Building\n")
 
             with (
                 mock.patch.object(build, "PROJECT_ROOT", root),
@@ -770,7 +845,7 @@ class MainFlowTests(unittest.TestCase):
                 ),
                 mock.patch.object(build, "_print_build_diagnostics"),
                 mock.patch.object(build.os, "chdir"),
-                mock.patch.object(build.subprocess, "run", side_effect=run_pyinstaller),
+                mock.patch.object(build.subprocess, "Popen", side_effect=run_pyinstaller),
                 mock.patch.object(build, "_stage_release_artifact", return_value=staged),
                 mock.patch.object(
                     build,
@@ -787,6 +862,31 @@ class MainFlowTests(unittest.TestCase):
         self.assertEqual(exit_code, 0)
         resolve_icon_mock.assert_called_once_with(root)
 
+    def test_clean_build_directories_keeps_pyinstaller_cache_unless_forced(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for directory_name in ("build", "dist", build.PYINSTALLER_CACHE_DIRNAME):
+                (root / directory_name).mkdir()
+
+            build._clean_build_directories(root)
+
+            self.assertFalse((root / "build").exists())
+            self.assertFalse((root / "dist").exists())
+            self.assertTrue((root / build.PYINSTALLER_CACHE_DIRNAME).is_dir())
+
+            build._clean_build_directories(root, include_cache=True)
+
+            self.assertFalse((root / build.PYINSTALLER_CACHE_DIRNAME).exists())
+
+    def test_force_clean_is_requested_by_flag_or_environment(self):
+        with mock.patch.dict(build.os.environ, {}, clear=True):
+            self.assertFalse(build._force_clean_requested(False))
+            self.assertTrue(build._force_clean_requested(True))
+            self.assertTrue(build._parse_args(["--clean"]).clean)
+            self.assertFalse(build._parse_args(None).clean)
+        with mock.patch.dict(build.os.environ, {build.FORCE_CLEAN_ENV: "1"}, clear=True):
+            self.assertTrue(build._force_clean_requested(False))
+
     def test_main_stops_on_missing_pyinstaller_module_output(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
@@ -830,11 +930,10 @@ class MainFlowTests(unittest.TestCase):
                 mock.patch.object(build.os, "chdir"),
                 mock.patch.object(
                     build.subprocess,
-                    "run",
-                    return_value=_completed_process(
+                    "Popen",
+                    return_value=_StreamingProcess(
                         ("pyinstaller",),
-                        stdout="",
-                        stderr="No module named PyInstaller",
+                        output="No module named PyInstaller\n",
                     ),
                 ),
                 mock.patch.object(build, "_is_windows", return_value=False),
@@ -845,6 +944,18 @@ class MainFlowTests(unittest.TestCase):
 
         self.assertEqual(exit_code, 1)
 
+    def test_run_pyinstaller_streams_output_and_keeps_bounded_tail(self):
+        script = "import sys\nfor i in range(250): print(f'line {i}')\nsys.exit(3)"
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch("builtins.print") as printed:
+            result = build._run_pyinstaller([sys.executable, "-c", script], Path(tmpdir))
+
+        self.assertEqual(result.returncode, 3)
+        self.assertFalse(result.missing_module)
+        self.assertEqual(len(result.output_tail), build.PYINSTALLER_LOG_TAIL_LINES)
+        self.assertEqual(result.output_tail[0], "line 50")
+        self.assertEqual(result.output_tail[-1], "line 249")
+        self.assertEqual(printed.call_count, 250)
+
 
 class ArtifactStagingTests(unittest.TestCase):
     def test_architecture_tag_normalizes_common_runner_architectures(self):
@@ -876,6 +987,21 @@ class ArtifactStagingTests(unittest.TestCase):
 
         self.assertEqual(artifact, app_bundle)
 
+    def test_find_built_artifact_returns_windows_onedir_folder(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            bundle = root / "dist" / build.PACKAGE_APP_NAME
+            bundle.mkdir(parents=True, exist_ok=True)
+            (bundle / f"{build.PACKAGE_APP_NAME}.exe").write_bytes(b"binary")
+
+            with (
+                mock.patch.object(build, "_is_windows", return_value=True),
+                mock.patch.object(build, "_is_macos", return_value=False),
+            ):
+                artifact = build._find_built_artifact(root)
+
+        self.assertEqual(artifact, bundle)
+
     def test_stage_release_artifact_copies_file_without_writing_manifest(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
@@ -898,6 +1024,58 @@ class ArtifactStagingTests(unittest.TestCase):
             self.assertEqual(staged.name, f"{build.PACKAGE_APP_NAME}.exe")
             self.assertFalse((dist_dir / "release_manifest.json").exists())
 
+    def test_stage_release_artifact_falls_back_when_clone_copy_fails(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dist_dir = Path(tmpdir) / "dist"
+            bundle = dist_dir / build.PACKAGE_APP_NAME
+            (bundle / "_internal").mkdir(parents=True)
+            (bundle / build.PACKAGE_APP_NAME).write_bytes(b"binary")
+            (bundle / "_internal" / "libpython.so").write_bytes(b"lib")
+            (bundle / "libpython-link.so").symlink_to(Path("_internal") / "libpython.so")
+
+            with (
+                mock.patch.object(build, "_is_windows", return_value=False),
+                mock.patch.object(build, "_is_macos", return_value=False),
+                mock.patch.object(
+                    build.subprocess,
+                    "run",
+                    return_value=_completed_process(["cp"], returncode=1),
+                ) as run,
+            ):
+                staged = build._stage_release_artifact(bundle, dist_dir, app_version="3.1.1")
+
+            run.assert_called_once()
+            self.assertIn("--reflink=auto", run.call_args.args[0])
+            self.assertEqual((staged / build.PACKAGE_APP_NAME).read_bytes(), b"binary")
+            self.assertTrue((staged / "libpython-link.so").is_symlink())
+
+    def test_stage_release_artifact_uses_robocopy_on_windows(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dist_dir = Path(tmpdir) / "dist"
+            bundle = dist_dir / build.PACKAGE_APP_NAME
+            bundle.mkdir(parents=True)
+            (bundle / f"{build.PACKAGE_APP_NAME}.exe").write_bytes(b"binary")
+
+            def robocopy(cmd, **kwargs):
+                target = Path(cmd[2])
+                shutil.copytree(Path(cmd[1]), target)
+                return _completed_process(cmd, returncode=1)
+
+            with (
+                mock.patch.object(build, "_is_windows", return_value=True),
+                mock.patch.object(build, "_is_macos", return_value=False),
+                mock.patch.object(build.shutil, "which", return_value="robocopy"),
+                mock.patch.object(build.shutil, "copytree", wraps=shutil.copytree) as copytree,
+                mock.patch.object(build.subprocess, "run", side_effect=robocopy) as run,
+            ):
+                staged = build._stage_release_artifact(bundle, dist_dir, app_version="3.1.1")
+
+                self.assertEqual(copytree.call_count, 1)
+
+            self.assertEqual(run.call_args.args[0][0], "robocopy")
+            self.assertIn("/MT:8", run.call_args.args[0])
+            self.assertTrue((staged / f"{build.PACKAGE_APP_NAME}.exe").is_file())
+
     def test_stage_release_artifact_preserves_macos_app_bundle_suffix(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             dist_dir = Path(tmpdir) / "dist"
@@ -251,7 +251,6 @@ class _FakeContextMenuApp:
         track_title="Track Title",
         custom_field_name="",
         custom_field_name_raises=False,
-        cf_has_blob=True,
         cf_fetch_blob=b"blob",
     ):
         self.table = _FakeCatalogTable(index or _FakeIndex(text="cell"))
@@ -288,8 +287,6 @@ class _FakeContextMenuApp:
             custom_field_name,
             raises=custom_field_name_raises,
         )
-        self.cf_has_blob_value = cf_has_blob
-        self.cf_has_blob_raises = False
         self.cf_fetch_blob_value = cf_fetch_blob
         self.cf_fetch_blob_raises = False
         self.history_raises = False
@@ -436,12 +433,6 @@ class _FakeContextMenuApp:
             raise RuntimeError("title failed")
         return self.track_title
 
-    def cf_has_blob(self, *args, **kwargs):
-        self._record("cf_has_blob", *args, **kwargs)
-        if self.cf_has_blob_raises:
-            raise RuntimeError("blob check failed")
-        return self.cf_has_blob_value
-
     def _audio_preview_source_spec_for_custom_field(self, *args, **kwargs):
         self._record("_audio_preview_source_spec_for_custom_field", *args, **kwargs)
         return {"field_id": args[0], "field_name": kwargs.get("field_name")}
@@ -449,6 +440,28 @@ class _FakeContextMenuApp:
     def _open_audio_preview_for_track(self, *args, **kwargs):
         self._record("_open_audio_preview_for_track", *args, **kwargs)
 
+    def _submit_background_bundle_task(self, *, task_fn, on_success=None, on_error=None, **kwargs):
+        self._record(
+            "_submit_background_bundle_task",
+            kind=kwargs.get("kind"),
+            show_dialog=kwargs.get("show_dialog"),
+        )
+        bundle = SimpleNamespace(
+            custom_field_values=SimpleNamespace(fetch_blob=self.cf_fetch_blob),
+        )
+        try:
+            result = task_fn(bundle, None)
+        except Exception as exc:
+            if on_error is not None:
+                on_error(SimpleNamespace(message=str(exc), traceback_text=""))
+            return None
+        if on_success is not None:
+            on_success(result)
+        return "task"
+
+    def _show_background_task_error(self, *args, **kwargs):
+        self._record("_show_background_task_error", *args, **kwargs)
+
     def cf_fetch_blob(self, *args, **kwargs):
         self._record("cf_fetch_blob", *args, **kwargs)
         if self.cf_fetch_blob_raises:
@@ -1059,10 +1072,10 @@ class CatalogTableContextMenuTests(unittest.TestCase):
                 custom_field_id=9,
                 custom_field_type="blob_image",
             ),
-            cf_has_blob=False,
+            custom_payload=False,
         )
         context_menu._preview_catalog_blob_for_cell(app, 0, 1)
-        self.assertEqual(app.calls, [("cf_has_blob", (7, 9), {})])
+        self.assertEqual(app.calls, [])
 
     def test_preview_catalog_blob_routes_audio_image_empty_and_generic_data(self):
         audio_target = _target(
@@ -1103,6 +1116,11 @@ class CatalogTableContextMenuTests(unittest.TestCase):
             cf_fetch_blob=(b"image-bytes", "metadata"),
         )
         context_menu._preview_catalog_blob_for_cell(image_app, 0, 1)
+        self.assertIn(
+            ("_submit_background_bundle_task", (), {"kind": "read", "show_dialog": False}),
+            image_app.calls,
+        )
+        self.assertIn(("cf_fetch_blob", (7, 10), {}), image_app.calls)
         self.assertIn(
             ("_open_image_preview", (b"image-bytes", "Song \u2014 Cover"), {}),
             image_app.calls,
@@ -1151,6 +1169,23 @@ class CatalogTableContextMenuTests(unittest.TestCase):
             app.calls,
         )
 
+    def test_preview_catalog_blob_reports_background_fetch_failures(self):
+        target = _target(
+            kind="custom",
+            custom_field={"name": "Document"},
+            custom_field_id=11,
+            custom_field_type="blob_document",
+        )
+        app = _FakeContextMenuApp(target)
+        app.cf_fetch_blob_raises = True
+
+        context_menu._preview_catalog_blob_for_cell(app, 0, 1)
+
+        error_calls = [call for call in app.calls if call[0] == "_show_background_task_error"]
+        self.assertEqual(len(error_calls), 1)
+        self.assertEqual(error_calls[0][1][0], "Custom Field Error")
+        self.assertFalse(any(call[0] == "_preview_blob_bytes" for call in app.calls))
+
     def test_preview_catalog_blob_rolls_back_and_reports_exceptions(self):
         target = _target(
             kind="custom",
@@ -1159,7 +1194,11 @@ class CatalogTableContextMenuTests(unittest.TestCase):
             custom_field_type="blob_image",
         )
         app = _FakeContextMenuApp(target)
-        app.cf_has_blob_raises = True
+
+        def _raise_payload_lookup(*_args, **_kwargs):
+            raise RuntimeError("payload lookup failed")
+
+        app._media_cell_has_payload = _raise_payload_lookup
 
         with self._patched_context_menu_widgets():
             context_menu._preview_catalog_blob_for_cell(app, 0, 1)
@@ -205,6 +205,24 @@ class CatalogHeaderStateManagerTests(unittest.TestCase):
         self.assertTrue(header.isSectionHidden(3))
         self.assertFalse(header.sectionsMovable())
 
+    def test_restore_state_applies_reversed_key_order_for_wide_tables(self):
+        column_specs = tuple(
+            CatalogColumnSpec(key=f"col_{index}", header_text=f"Column {index}")
+            for index in range(40)
+        )
+        view, _ = self._make_view(column_specs)
+        saved_order = [spec.key for spec in reversed(column_specs)]
+        self.settings.setValue(
+            self.manager.settings_key(HEADER_COLUMN_KEYS_JSON_KEY),
+            json.dumps(saved_order + ["missing_column"]),
+        )
+        self.settings.sync()
+
+        restored = self.manager.restore_state(view.horizontalHeader(), column_specs=column_specs)
+
+        self.assertTrue(restored)
+        self.assertEqual(self._visual_key_order(view, column_specs), saved_order)
+
     def test_prefix_no_settings_and_json_loading_edges(self):
         column_specs = (
             CatalogColumnSpec(key="id", header_text="ID"),
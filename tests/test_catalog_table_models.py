@@ -204,6 +204,9 @@ class CatalogTableModelTests(unittest.TestCase):
         )
         self.assertEqual(self.model.track_id_for_source_row(2), 103)
         self.assertEqual(self.model.source_row_for_track_id(102), 1)
+        self.assertEqual(self.model.cell_for_track_id(101, "title").display_text, "Track 2")
+        self.assertIsNone(self.model.cell_for_track_id(101, "missing"))
+        self.assertIsNone(self.model.cell_for_track_id(999, "title"))
 
     def test_model_data_returns_precomputed_payloads_without_side_effects(self):
         explosive = _ExplosiveValue()
@@ -327,6 +330,42 @@ class CatalogFilterProxyModelTests(unittest.TestCase):
         pump_events(app=self.app)
         self.assertEqual(self._proxy_track_ids(), [102])
 
+    def test_proxy_reuses_searchable_columns_until_source_columns_change(self):
+        self.proxy.set_search_text("track")
+        pump_events(app=self.app)
+        self.assertEqual(self.proxy._searchable_columns_cache, (0, 1))
+
+        self.model.set_snapshot(
+            CatalogSnapshot(
+                column_specs=(
+                    CatalogColumnSpec(key="hidden", header_text="Hidden", searchable=False),
+                    CatalogColumnSpec(key="status", header_text="Status"),
+                ),
+                rows=(
+                    CatalogRowSnapshot(
+                        track_id=201,
+                        cells_by_key={
+                            "hidden": CatalogCellValue(display_text="Track hidden"),
+                            "status": CatalogCellValue(display_text="Ready", search_text="ready"),
+                        },
+                    ),
+                    CatalogRowSnapshot(
+                        track_id=202,
+                        cells_by_key={
+                            "status": CatalogCellValue(
+                                display_text="Track pending",
+                                search_text="track pending",
+                            ),
+                        },
+                    ),
+                ),
+            )
+        )
+        pump_events(app=self.app)
+
+        self.assertEqual(self._proxy_track_ids(), [202])
+        self.assertEqual(self.proxy._searchable_columns_cache, (1,))
+
     def test_proxy_applies_explicit_track_filters_in_combination_with_search(self):
         self.proxy.set_search_text("track")
         self.proxy.set_explicit_track_ids([101, 103])
@@ -482,11 +482,23 @@ class CatalogTableWorkflowTests(unittest.TestCase):
             _sort_catalog_table=lambda column, order: refresh_calls.append(("sort", column, order)),
         )
 
+        @contextmanager
+        def _suspended_updates():
+            refresh_calls.append("suspend")
+            try:
+                yield
+            finally:
+                refresh_calls.append("resume")
+
+        refresh_app._suspend_catalog_view_updates = _suspended_updates
+
         workflow.refresh_table(refresh_app)
 
         self.assertFalse(refresh_app._suspend_layout_history)
         self.assertEqual(refresh_table.sort_history, [False, True])
         self.assertIn(("sort", 1, Qt.DescendingOrder), refresh_calls)
+        self.assertEqual(refresh_calls[0], "suspend")
+        self.assertEqual(refresh_calls[-1], "resume")
 
         refresh_table.sorting = False
         refresh_table.sort_history.clear()
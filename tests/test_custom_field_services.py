@@ -2,6 +2,7 @@ import sqlite3
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from isrc_manager.file_storage import STORAGE_MODE_DATABASE, STORAGE_MODE_MANAGED_FILE
 from isrc_manager.services import CustomFieldDefinitionService, CustomFieldValueService
@@ -70,6 +71,42 @@ class CustomFieldDefinitionServiceTests(unittest.TestCase):
             self.conn.execute("SELECT id FROM CustomFieldDefs WHERE name='Artwork'").fetchone()
         )
 
+    def test_sync_fields_batches_large_inserts_in_order(self):
+        new_fields = [{"id": 1, "name": "Mood", "field_type": "dropdown", "options": None}]
+        new_fields += [
+            {"id": None, "name": f"Field {index:03d}", "field_type": "text", "options": None}
+            for index in range(250)
+        ]
+
+        self.service.sync_fields(self.service.list_active_fields(), new_fields)
+
+        fields = self.service.list_active_fields()
+        self.assertEqual(len(fields), 251)
+        self.assertEqual([field["name"] for field in fields], [f["name"] for f in new_fields])
+        self.assertEqual(
+            self.conn.execute(
+                "SELECT COUNT(*) FROM CustomFieldDefs WHERE name='Artwork'"
+            ).fetchone()[0],
+            0,
+        )
+
+    def test_sync_fields_rolls_back_every_change_when_a_write_fails(self):
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.service.sync_fields(
+                existing_fields=self.service.list_active_fields(),
+                new_fields=[
+                    {"id": 1, "name": "Renamed", "field_type": "dropdown", "options": None},
+                    {"id": None, "name": "Renamed", "field_type": "text", "options": None},
+                ],
+            )
+
+        self.assertFalse(self.conn.in_transaction)
+        self.assertEqual(self.conn.isolation_level, "")
+        self.assertEqual(
+            [(field["id"], field["name"]) for field in self.service.list_active_fields()],
+            [(1, "Mood"), (2, "Artwork")],
+        )
+
     def test_update_dropdown_options_persists_json(self):
         self.service.update_dropdown_options(1, ["Happy", "Sad"])
 
@@ -78,6 +115,10 @@ class CustomFieldDefinitionServiceTests(unittest.TestCase):
             ('["Happy", "Sad"]',),
         )
 
+        changes_before = self.conn.total_changes
+        self.service.update_dropdown_options(1, ["Happy", "Sad"])
+        self.assertEqual(self.conn.total_changes, changes_before)
+
     def test_sync_fields_persists_blob_icon_payload_for_blob_fields(self):
         self.service.sync_fields(
             existing_fields=self.service.list_active_fields(),
@@ -152,6 +193,32 @@ class CustomFieldValueServiceTests(unittest.TestCase):
         self.conn.close()
         self.tmpdir.cleanup()
 
+    def test_save_dropdown_value_with_new_options_commits_both_together(self):
+        self.service.save_value(10, 1, value="Calm", dropdown_options=["Happy", "Calm"])
+
+        self.assertFalse(self.conn.in_transaction)
+        self.assertEqual(self.service.get_text_value(10, 1), "Calm")
+        self.assertEqual(
+            self.conn.execute("SELECT options FROM CustomFieldDefs WHERE id=1").fetchone(),
+            ('["Happy", "Calm"]',),
+        )
+
+    def test_save_dropdown_value_failure_keeps_previous_options(self):
+        self.conn.execute("""
+            CREATE TRIGGER reject_value BEFORE INSERT ON CustomFieldValues
+            BEGIN
+                SELECT RAISE(ABORT, 'rejected');
+            END
+            """)
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.service.save_value(10, 1, value="Calm", dropdown_options=["Happy", "Calm"])
+
+        self.assertEqual(
+            self.conn.execute("SELECT options FROM CustomFieldDefs WHERE id=1").fetchone(),
+            ('["Happy"]',),
+        )
+
     def test_save_text_value_and_read_meta(self):
         self.service.save_value(10, 1, value="Calm")
 
@@ -227,12 +294,64 @@ class CustomFieldValueServiceTests(unittest.TestCase):
         self.assertEqual(self.service.blob_size(11, 2), len(b"\x89PNG\r\n\x1a\nfakepng"))
         self.assertEqual(meta["size_bytes"], len(b"\x89PNG\r\n\x1a\nfakepng"))
         self.assertEqual(meta["mime_type"], "image/png")
+        self.assertEqual(self.service._fetch_blob_row(11, 2)[1], 1)
+        self.assertTrue(self.service.get_value_meta_map([2], track_ids=[11])[(11, 2)]["has_blob"])
 
         self.service.delete_blob(11, 2)
         self.assertFalse(self.service.has_blob(11, 2))
         with self.assertRaises(FileNotFoundError):
             self.service.fetch_blob(11, 2)
 
+    def test_blob_size_falls_back_to_stored_payload_length_when_size_is_unset(self):
+        blob_path = Path(self.tmpdir.name) / "legacy.png"
+        blob_path.write_bytes(b"\x89PNG\r\n\x1a\nlegacy")
+        self.service.save_value(13, 2, blob_path=str(blob_path))
+        self.conn.execute(
+            "UPDATE CustomFieldValues SET size_bytes=0 WHERE track_id=? AND field_def_id=?",
+            (13, 2),
+        )
+
+        expected = len(b"\x89PNG\r\n\x1a\nlegacy")
+        self.assertEqual(self.service.blob_size(13, 2), expected)
+        self.assertEqual(self.service.get_value_meta(13, 2)["size_bytes"], expected)
+        self.assertEqual(
+            self.service.get_value_meta_map([2], track_ids=[13])[(13, 2)]["size_bytes"],
+            expected,
+        )
+
+    def test_export_blob_to_path_streams_database_payload_in_chunks(self):
+        payload = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 5
+        blob_path = Path(self.tmpdir.name) / "stream.png"
+        blob_path.write_bytes(payload)
+        self.service.save_value(14, 2, blob_path=str(blob_path))
+        dest_path = Path(self.tmpdir.name) / "exported.png"
+
+        with mock.patch.object(self.service, "fetch_blob") as fetch_blob:
+            mime = self.service.export_blob_to_path(14, 2, dest_path, chunk_size=100)
+
+        fetch_blob.assert_not_called()
+        self.assertEqual(mime, "image/png")
+        self.assertEqual(dest_path.read_bytes(), payload)
+        with self.assertRaises(FileNotFoundError):
+            self.service.export_blob_to_path(99, 2, dest_path)
+
+    def test_save_blob_value_streams_database_payload_without_reading_whole_file(self):
+        payload = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 5
+        blob_path = Path(self.tmpdir.name) / "large.png"
+        blob_path.write_bytes(payload)
+
+        with (
+            mock.patch("isrc_manager.services.custom_fields.BLOB_IO_CHUNK_SIZE", 100),
+            mock.patch("isrc_manager.services.custom_fields._read_blob_from_path") as read_blob,
+        ):
+            self.service.save_value(15, 2, blob_path=str(blob_path))
+
+        read_blob.assert_not_called()
+        data, mime = self.service.fetch_blob(15, 2)
+        self.assertEqual(bytes(data), payload)
+        self.assertEqual(mime, "image/png")
+        self.assertEqual(self.service.get_value_meta(15, 2)["size_bytes"], len(payload))
+
     def test_invalid_blob_extension_is_rejected(self):
         blob_path = Path(self.tmpdir.name) / "not-image.txt"
         blob_path.write_bytes(b"nope")
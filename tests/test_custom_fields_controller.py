@@ -4,7 +4,7 @@ import json
 from types import SimpleNamespace
 from unittest import mock
 
-from PySide6.QtWidgets import QDialog
+from PySide6.QtWidgets import QDialog, QFileDialog
 
 from isrc_manager import custom_fields as controller
 from isrc_manager.file_storage import STORAGE_MODE_DATABASE
@@ -125,6 +125,12 @@ def test_apply_custom_field_configuration_handles_conflicts_unchanged_success_an
         app.active_custom_fields, new_fields
     )
     app._on_custom_fields_changed.assert_called_once()
+    app._audit.assert_called_once_with(
+        "FIELDS",
+        "CustomFieldDefs",
+        ref_id="batch",
+        details='[{"id":1,"name":"Energy","type":"text"}]',
+    )
     history.record_snapshot_action.assert_called_once()
     app._refresh_history_actions.assert_called_once()
 
@@ -554,8 +560,11 @@ def test_double_click_blob_custom_field_attaches_file_with_storage_choice(monkey
     audio_path.write_bytes(b"RIFF")
 
     class FakeFileDialog:
+        options = []
+
         @classmethod
-        def getOpenFileName(cls, *args):
+        def getOpenFileName(cls, *args, **kwargs):
+            cls.options.append(kwargs.get("options"))
             return (str(audio_path), "")
 
     def root_attr(name, fallback):
@@ -598,6 +607,8 @@ def test_double_click_blob_custom_field_attaches_file_with_storage_choice(monkey
         storage_mode=STORAGE_MODE_DATABASE,
     )
     app.refresh_table_preserve_view.assert_called_once_with(focus_id=9)
+    assert FakeFileDialog.options == [controller._ATTACH_FILE_DIALOG_OPTIONS]
+    assert FakeFileDialog.options[0] & QFileDialog.Option.DontUseCustomDirectoryIcons
 
 
 def test_double_click_blob_custom_field_covers_cancel_and_error_paths(monkeypatch, tmp_path):
@@ -609,7 +620,7 @@ def test_double_click_blob_custom_field_covers_cancel_and_error_paths(monkeypatc
         result = (str(image_path), "")
 
         @classmethod
-        def getOpenFileName(cls, *args):
+        def getOpenFileName(cls, *args, **kwargs):
             return cls.result
 
     storage_choices = [None, STORAGE_MODE_DATABASE]
@@ -700,11 +711,13 @@ def test_double_click_dropdown_custom_field_updates_options_and_value(monkeypatc
 
     controller._on_catalog_index_double_clicked(app, object())
 
-    app.custom_field_definitions.update_dropdown_options.assert_called_once_with(
+    app.custom_field_definitions.update_dropdown_options.assert_not_called()
+    app.custom_field_values.save_value.assert_called_once_with(
+        4,
         2,
-        ["Old Choice", "New Choice"],
+        value="New Choice",
+        dropdown_options=["Old Choice", "New Choice"],
     )
-    app.custom_field_values.save_value.assert_called_once_with(4, 2, value="New Choice")
     app.refresh_table_preserve_view.assert_called_once_with(focus_id=4)
 
 
@@ -737,7 +750,7 @@ def test_double_click_custom_field_covers_dropdown_cancel_and_unchanged(monkeypa
         active_custom_fields=[],
         _catalog_table_controller=mock.Mock(return_value=catalog_controller),
         custom_field_values=SimpleNamespace(
-            get_text_value=mock.Mock(side_effect=["Legacy", "Known"]),
+            get_text_value=mock.Mock(side_effect=["Legacy", "Known", "Legacy"]),
             save_value=mock.Mock(),
         ),
         custom_field_definitions=SimpleNamespace(update_dropdown_options=mock.Mock()),
@@ -754,6 +767,17 @@ def test_double_click_custom_field_covers_dropdown_cancel_and_unchanged(monkeypa
     controller._on_catalog_index_double_clicked(app, object())
     app._run_snapshot_history_action.assert_not_called()
 
+    FakeInputDialog.item_result = ("Legacy", True)
+    controller._on_catalog_index_double_clicked(app, object())
+    app._run_snapshot_history_action.assert_not_called()
+
+
+def test_iso_date_pattern_matches_whole_value_only():
+    assert controller._ISO_DATE_RE.match("2026-06-07")
+    assert not controller._ISO_DATE_RE.match("2026-06-07\n")
+    assert not controller._ISO_DATE_RE.match("2026-6-7")
+    assert not controller._ISO_DATE_RE.match("")
+
 
 def test_double_click_checkbox_date_and_text_custom_fields(monkeypatch):
     class FakeInputDialog:
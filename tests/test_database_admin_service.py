@@ -1,3 +1,4 @@
+import os
 import sqlite3
 import tempfile
 import unittest
@@ -90,6 +91,185 @@ class DatabaseMaintenanceServiceTests(unittest.TestCase):
         self.assertEqual(self.service.verify_integrity(result.backup_path), "ok")
         self.assertEqual(read_sample_db(result.backup_path), "original")
 
+    def test_backup_api_path_checks_integrity_on_the_writing_connection(self):
+        conn = sqlite3.connect(str(self.current_db))
+        try:
+            with (
+                patch.object(
+                    self.service, "verify_integrity", wraps=self.service.verify_integrity
+                ) as verify,
+                patch("isrc_manager.services.database_admin.os.fsync") as fsync,
+            ):
+                result = self.service.create_backup(conn, self.current_db)
+        finally:
+            conn.close()
+
+        self.assertEqual(result.method, "backup_api")
+        self.assertEqual(read_sample_db(result.backup_path), "original")
+        verify.assert_called_once()
+        self.assertIsNotNone(verify.call_args.kwargs["conn"])
+        self.assertTrue(verify.call_args.kwargs["quick"])
+        fsync.assert_called_once()
+
+    @unittest.skipUnless(hasattr(os, "posix_fallocate"), "posix_fallocate unavailable")
+    def test_backup_api_path_preallocates_destination_to_source_size(self):
+        conn = sqlite3.connect(str(self.current_db))
+        try:
+            with patch(
+                "isrc_manager.services.database_admin.os.posix_fallocate",
+                wraps=os.posix_fallocate,
+            ) as fallocate:
+                result = self.service.create_backup(conn, self.current_db)
+        finally:
+            conn.close()
+
+        self.assertEqual(result.method, "backup_api")
+        fallocate.assert_called_once()
+        self.assertEqual(fallocate.call_args.args[2], self.current_db.stat().st_size)
+        self.assertEqual(result.backup_path.stat().st_size, self.current_db.stat().st_size)
+        self.assertEqual(read_sample_db(result.backup_path), "original")
+
+    def test_maintain_database_runs_bounded_incremental_vacuum(self):
+        incremental_db = self.root / "incremental.db"
+        conn = sqlite3.connect(str(incremental_db))
+        try:
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("CREATE TABLE blobs (payload BLOB)")
+            conn.executemany(
+                "INSERT INTO blobs (payload) VALUES (?)", [(b"x" * 4096,) for _ in range(40)]
+            )
+            conn.commit()
+            conn.execute("DELETE FROM blobs")
+            conn.commit()
+            free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+            result = self.service.maintain_database(conn, incremental_db, pages=10)
+
+            self.assertEqual(result.method, "incremental_vacuum")
+            self.assertEqual(result.freed_pages, 10)
+            self.assertEqual(conn.execute("PRAGMA freelist_count").fetchone()[0], free_before - 10)
+        finally:
+            conn.close()
+
+    def test_maintain_database_compacts_into_replacement_file_without_auto_vacuum(self):
+        events: list[str] = []
+        state = {"conn": sqlite3.connect(str(self.current_db))}
+        try:
+            state["conn"].execute("CREATE TABLE filler (payload BLOB)")
+            state["conn"].executemany(
+                "INSERT INTO filler (payload) VALUES (?)", [(b"x" * 4096,) for _ in range(40)]
+            )
+            state["conn"].commit()
+            state["conn"].execute("DROP TABLE filler")
+            state["conn"].commit()
+            size_before = self.current_db.stat().st_size
+
+            def _close():
+                events.append("close")
+                state["conn"].close()
+
+            def _reopen():
+                events.append("reopen")
+                state["conn"] = sqlite3.connect(str(self.current_db))
+
+            result = self.service.maintain_database(
+                state["conn"],
+                self.current_db,
+                close_connection=_close,
+                reopen_connection=_reopen,
+            )
+        finally:
+            state["conn"].close()
+
+        self.assertEqual(result.method, "vacuum_into")
+        self.assertGreater(result.freed_pages, 0)
+        self.assertEqual(events, ["close", "reopen"])
+        self.assertLess(self.current_db.stat().st_size, size_before)
+        self.assertEqual(read_sample_db(self.current_db), "original")
+        self.assertFalse(self.current_db.with_name("current.db.compact.tmp").exists())
+
+    def test_maintain_database_refuses_swap_while_another_connection_keeps_the_wal(self):
+        events: list[str] = []
+        other = sqlite3.connect(str(self.current_db))
+        conn = sqlite3.connect(str(self.current_db))
+        try:
+            other.execute("PRAGMA journal_mode=WAL")
+            other.execute("UPDATE sample SET value='in wal'")
+            other.commit()
+            self.assertTrue(self.current_db.with_name("current.db-wal").exists())
+
+            with self.assertRaisesRegex(RuntimeError, "another connection"):
+                self.service.maintain_database(
+                    conn,
+                    self.current_db,
+                    close_connection=lambda: (events.append("close"), conn.close()),
+                    reopen_connection=lambda: events.append("reopen"),
+                )
+        finally:
+            conn.close()
+            other.close()
+
+        self.assertEqual(events, ["close", "reopen"])
+        self.assertEqual(read_sample_db(self.current_db), "in wal")
+        self.assertFalse(self.current_db.with_name("current.db.compact.tmp").exists())
+
+    def test_maintain_database_requires_reconnect_callbacks_without_auto_vacuum(self):
+        conn = sqlite3.connect(str(self.current_db))
+        try:
+            with self.assertRaises(RuntimeError):
+                self.service.maintain_database(conn, self.current_db)
+        finally:
+            conn.close()
+        self.assertEqual(read_sample_db(self.current_db), "original")
+
+    def test_verify_integrity_immutable_mode_leaves_no_companion_files(self):
+        self.assertEqual(self.service.verify_integrity(self.current_db, immutable=True), "ok")
+        self.assertEqual(
+            sorted(path.name for path in self.root.iterdir() if path.name.startswith("current")),
+            ["current.db"],
+        )
+
+    def test_copy_file_with_companions_copies_only_sqlite_companion_files(self):
+        self.current_db.with_name("current.db-shm").write_bytes(b"shm")
+        self.current_db.with_name("current.db.wal").write_bytes(b"other")
+        target = self.root / "copied.db"
+
+        DatabaseMaintenanceService._copy_file_with_companions(self.current_db, target)
+
+        self.assertEqual(
+            sorted(path.name for path in self.root.iterdir() if path.name.startswith("copied")),
+            ["copied.db", "copied.db-shm"],
+        )
+
+    def test_verify_integrity_quick_mode_uses_quick_check(self):
+        self.assertEqual(self.service.verify_integrity(self.current_db, quick=True), "ok")
+
+        with patch("isrc_manager.services.database_admin.sqlite3.connect") as connect:
+            connect.return_value.execute.return_value.fetchone.return_value = ("ok",)
+            self.service.verify_integrity(self.current_db, quick=True)
+            self.service.verify_integrity(self.current_db)
+
+        self.assertEqual(
+            [call.args[0] for call in connect.return_value.execute.call_args_list],
+            ["PRAGMA quick_check", "PRAGMA integrity_check"],
+        )
+
+    def test_create_backup_checkpoints_wal_before_copying(self):
+        conn = sqlite3.connect(str(self.current_db))
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("UPDATE sample SET value='in wal'")
+            conn.commit()
+            wal_path = Path(str(self.current_db) + "-wal")
+            self.assertGreater(wal_path.stat().st_size, 0)
+
+            result = self.service.create_backup(conn, self.current_db)
+
+            self.assertEqual(wal_path.stat().st_size, 0)
+        finally:
+            conn.close()
+        self.assertEqual(read_sample_db(result.backup_path), "in wal")
+
     def test_list_backup_files_returns_recursive_sorted_database_files(self):
         self.assertEqual(self.service.list_backup_files(), [])
         nested = self.backups_dir / "nested"
@@ -112,8 +292,8 @@ class DatabaseMaintenanceServiceTests(unittest.TestCase):
             conn.close()
 
     def test_create_backup_falls_back_to_file_copy_with_companion_files(self):
-        source_wal = self.current_db.with_suffix(".db.wal")
-        source_shm = self.current_db.with_suffix(".db.shm")
+        source_wal = self.current_db.with_name("current.db-wal")
+        source_shm = self.current_db.with_name("current.db-shm")
         source_wal.write_text("wal", encoding="utf-8")
         source_shm.write_text("shm", encoding="utf-8")
         conn = unittest.mock.Mock()
@@ -137,16 +317,42 @@ class DatabaseMaintenanceServiceTests(unittest.TestCase):
 
         self.assertEqual(result.method, "file_copy")
         self.assertTrue(result.backup_path.exists())
-        self.assertEqual(
-            result.backup_path.with_suffix(".db.wal").read_text(encoding="utf-8"), "wal"
-        )
-        self.assertEqual(
-            result.backup_path.with_suffix(".db.shm").read_text(encoding="utf-8"), "shm"
-        )
+        self.assertEqual(Path(str(result.backup_path) + "-wal").read_text(encoding="utf-8"), "wal")
+        self.assertEqual(Path(str(result.backup_path) + "-shm").read_text(encoding="utf-8"), "shm")
         close_connection.assert_called_once_with()
         reopen_connection.assert_called_once_with()
         backup_conn.close.assert_called_once_with()
 
+    def test_create_backup_reports_page_progress_in_steps(self):
+        progress: list[tuple[int, int, str]] = []
+        conn = sqlite3.connect(str(self.current_db))
+        try:
+            result = self.service.create_backup(
+                conn,
+                self.current_db,
+                progress_callback=lambda value, maximum, message: progress.append(
+                    (value, maximum, message)
+                ),
+            )
+        finally:
+            conn.close()
+
+        self.assertEqual(result.method, "backup_api")
+        self.assertTrue(progress)
+        value, maximum, message = progress[-1]
+        self.assertEqual(value, maximum)
+        self.assertIn("database pages", message)
+
+    def test_create_backup_prefers_vacuum_into_when_requested(self):
+        conn = sqlite3.connect(str(self.current_db))
+        try:
+            result = self.service.create_backup(conn, self.current_db, prefer_vacuum=True)
+        finally:
+            conn.close()
+
+        self.assertEqual(result.method, "vacuum_into")
+        self.assertEqual(read_sample_db(result.backup_path), "original")
+
     def test_create_backup_reports_all_method_failures_without_file_copy_callbacks(self):
         conn = unittest.mock.Mock()
         conn.backup.side_effect = sqlite3.DatabaseError("backup unavailable")
@@ -198,6 +404,39 @@ class DatabaseMaintenanceServiceTests(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             self.service.restore_database(self.backups_dir / "missing.db", self.current_db)
 
+    def test_backup_api_copy_folds_wal_content_into_a_single_file(self):
+        wal_db = self.root / "wal.db"
+        conn = sqlite3.connect(str(wal_db))
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE sample (value TEXT)")
+            conn.execute("INSERT INTO sample(value) VALUES ('from wal')")
+            conn.commit()
+            target = self.root / "copied.db"
+            DatabaseMaintenanceService._copy_with_backup_api(wal_db, target)
+        finally:
+            conn.close()
+
+        self.assertFalse(Path(str(target) + "-wal").exists())
+        self.assertEqual(read_sample_db(target), "from wal")
+
+    def test_restore_database_checks_the_live_file_without_immutable_open(self):
+        backup = self.backups_dir / "restore.db"
+        backup.parent.mkdir(parents=True, exist_ok=True)
+        write_sample_db(backup, "restored")
+
+        with patch.object(
+            self.service, "verify_integrity", wraps=self.service.verify_integrity
+        ) as verify:
+            self.service.restore_database(backup, self.current_db)
+
+        checks = {Path(call.args[0]).name: call.kwargs for call in verify.call_args_list}
+        staged = next(name for name in checks if name.startswith("current.db.restore_"))
+        self.assertTrue(checks[staged]["immutable"])
+        self.assertTrue(checks["current.db"]["read_only"])
+        self.assertNotIn("immutable", checks["current.db"])
+        self.assertEqual(read_sample_db(self.current_db), "restored")
+
     def test_restore_database_uses_copy_fallback_when_staging_backup_api_fails(self):
         backup = self.backups_dir / "fallback.db"
         backup.parent.mkdir(parents=True, exist_ok=True)
@@ -242,8 +481,8 @@ class DatabaseMaintenanceServiceTests(unittest.TestCase):
             conn.close()
 
         write_sample_db(self.current_db, "changed")
-        current_wal = self.current_db.with_suffix(".db.wal")
-        current_shm = self.current_db.with_suffix(".db.shm")
+        current_wal = self.current_db.with_name("current.db-wal")
+        current_shm = self.current_db.with_name("current.db-shm")
         current_wal.write_text("current wal", encoding="utf-8")
         current_shm.write_text("current shm", encoding="utf-8")
 
@@ -255,9 +494,10 @@ class DatabaseMaintenanceServiceTests(unittest.TestCase):
             with self.assertRaises(RuntimeError):
                 self.service.restore_database(result.backup_path, self.current_db)
 
-        self.assertEqual(read_sample_db(self.current_db), "changed")
+        # Check the companions first: opening the database lets SQLite drop the stand-in WAL.
         self.assertEqual(current_wal.read_text(encoding="utf-8"), "current wal")
         self.assertEqual(current_shm.read_text(encoding="utf-8"), "current shm")
+        self.assertEqual(read_sample_db(self.current_db), "changed")
 
 
 if __name__ == "__main__":
@@ -2,8 +2,12 @@ import tempfile
 import threading
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from isrc_manager.services import db_access
 from isrc_manager.services.db_access import (
+    SQLITE_CACHE_SIZE_KIB,
+    SQLITE_CACHED_STATEMENTS,
     DatabaseWriteCoordinator,
     SQLiteConnectionFactory,
     is_lock_error,
@@ -21,13 +25,34 @@ class SQLiteConnectionFactoryTests(unittest.TestCase):
                 journal_mode = str(conn.execute("PRAGMA journal_mode").fetchone()[0]).lower()
                 foreign_keys = int(conn.execute("PRAGMA foreign_keys").fetchone()[0])
                 busy_timeout = int(conn.execute("PRAGMA busy_timeout").fetchone()[0])
+                synchronous = int(conn.execute("PRAGMA synchronous").fetchone()[0])
+                temp_store = int(conn.execute("PRAGMA temp_store").fetchone()[0])
+                cache_size = int(conn.execute("PRAGMA cache_size").fetchone()[0])
 
                 self.assertEqual(journal_mode, "wal")
                 self.assertEqual(foreign_keys, 1)
                 self.assertEqual(busy_timeout, 1500)
+                self.assertEqual(synchronous, 1)
+                self.assertEqual(temp_store, 2)
+                self.assertEqual(cache_size, -SQLITE_CACHE_SIZE_KIB)
             finally:
                 conn.close()
 
+    def test_open_sizes_the_prepared_statement_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "catalog.db"
+            real_connect = db_access.sqlite3.connect
+            with mock.patch.object(
+                db_access.sqlite3, "connect", side_effect=real_connect
+            ) as connect_mock:
+                SQLiteConnectionFactory().open(db_path).close()
+                SQLiteConnectionFactory(cached_statements=32).open(db_path).close()
+
+            self.assertEqual(
+                [call.kwargs["cached_statements"] for call in connect_mock.call_args_list],
+                [SQLITE_CACHED_STATEMENTS, 32],
+            )
+
     def test_lock_error_helper_detects_common_sqlite_messages(self):
         self.assertTrue(is_lock_error(RuntimeError("database table is locked")))
         self.assertTrue(is_lock_error(RuntimeError("database is busy")))
@@ -9,6 +9,7 @@ from PySide6.QtWidgets import QDialog
 
 from isrc_manager.exchange import ExchangeImportOptions, ExchangeImportReport, ExchangeInspection
 from isrc_manager.exchange import controller as exchange_controller
+from tests.qt_test_helpers import pump_events, require_qapplication
 
 
 def _report(**overrides):
@@ -192,10 +193,14 @@ def test_import_exchange_file_inspects_csv_and_runs_dry_run_then_preflight_apply
     apply_task = submitted[-1]
     assert apply_task["title"] == "Import CSV"
     assert apply_task["task_fn"](bundle, ctx) is apply_report
+    qt_app = require_qapplication()
     apply_task["on_success_before_cleanup"](apply_report, object())
+    app.populate_all_comboboxes.assert_not_called()
     apply_task["on_success_after_cleanup"](apply_report)
+    pump_events(app=qt_app)
     app.conn.commit.assert_called_once()
     app.refresh_table_preserve_view.assert_called_once_with(focus_id=9)
+    app.populate_all_comboboxes.assert_called_once_with()
     assert errors == []
 
 
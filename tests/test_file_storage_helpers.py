@@ -102,6 +102,10 @@ def test_coalesce_filename_mime_guess_blob_bytes_and_hash() -> None:
     assert file_storage.bytes_from_blob(None) == b""
     assert file_storage.bytes_from_blob(bytearray(b"abc")) == b"abc"
     assert file_storage.bytes_from_blob(memoryview(b"abc")) == b"abc"
+    payload = b"whole-blob"
+    assert file_storage.bytes_from_blob(memoryview(payload)) is payload
+    assert file_storage.bytes_from_blob(memoryview(payload)[6:]) == b"blob"
+    assert file_storage.bytes_from_blob(memoryview(bytearray(b"xyz"))) == b"xyz"
     assert file_storage.bytes_from_blob([65, 66]) == b"AB"
     assert file_storage.sha256_digest(b"abc") == (
         "ba7816bf8f01cfea414140de5dae2223" "b00361a396177a9cb410ff61f20015ad"
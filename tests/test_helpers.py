@@ -53,6 +53,12 @@ class TimecodeTests(unittest.TestCase):
         self.assertEqual(parse_hms_text("01:bad:03"), 0)
         self.assertEqual(parse_hms_text(""), 0)
 
+    def test_parse_hms_text_accepts_padded_signed_and_out_of_range_parts(self):
+        self.assertEqual(parse_hms_text(" 100:05:09 "), 360309)
+        self.assertEqual(parse_hms_text("00:90:90"), 3599)
+        self.assertEqual(parse_hms_text("+1:00:00"), 3600)
+        self.assertEqual(parse_hms_text("-1:00:30"), 30)
+
 
 class PathHelperTests(unittest.TestCase):
     def test_data_dir_uses_requested_app_name(self):
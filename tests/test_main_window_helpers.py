@@ -13,6 +13,12 @@ from PySide6.QtGui import QCloseEvent, QFont, QKeySequence
 from PySide6.QtWidgets import QComboBox, QDialog, QToolBar, QWidget
 
 from isrc_manager import main_window
+from isrc_manager.catalog_table import (
+    CatalogColumnSpec,
+    CatalogRowSnapshot,
+    CatalogSnapshot,
+    CatalogTableModel,
+)
 from isrc_manager.main_window import App
 from isrc_manager.selection_scope import TrackChoice
 from tests.qt_test_helpers import require_qapplication
@@ -851,6 +857,10 @@ def test_main_window_clipboard_helper_covers_empty_select_all_headers_and_sparse
     assert table.select_all_calls == 1
     assert clipboard.text() == "Title\tArtist\t\nSong\t\tAlbum\n\tArtist\t"
 
+    selection.selection = [FakeIndex(1, 1)]
+    app._copy_selection_to_clipboard()
+    assert clipboard.text() == "Artist"
+
     selection.selection = []
     table.selectAll = lambda: None
     app._copy_selection_to_clipboard()
@@ -1165,7 +1175,9 @@ def test_delete_entry_covers_confirmation_guards_success_and_error_callbacks(mon
     track_service = FakeTrackService()
     app.conn = fake_conn
     app.track_service = track_service
-    app.logger = SimpleNamespace(exception=lambda message: logger_exceptions.append(message))
+    app.logger = SimpleNamespace(
+        exception=lambda message, *args: logger_exceptions.append(message % args)
+    )
     app._capture_catalog_refresh_request = lambda focus_id=None: refresh_requests.append(
         focus_id
     ) or {"focus_id": focus_id}
@@ -1713,6 +1725,10 @@ def test_main_window_storage_conversion_blob_export_and_badge_workflows(
                 raise RuntimeError("blob missing")
             return b"blob-bytes", "image/png"
 
+        def export_blob_to_path(self, track_id: int, field_id: int, dest_path: Path):
+            Path(dest_path).write_bytes(b"blob-bytes")
+            return "image/png"
+
         def delete_blob(self, track_id: int, field_id: int) -> None:
             self.deleted.append((track_id, field_id))
 
@@ -1757,18 +1773,23 @@ def test_main_window_storage_conversion_blob_export_and_badge_workflows(
     assert warnings[-1] == ("Export", "bad export target")
     app.cf_export_blob(8, 10)
     assert audio_exports[-1]["resolved_dest_path"] == tmp_path / "good.wav"
-    assert audio_exports[-1]["load_source"](SimpleNamespace(custom_field_values=custom_values)) == (
-        b"blob-bytes",
-        "image/png",
+    streamed_path = tmp_path / "streamed.wav"
+    audio_exports[-1]["write_source"](
+        SimpleNamespace(custom_field_values=custom_values),
+        streamed_path,
     )
+    assert streamed_path.read_bytes() == b"blob-bytes"
+
+    assert audio_exports[-1]["media_label"] == "audio"
 
-    custom_values.fetch_raises = True
-    app.cf_export_blob(8, 20, parent_widget="parent")
-    assert criticals[-1] == ("Export failed", "blob missing")
-    custom_values.fetch_raises = False
-    app.cf_export_blob(8, 20, suggested_basename="Manual Name")
-    assert exports[-1]["suggested_basename"] == "Manual Name"
-    assert exports[-1]["payload"] == {"track_id": 8, "field_id": 20}
+    save_paths = iter([(str(tmp_path / "Manual Name.png"), "")])
+    app.cf_export_blob(8, 20, parent_widget="parent", suggested_basename="Manual Name")
+    assert exports == []
+    assert audio_exports[-1]["task_title"] == "Export Image File"
+    assert audio_exports[-1]["media_label"] == "image"
+    assert audio_exports[-1]["parent_widget"] == "parent"
+    assert audio_exports[-1]["payload"] == {"track_id": 8, "field_id": 20}
+    assert audio_exports[-1]["resolved_dest_path"] == tmp_path / "Manual Name.png"
 
     open_paths = iter(["", str(tmp_path / "image.png"), str(tmp_path / "audio.wav")])
     monkeypatch.setattr(
@@ -2023,11 +2044,58 @@ def test_main_window_storage_conversion_blob_export_and_badge_workflows(
     assert app._custom_field_index_by_id(99) == -1
     app.track_service = SimpleNamespace(fetch_track_title=lambda track_id, **_kwargs: "A/B:C")
     app.cursor = object()
+    vars(app).pop("_default_export_filename", None)
     assert app._make_default_export_filename(8, {}, "application/octet-stream") == "A_B_C.bin"
+    assert app._make_default_export_filename(8, {}, "audio/wav") == "A_B_C.wav"
     app.catalog_reads = SimpleNamespace(list_tracks=lambda: ["track"])
     assert app._list_all_tracks() == ["track"]
 
 
+def test_main_window_track_title_prefers_loaded_catalog_snapshot() -> None:
+    app = _app()
+    lookups: list[int] = []
+    app.cursor = object()
+    app.track_service = SimpleNamespace(
+        fetch_track_title=lambda track_id, **_kwargs: lookups.append(track_id) or "From DB"
+    )
+    app._catalog_table_model = CatalogTableModel(
+        snapshot=CatalogSnapshot(
+            column_specs=(CatalogColumnSpec(key="base:track_title", header_text="Track Title"),),
+            rows=(
+                CatalogRowSnapshot(track_id=3, cells_by_key={"base:track_title": "Loaded"}),
+                CatalogRowSnapshot(track_id=4, cells_by_key={"base:track_title": ""}),
+            ),
+        )
+    )
+
+    assert app._get_track_title(3) == "Loaded"
+    assert lookups == []
+    assert app._get_track_title(4) == "From DB"
+    assert app._get_track_title(5) == "From DB"
+    assert lookups == [4, 5]
+
+
+def test_main_window_reuses_header_state_manager_per_profile() -> None:
+    app = _app()
+    app.settings = _Settings()
+    app._catalog_header_state_managers = {}
+    app.current_db_path = "/tmp/music-catalog.db"
+
+    manager = app._catalog_header_state_manager()
+    assert app._catalog_header_state_manager() is manager
+    assert app._catalog_header_state_manager(path="/tmp/music-catalog.db") is manager
+    assert app._table_settings_prefix() == manager.settings_prefix()
+
+    other = app._catalog_header_state_manager(path="/tmp/other.db")
+    assert other is not manager
+    assert other.settings_prefix() != manager.settings_prefix()
+
+    app.settings = _Settings()
+    rebuilt = app._catalog_header_state_manager()
+    assert rebuilt is not manager
+    assert rebuilt.settings() is app.settings
+
+
 def test_main_window_table_header_layout_visibility_and_state_workflows(monkeypatch) -> None:
     require_qapplication()
     app = _app()
@@ -2362,9 +2430,18 @@ def test_table_layout_history_hint_and_resize_edge_paths(monkeypatch) -> None:
     assert saves == []
     app._suspend_layout_history = False
     app._table_settings_prefix = lambda: "table/profile"
+    save_timer = SimpleNamespace(starts=[], stops=0)
+    save_timer.start = save_timer.starts.append
+    save_timer.stop = lambda: setattr(save_timer, "stops", save_timer.stops + 1)
+    app._header_save_timer = save_timer
     app._on_header_layout_changed()
     app._on_header_sections_reordered()
-    assert saves[-2:] == [
+    app._on_header_sections_reordered()
+    assert saves == [{}]
+    assert save_timer.starts == [App.HEADER_REORDER_SAVE_DELAY_MS] * 2
+    app._flush_header_reorder_save()
+    app._flush_header_reorder_save()
+    assert saves == [
         {},
         {
             "action_label": "Reorder Columns",
@@ -3775,7 +3852,7 @@ def test_shortcut_zoom_audit_and_refresh_helper_edge_paths(monkeypatch, tmp_path
                 raise RuntimeError("commit failed")
 
     app.cursor = FakeCursor()
-    app.logger = SimpleNamespace(exception=lambda message: exceptions.append(str(message)))
+    app.logger = SimpleNamespace(exception=lambda message, *args: exceptions.append(message % args))
     app._log_trace = lambda event, **payload: traces.append((event, payload))
     app._audit("CREATE", "Track", ref_id=7, details="isrc=demo", user="tester")
     assert executed[-1][1] == ("tester", "CREATE", "Track", "7", "isrc=demo")
@@ -4187,7 +4264,9 @@ def test_save_validation_media_generation_and_rollback_paths(monkeypatch) -> Non
             rollbacks.append("rollback")
 
     app.conn = FakeConnection()
-    app.logger = SimpleNamespace(exception=lambda message: logged_exceptions.append(str(message)))
+    app.logger = SimpleNamespace(
+        exception=lambda message, *args: logged_exceptions.append(message % args)
+    )
     app.track_service = object()
     app.cursor = object()
     app._current_work_track_context = lambda: {"mode": "create_new_work"}
@@ -4341,7 +4420,9 @@ def test_main_window_history_setting_and_file_actions_cover_rollback_and_recordi
     tmp_path: Path,
 ) -> None:
     app = _app()
-    app.logger = SimpleNamespace(exception=lambda message: log_messages.append(message))
+    app.logger = SimpleNamespace(
+        exception=lambda message, *args: log_messages.append(message % args)
+    )
     log_messages: list[str] = []
     refreshes: list[str] = []
     app._refresh_history_actions = lambda: refreshes.append("refresh")
@@ -4544,7 +4625,9 @@ def test_main_window_history_candidate_undo_redo_and_session_profile_workflows(
         lambda _parent, title, message: critical_messages.append((title, message)),
     )
 
-    app.logger = SimpleNamespace(exception=lambda message: log_messages.append(message))
+    app.logger = SimpleNamespace(
+        exception=lambda message, *args: log_messages.append(message % args)
+    )
     app._refresh_history_actions = lambda: refresh_actions.append("actions")
     app._refresh_after_history_change = lambda: refresh_after.append("after")
     app.history_dialog = SimpleNamespace(
@@ -4965,6 +5048,7 @@ def test_main_window_database_maintenance_workflows_record_history_and_recover(
                 snapshot_id=len(self.snapshots) + 1,
                 kind=kind,
                 label=label,
+                db_snapshot_path=str(tmp_path / f"snapshot-{len(self.snapshots) + 1}.db"),
             )
             self.snapshots.append(snapshot)
             return snapshot
@@ -4980,13 +5064,17 @@ def test_main_window_database_maintenance_workflows_record_history_and_recover(
         def __init__(self) -> None:
             self.restore_results: list[SimpleNamespace] = []
             self.restore_calls: list[tuple[str, str]] = []
+            self.prefer_vacuum_calls: list[bool] = []
 
-        def create_backup(self, _conn, src):
+        def create_backup(self, _conn, src, *, prefer_vacuum=False, progress_callback=None):
             assert Path(src) == current_db
+            self.prefer_vacuum_calls.append(prefer_vacuum)
+            progress_callback(4, 8, "Copied 4 of 8 database pages.")
             return SimpleNamespace(backup_path=backup_db, method="online")
 
-        def verify_integrity(self, path):
+        def verify_integrity(self, path, *, conn=None):
             assert path == str(current_db)
+            assert conn is app.conn
             return "ok"
 
         def restore_database(self, source_path, target_path):
@@ -4996,10 +5084,16 @@ def test_main_window_database_maintenance_workflows_record_history_and_recover(
     class FakeBundleContext:
         def __init__(self) -> None:
             self.statuses: list[str] = []
+            self.progress: list[tuple[int, int, str]] = []
 
         def set_status(self, message: str) -> None:
             self.statuses.append(message)
 
+        def report_progress(self, *, value, maximum, message) -> None:
+            self.progress.append((value, maximum, message))
+            bundle_progress.append((value, maximum, message))
+
+    bundle_progress: list[tuple[int, int, str]] = []
     history = FakeHistoryManager()
     maintenance = FakeMaintenance()
     app.current_db_path = str(tmp_path / "missing.db")
@@ -5007,6 +5101,7 @@ def test_main_window_database_maintenance_workflows_record_history_and_recover(
     app.history_manager = history
     app.conn = object()
     app.database_maintenance = maintenance
+    app.settings = _Settings()
     app.logger = SimpleNamespace(
         exception=lambda message, *args: logger_messages.append(message % args if args else message)
     )
@@ -5044,11 +5139,16 @@ def test_main_window_database_maintenance_workflows_record_history_and_recover(
     app.current_db_path = str(current_db)
     app.backup_database()
     assert bundle_statuses[-1] == ["Creating a database backup..."]
+    assert maintenance.prefer_vacuum_calls == [False]
+    assert bundle_progress == [(4, 8, "Copied 4 of 8 database pages.")]
     assert history.file_actions[-1]["action_type"] == "file.db_backup"
     assert history.backups[-1]["kind"] == "manual"
     assert information[-1] == ("Backup", f"Backup created:\n{backup_db}")
     assert log_events[-1][0] == "db.backup"
     assert background_errors[-1][0] == "Backup Error"
+    app.settings.setValue(App.BACKUP_PREFER_VACUUM_SETTINGS_KEY, True)
+    app.backup_database()
+    assert maintenance.prefer_vacuum_calls == [False, True]
 
     app.verify_integrity()
     assert bundle_statuses[-1] == ["Running SQLite integrity check..."]
@@ -5128,6 +5228,66 @@ def test_main_window_database_maintenance_workflows_record_history_and_recover(
         "finalization failed",
     )
 
+    compact_calls: list[dict[str, object]] = []
+    compact_connection_closes: list[str] = []
+
+    def maintain_database(conn, db_path, *, close_connection=None, reopen_connection=None):
+        compact_calls.append(
+            {
+                "conn": conn,
+                "db_path": db_path,
+                "has_callbacks": close_connection is not None and reopen_connection is not None,
+            }
+        )
+        return SimpleNamespace(method="vacuum_into", freed_pages=12)
+
+    compact_connection = SimpleNamespace(close=lambda: compact_connection_closes.append("close"))
+    maintenance.maintain_database = maintain_database
+    app.sqlite_connection_factory = SimpleNamespace(open=lambda _path: compact_connection)
+    app.open_database = lambda path: opened.append(str(path))
+    worker_stops: list[bool] = []
+    app._stop_audio_waveform_cache_worker = lambda *, wait=False: worker_stops.append(wait)
+    start_checks: list[tuple[str, str]] = []
+
+    def can_start(*, kind, unique_key):
+        start_checks.append((kind, unique_key))
+        return (len(start_checks) > 1, "Another background task is already running.")
+
+    app.background_tasks = SimpleNamespace(can_start=can_start)
+    closed.clear()
+    opened.clear()
+
+    app.compact_database()
+    assert warnings[-1] == ("Compact Database", "Another background task is already running.")
+    assert closed == []
+    assert worker_stops == []
+
+    app.compact_database()
+
+    assert start_checks[-1] == ("exclusive", "db.compact")
+    assert worker_stops == [True]
+    assert closed == ["close"]
+    assert task_statuses[-1] == ["Compacting the database..."]
+    assert compact_calls == [
+        {"conn": compact_connection, "db_path": str(current_db), "has_callbacks": True}
+    ]
+    assert compact_connection_closes == ["close"]
+    assert opened == [str(current_db), str(current_db)]
+    assert history.events[-1]["action_type"] == "db.compact"
+    assert history.events[-1]["payload"]["freed_pages"] == 12
+    assert information[-1] == ("Compact Database", "Released 12 free pages (vacuum_into).")
+    assert log_events[-1][0] == "db.compact"
+    assert audits[-2][0] == "COMPACT"
+    assert background_errors[-1] == (
+        "Compact Error",
+        "Failed to compact the database:",
+        "restore worker failed",
+    )
+
+    app.current_db_path = str(tmp_path / "missing.db")
+    app.compact_database()
+    assert warnings[-1] == ("Compact Database", "No current database to compact.")
+
 
 def test_main_window_album_track_ordering_dialog_covers_noop_and_reorder_paths(
     monkeypatch,
@@ -259,6 +259,14 @@ def test_tag_preview_rows_skip_empty_fields_and_preserve_source() -> None:
     ]
 
 
+def test_coerce_export_bytes_reuses_bytes_behind_whole_memoryviews() -> None:
+    payload = b"stored-audio"
+
+    assert export_controller._coerce_export_bytes(memoryview(payload)) is payload
+    assert export_controller._coerce_export_bytes(memoryview(payload)[1:4]) == b"tor"
+    assert export_controller._coerce_export_bytes(bytearray(b"raw")) == b"raw"
+
+
 @pytest.mark.parametrize(
     ("track_id", "title", "expected"),
     [
@@ -297,6 +305,9 @@ def test_root_hooks_and_export_filename_destination_helpers(
     assert export_controller._export_extension_for_mime("image/jpeg") == ".jpg"
     monkeypatch.setattr(export_controller.mimetypes, "guess_extension", lambda _mime: None)
     assert export_controller._export_extension_for_mime("image/custom") == ".png"
+    assert export_controller._export_extension_for_mime("audio/wav") == ".wav"
+    assert export_controller._export_extension_for_mime(" Audio/OGG ") == ".ogg"
+    assert export_controller._export_extension_for_mime("audio/x-flac") == ".flac"
     assert export_controller._export_extension_for_mime("audio/custom") == ".wav"
     assert export_controller._export_extension_for_mime("application/custom") == ".bin"
 
@@ -47,12 +47,27 @@ def test_detect_mime_identifies_common_image_and_audio_headers():
     assert player_controller._detect_mime(app, b"unknown") == ""
 
 
+def test_detect_mime_rejects_truncated_or_mismatched_magic():
+    app = SimpleNamespace()
+
+    assert player_controller._detect_mime(app, b"\x89PNGrest") == ""
+    assert player_controller._detect_mime(app, b"GIF80rest") == ""
+    assert player_controller._detect_mime(app, b"RIFFxxxxAVI rest") == ""
+    assert player_controller._detect_mime(app, b"RIFFxxxxWAV") == ""
+    assert player_controller._detect_mime(app, bytes([0xFF, 0x00])) == ""
+    assert player_controller._detect_mime(app, b"ID") == ""
+    assert player_controller._detect_mime(app, memoryview(b"RIFFxxxxWAVE")) == "audio/wav"
+    assert player_controller._detect_mime(app, b"") == ""
+
+
 def test_preview_blob_bytes_routes_images_and_audio_payloads():
     image_calls = []
     audio_calls = []
     app = SimpleNamespace(
         _detect_mime=lambda data: player_controller._detect_mime(SimpleNamespace(), data),
-        _open_image_preview=lambda data, title: image_calls.append((data, title)),
+        _open_image_preview=lambda data, title, image=None: image_calls.append(
+            (data, title, image.size().toTuple())
+        ),
         _open_audio_preview=lambda data, mime, title: audio_calls.append((data, mime, title)),
     )
     png_bytes = _one_pixel_png()
@@ -63,11 +78,33 @@ def test_preview_blob_bytes_routes_images_and_audio_payloads():
     player_controller._preview_blob_bytes(app, (b"ID3audio", "audio/mpeg"), "Audio")
     player_controller._preview_blob_bytes(app, b"raw bytes", "Fallback")
 
-    assert image_calls == [(png_bytes, "Cover")]
+    assert image_calls == [(png_bytes, "Cover", (1, 1))]
     assert audio_calls[0] == (b"ID3audio", "audio/mpeg", "Audio")
     assert audio_calls[1] == (b"raw bytes", "audio/wav", "Fallback")
 
 
+def test_preview_blob_bytes_skips_image_probe_for_audio_payloads(monkeypatch):
+    audio_calls = []
+    open_image = mock.Mock()
+    from_data = mock.Mock()
+    app = SimpleNamespace(
+        _detect_mime=lambda data: player_controller._detect_mime(SimpleNamespace(), data),
+        _open_image_preview=open_image,
+        _open_audio_preview=lambda data, mime, title: audio_calls.append((data, mime, title)),
+    )
+    monkeypatch.setattr(player_controller, "QImage", SimpleNamespace(fromData=from_data))
+
+    player_controller._preview_blob_bytes(app, (b"raw", "audio/flac"), "Tagged")
+    player_controller._preview_blob_bytes(app, b"fLaCframes", "Sniffed")
+
+    from_data.assert_not_called()
+    open_image.assert_not_called()
+    assert audio_calls == [
+        (b"raw", "audio/flac", "Tagged"),
+        (b"fLaCframes", "audio/flac", "Sniffed"),
+    ]
+
+
 def test_media_player_icon_and_preview_blob_error_fallbacks(monkeypatch, tmp_path):
     missing_icon_app = SimpleNamespace(_media_player_icon_path=lambda: tmp_path / "missing.svg")
     assert player_controller._media_player_action_icon(missing_icon_app).isNull()
@@ -75,7 +112,9 @@ def test_media_player_icon_and_preview_blob_error_fallbacks(monkeypatch, tmp_pat
     audio_calls = []
     app = SimpleNamespace(
         _detect_mime=lambda data: "",
-        _open_image_preview=lambda data, title: (_ for _ in ()).throw(RuntimeError("image fail")),
+        _open_image_preview=lambda data, title, image=None: (_ for _ in ()).throw(
+            RuntimeError("image fail")
+        ),
         _open_audio_preview=lambda data, mime, title: audio_calls.append((data, mime, title)),
     )
     monkeypatch.setattr(
@@ -154,12 +193,17 @@ def test_audio_preview_navigation_uses_media_column_and_fallback_sources():
 
     controller.visible_track_ids.return_value = []
     app.catalog_reads = SimpleNamespace(list_tracks=mock.Mock(return_value=[(7, "Seven")]))
-    app.cf_has_blob = mock.Mock(side_effect=lambda track_id, field_id: track_id in {5, 7})
+    app.cf_track_ids_with_blob = mock.Mock(
+        side_effect=lambda track_ids, field_id: {
+            track_id for track_id in track_ids if track_id in {5, 7}
+        }
+    )
     app.track_has_media = mock.Mock(side_effect=lambda track_id, media_key: track_id == 6)
     assert player_controller._audio_preview_navigation_track_ids(
         app,
         {"kind": "custom", "field_id": 9},
     ) == [5]
+    app.cf_track_ids_with_blob.assert_called_once_with([4, 5, 6], 9)
     controller.visible_track_ids.return_value = [6, 7]
     assert player_controller._audio_preview_navigation_track_ids(
         app,
@@ -176,7 +220,7 @@ def test_audio_preview_navigation_uses_media_column_and_fallback_sources():
         == []
     )
     controller.visible_track_ids.return_value = [8]
-    app.cf_has_blob.side_effect = RuntimeError("blob lookup failed")
+    app.cf_track_ids_with_blob.side_effect = RuntimeError("blob lookup failed")
     assert (
         player_controller._audio_preview_navigation_track_ids(
             app,
@@ -508,7 +552,7 @@ def test_open_image_and_audio_preview_dialogs_use_root_dialogs_and_error_message
         def __init__(self, app, parent=None):
             self.calls = []
 
-        def set_preview(self, data, title):
+        def set_preview(self, data, title, image=None):
             self.calls.append((data, title))
 
     class FailingAudioDialog:
@@ -552,7 +596,7 @@ def test_open_image_and_audio_preview_dialogs_use_root_dialogs_and_error_message
     app.logger.exception.assert_called_once()
 
     class FailingImageDialog(FakeImageDialog):
-        def set_preview(self, data, title):
+        def set_preview(self, data, title, image=None):
             raise ValueError("not an image")
 
     app.image_preview_dialog = None
@@ -601,7 +645,7 @@ def test_existing_preview_dialog_instances_are_reused():
         def __init__(self):
             self.calls = []
 
-        def set_preview(self, data, title):
+        def set_preview(self, data, title, image=None):
             self.calls.append((data, title))
 
     class ExistingAudioDialog:
@@ -4,6 +4,7 @@ import os
 import sqlite3
 import threading
 import time
+from concurrent.futures import Future
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -617,6 +618,57 @@ def test_build_audio_preview_preload_success_cancel_and_error(monkeypatch, tmp_p
     assert "decode failed" in error_result.error
 
 
+def test_build_audio_preview_preload_reuses_persistent_waveform_cache(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    source_path = tmp_path / "cached.wav"
+    source_path.write_bytes(b"audio")
+    db_path = tmp_path / "profile.db"
+    sqlite3.connect(db_path).close()
+    lookups: list[tuple[int, bool]] = []
+
+    class _FakeCacheService:
+        def __init__(self, conn) -> None:
+            self.conn = conn
+
+        def get_cached_waveform(self, track_id, *, track_service=None, validate_source=False):
+            lookups.append((track_id, validate_source))
+            return SimpleNamespace(peaks=[(-0.4, 0.6)])
+
+    monkeypatch.setattr(preview, "AudioWaveformCacheService", _FakeCacheService)
+    monkeypatch.setattr(
+        preview,
+        "_audio_preview_fetch_source_for_preload",
+        lambda _task: (str(source_path), False, "audio/wav", 5),
+    )
+    monkeypatch.setattr(
+        preview,
+        "load_wav_peaks",
+        lambda _path, _width: pytest.fail("cached peaks should skip decoding"),
+    )
+    monkeypatch.setattr(preview, "load_audio_spectrum_frames", lambda _path: [])
+    monkeypatch.setattr(preview, "load_audio_peak_meter_frames", lambda _path: [])
+
+    result = preview._build_audio_preview_preload(
+        _preload_task(
+            db_path=str(db_path),
+            source_spec={"kind": "standard", "media_key": "audio_file"},
+        )
+    )
+    assert result.error == ""
+    assert result.prepared is not None
+    assert result.prepared.waveform_peaks == [(-0.4, 0.6)]
+    assert lookups == [(3, True)]
+
+    custom_task = _preload_task(
+        db_path=str(db_path),
+        source_spec={"kind": "custom", "field_id": 4},
+    )
+    assert preview._audio_preview_cached_waveform_peaks(custom_task) is None
+    assert lookups == [(3, True)]
+
+
 def test_build_audio_preview_preload_handles_state_errors_and_late_cancellation(
     monkeypatch,
     tmp_path: Path,
@@ -1978,6 +2030,55 @@ def test_image_preview_dialog_zoom_export_gesture_and_artwork_label_paths(
         dialog.deleteLater()
 
 
+def test_image_preview_dialog_reuses_predecoded_image(monkeypatch) -> None:
+    require_qapplication()
+    app = SimpleNamespace(_detect_mime=lambda data: "image/png" if data else "")
+    dialog = preview._ImagePreviewDialog(app)
+    try:
+        image_data = _png_bytes()
+        image = QImage.fromData(image_data)
+        monkeypatch.setattr(
+            preview,
+            "QImage",
+            SimpleNamespace(fromData=lambda data: pytest.fail("image decoded twice")),
+        )
+        dialog.set_preview(image_data, "Prepared", image=image)
+        assert dialog._base_pix.size() == image.size()
+        assert dialog._current_data == image_data
+    finally:
+        dialog.close()
+        dialog.deleteLater()
+
+
+def test_image_preview_dialog_defers_smooth_scaling_during_zoom_bursts() -> None:
+    require_qapplication()
+    app = SimpleNamespace(_detect_mime=lambda data: "image/png" if data else "")
+    dialog = preview._ImagePreviewDialog(app)
+    try:
+        dialog.set_preview(_png_bytes(width=200, height=100), "Burst")
+        dialog._smooth_zoom_timer.timeout.emit()
+        dialog._set_zoom_percent(50)
+        assert dialog._image_label.pixmap().size().toTuple() == (100, 50)
+        settled = dialog._smoothed_pixmaps[(100, 50)]
+        assert dialog._smooth_zoom_timer.isActive()
+
+        dialog._set_zoom_percent(150)
+        assert dialog._image_label.pixmap().size().toTuple() == (300, 150)
+        assert (300, 150) not in dialog._smoothed_pixmaps
+
+        dialog._smooth_zoom_timer.timeout.emit()
+        assert not dialog._smooth_zoom_timer.isActive()
+        assert (300, 150) in dialog._smoothed_pixmaps
+
+        dialog._set_zoom_percent(50)
+        assert dialog._smoothed_pixmaps[(100, 50)] is settled
+        assert not dialog._smooth_zoom_timer.isActive()
+        assert len(dialog._smoothed_pixmaps) <= preview.IMAGE_PREVIEW_SMOOTH_CACHE_SIZE
+    finally:
+        dialog.close()
+        dialog.deleteLater()
+
+
 def test_audio_preview_dialog_icon_menu_logging_and_selection_edge_guards(
     monkeypatch,
     tmp_path: Path,
@@ -2464,6 +2565,142 @@ def test_audio_preview_dialog_preload_cache_waveform_navigation_and_cleanup_edge
     reset_dialog._reset_player_source()
 
 
+class _InlineExecutor:
+    def __init__(self) -> None:
+        self.submitted: list[object] = []
+
+    def submit(self, fn):
+        self.submitted.append(fn)
+        future: Future = Future()
+        future.set_result(fn())
+        return future
+
+
+def _streaming_waveform_dialog(published, shown, visibility):
+    dialog = preview._AudioPreviewDialog.__new__(preview._AudioPreviewDialog)
+    dialog._source_spec = {"kind": "raw"}
+    dialog._current_track_id = None
+    dialog._audio_load_executor = _InlineExecutor()
+    dialog._audio_preload_bridge = SimpleNamespace(
+        waveform_peaks=SimpleNamespace(emit=published.append)
+    )
+    dialog.wave = SimpleNamespace(
+        width=lambda: 120,
+        set_peaks=lambda peaks, expected_count=None: shown.append((list(peaks), expected_count)),
+        setVisible=lambda visible: visibility.__setitem__("wave", visible),
+    )
+    dialog.wave_status_label = SimpleNamespace(
+        setText=lambda text: visibility.__setitem__("text", text),
+        setVisible=lambda visible: visibility.__setitem__("label", visible),
+    )
+    return dialog
+
+
+def test_audio_preview_streams_uncached_waveform_peaks_into_the_widget(monkeypatch) -> None:
+    published: list[tuple[object, ...]] = []
+    shown: list[tuple[list[object], int | None]] = []
+    visibility: dict[str, object] = {}
+    dialog = _streaming_waveform_dialog(published, shown, visibility)
+
+    def fake_load(_path, width_px, *, on_peaks=None, cancel_event=None):
+        assert width_px == 480
+        assert cancel_event is not None and not cancel_event.is_set()
+        on_peaks([(-0.1, 0.2)], 3)
+        on_peaks([(-0.3, 0.4)], 3)
+        return [(-0.1, 0.2), (-0.3, 0.4), (-0.5, 0.6)]
+
+    monkeypatch.setattr(preview, "load_wav_peaks", fake_load)
+    dialog._load_waveform_peaks("preview.mp3")
+    assert len(dialog._audio_load_executor.submitted) == 1
+    assert visibility == {"wave": True, "label": False}
+    assert [payload[3] for payload in published] == [False, False, True]
+    # The previous waveform is not blanked while the new decode starts.
+    assert shown == []
+
+    for payload in published:
+        dialog._on_waveform_stream_update(payload)
+    assert shown == [
+        ([(-0.1, 0.2)], 3),
+        ([(-0.1, 0.2), (-0.3, 0.4)], 3),
+        ([(-0.1, 0.2), (-0.3, 0.4), (-0.5, 0.6)], None),
+    ]
+
+    # A newer request drops whatever the superseded decode still reports.
+    dialog._waveform_stream_generation += 1
+    dialog._on_waveform_stream_update(published[0])
+    assert len(shown) == 3
+
+    dialog._on_waveform_stream_update((dialog._waveform_stream_generation, [], None, True))
+    assert visibility["text"] == "Waveform unavailable"
+    assert visibility["wave"] is False
+
+
+def test_audio_preview_cancels_superseded_waveform_decodes(monkeypatch) -> None:
+    published: list[tuple[object, ...]] = []
+    dialog = _streaming_waveform_dialog(published, [], {})
+    cancel_events: list[threading.Event] = []
+    pending: list[object] = []
+
+    class DeferredExecutor:
+        def submit(self, fn):
+            pending.append(fn)
+            return Future()
+
+    def fake_load(_path, _width_px, *, on_peaks=None, cancel_event=None):
+        cancel_events.append(cancel_event)
+        on_peaks([(-0.1, 0.2)], 1)
+        return [(-0.1, 0.2)]
+
+    monkeypatch.setattr(preview, "load_wav_peaks", fake_load)
+    dialog._audio_load_executor = DeferredExecutor()
+    dialog._load_waveform_peaks("preview.mp3")
+    first_future, _first_event = dialog._waveform_stream_job
+
+    # A resize supersedes the queued decode before it reports anything.
+    dialog._load_waveform_peaks("preview.mp3")
+    assert first_future.cancelled()
+    pending[0]()
+    assert cancel_events[0].is_set()
+    assert published == []
+
+    pending[1]()
+    assert [payload[3] for payload in published] == [False, True]
+
+    dialog._audio_torn_down = False
+    dialog._visualization_timer = SimpleNamespace(stop=lambda: None)
+    dialog._cancel_audio_load_jobs = lambda **_kwargs: None
+    dialog._cancel_audio_preload_jobs = lambda **_kwargs: None
+    dialog._reset_player_source = lambda: None
+    dialog._cleanup_temp_file = lambda: None
+    dialog._evict_audio_preload_cache = lambda *_args, **_kwargs: None
+    dialog._audio_load_executor = None
+    dialog._audio_preload_executor = None
+    dialog._teardown_audio()
+    assert cancel_events[1].is_set()
+    assert dialog._waveform_stream_job is None
+
+
+def test_audio_preview_teardown_runs_once_per_close() -> None:
+    dialog = preview._AudioPreviewDialog.__new__(preview._AudioPreviewDialog)
+    calls: list[str] = []
+    dialog._visualization_timer = SimpleNamespace(stop=lambda: calls.append("timer"))
+    dialog._cancel_audio_load_jobs = lambda **_kwargs: calls.append("load-jobs")
+    dialog._cancel_audio_preload_jobs = lambda **_kwargs: calls.append("preload-jobs")
+    dialog._reset_player_source = lambda: calls.append("player")
+    dialog._cleanup_temp_file = lambda: calls.append("temp")
+    dialog._evict_audio_preload_cache = lambda *_args, **_kwargs: calls.append("evict")
+    dialog._audio_load_executor = None
+    dialog._audio_preload_executor = None
+
+    dialog._teardown_audio()
+    dialog._teardown_audio()
+    assert calls == ["timer", "load-jobs", "preload-jobs", "player", "temp", "evict"]
+
+    dialog._audio_torn_down = False
+    dialog._teardown_audio()
+    assert calls.count("player") == 2
+
+
 def test_audio_preview_dialog_buttons_album_equalizer_bookmarks_and_play_next(
     monkeypatch,
 ) -> None:
@@ -12,7 +12,15 @@ from types import SimpleNamespace
 
 import pytest
 from PySide6.QtCore import QBuffer, QByteArray, QEvent, QIODevice, QPointF, QRect, QRectF, QSize, Qt
-from PySide6.QtGui import QColor, QImage, QMouseEvent, QPainter, QPixmap, QPointingDevice
+from PySide6.QtGui import (
+    QColor,
+    QImage,
+    QMouseEvent,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QPointingDevice,
+)
 
 from isrc_manager.media import waveform as waveform_module
 from isrc_manager.media import waveform_cache
@@ -439,6 +447,72 @@ def test_waveform_widget_state_math_cached_images_and_events() -> None:
     )
 
 
+def test_static_waveform_render_shades_each_bar_pixel() -> None:
+    require_qapplication()
+    widget = WaveformWidget()
+    widget.resize(3, 120)
+    widget.set_peaks([(-0.5, 1.0), (0.0, 0.0), (-1.0, 0.1)])
+    rect = widget._waveform_rect(widget.rect())
+    image = widget._render_static_waveform_cache(rect).toImage()
+    scale = image.width() / 3
+    mid = rect.center().y() * scale
+    amplitude = rect.height() * scale * 0.47
+    center_row = int(round(mid))
+    top_row = int(round(mid - amplitude))
+
+    loud_rgb = widget._fallback_waveform_rgb_for_peak(1.0)
+    light_background = widget._relative_luminance(widget._window_background_color()) >= 0.5
+    top_rgb, center_rgb = waveform_cache._shade_waveform_pixels(
+        [loud_rgb, loud_rgb],
+        [1.0, 0.5],
+        [abs(top_row - mid) / amplitude, abs(center_row - mid) / (0.5 * amplitude)],
+        light_background=light_background,
+    ).tolist()
+    assert image.pixelColor(0, top_row) == QColor(*top_rgb, 255)
+    assert image.pixelColor(0, center_row) == QColor(*center_rgb, 255)
+    assert image.pixelColor(0, top_row - 1).alpha() == 0
+    assert image.pixelColor(int(scale), center_row).alpha() == 0
+    bottom_row = int(round(mid + amplitude))
+    assert image.pixelColor(image.width() - 1, bottom_row).alpha() == 255
+    assert image.pixelColor(image.width() - 1, bottom_row + 1).alpha() == 0
+
+
+def test_streamed_waveform_peaks_fill_from_the_left_until_complete() -> None:
+    require_qapplication()
+    widget = WaveformWidget()
+    widget.resize(4, 120)
+    widget.set_peaks([(-0.5, 0.5), (-0.5, 0.5)], expected_count=4)
+    rect = widget._waveform_rect(widget.rect())
+    image = widget._render_static_waveform_cache(rect).toImage()
+    center_row = int(round(rect.center().y() * image.width() / 4))
+    alphas = [image.pixelColor(x, center_row).alpha() for x in range(image.width())]
+    loaded = image.width() // 2
+    assert all(alphas[:loaded]) and not any(alphas[loaded:])
+
+    widget.set_peaks([(-0.5, 0.5)] * 4)
+    image = widget._render_static_waveform_cache(rect).toImage()
+    assert all(image.pixelColor(x, center_row).alpha() for x in range(image.width()))
+
+
+def test_waveform_overlay_pens_are_reused_until_the_background_changes() -> None:
+    require_qapplication()
+    widget = WaveformWidget()
+    palette = widget.palette()
+    palette.setColor(QPalette.Window, QColor("#ffffff"))
+    widget.setPalette(palette)
+
+    light_pens = widget._overlay_pens()
+    assert widget._overlay_pens() is light_pens
+    assert light_pens["playhead"].color() == QColor(255, 255, 255)
+
+    palette.setColor(QPalette.Window, QColor("#101010"))
+    widget.setPalette(palette)
+    dark_pens = widget._overlay_pens()
+    assert dark_pens is not light_pens
+    assert dark_pens["playhead"].color() == QColor(0, 0, 0)
+    assert dark_pens["marker"].width() == 2
+
+
 def test_waveform_widget_edge_events_and_render_paths() -> None:
     require_qapplication()
     widget = WaveformWidget()
@@ -666,10 +740,218 @@ def test_load_wav_peaks_handles_pcm_widths_and_invalid_files(tmp_path: Path) ->
     assert load_wav_peaks(str(invalid), 10) in ([], [(-0.0, 0.0)])
 
 
+def test_load_wav_peaks_memoizes_recent_results_until_the_file_changes(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    waveform_module._clear_wav_peaks_memo()
+    wav_path = tmp_path / "memo.wav"
+    _write_stereo_wav(wav_path, [(16384, -8192), (0, 0)], sample_rate=8000)
+    decodes: list[tuple[str, int]] = []
+    decode = waveform_module._decode_wav_peaks
+
+    def _counting_decode(path, width_px, **kwargs):
+        decodes.append((path, width_px))
+        return decode(path, width_px, **kwargs)
+
+    monkeypatch.setattr(waveform_module, "_decode_wav_peaks", _counting_decode)
+    first = load_wav_peaks(str(wav_path), 2)
+    first.append((-9.0, 9.0))
+    assert load_wav_peaks(str(wav_path), 2) == first[:-1]
+    assert len(decodes) == 1
+
+    load_wav_peaks(str(wav_path), 3)
+    assert len(decodes) == 2
+
+    # A database blob is materialized to a new temp file for every preview.
+    temp_copy = tmp_path / "preview-copy.wav"
+    temp_copy.write_bytes(wav_path.read_bytes())
+    assert load_wav_peaks(str(temp_copy), 2) == first[:-1]
+    assert len(decodes) == 2
+
+    _write_stereo_wav(wav_path, [(32767, -32768), (0, 0), (0, 0)], sample_rate=8000)
+    load_wav_peaks(str(wav_path), 2)
+    assert len(decodes) == 3
+    waveform_module._clear_wav_peaks_memo()
+
+
+def test_single_ffmpeg_decode_streams_peak_batches_as_buckets_complete(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "stream.bin"
+    source.write_bytes(b"not-riff")
+
+    import shutil
+    import subprocess
+
+    monkeypatch.setattr(shutil, "which", lambda name: f"/fake/{name}")
+    monkeypatch.setattr(subprocess, "check_output", lambda *_args, **_kwargs: b"1.0")
+    # 100 px gives 400 buckets; 1 s at the resulting 25.6 kHz rate is 64 frames per bucket.
+    bucket_bytes = 64 * 4
+    payload = b"".join(
+        struct.pack("<hh", 64 * (index + 1), -64 * (index + 1)) * 64 for index in range(400)
+    )
+
+    class _ChunkedStdout:
+        def __init__(self) -> None:
+            self._payload = payload
+
+        def read(self, _size: int) -> bytes:
+            chunk, self._payload = (
+                self._payload[: 100 * bucket_bytes],
+                self._payload[100 * bucket_bytes :],
+            )
+            return chunk
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr(
+        subprocess,
+        "Popen",
+        lambda *_args, **_kwargs: SimpleNamespace(stdout=_ChunkedStdout(), wait=lambda **_kw: 0),
+    )
+    streamed: list[tuple[int, int | None]] = []
+    collected: list[tuple[float, float]] = []
+
+    def _on_peaks(batch, expected_count) -> None:
+        streamed.append((len(batch), expected_count))
+        collected.extend(batch)
+
+    peaks = waveform_module._decode_wav_peaks(str(source), 100, on_peaks=_on_peaks)
+    assert len(peaks) == 400
+    assert streamed == [(300, 400), (100, 400)]
+    assert collected == peaks
+
+
+def test_cancelled_ffmpeg_decode_kills_the_process_and_is_not_memoized(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    waveform_module._clear_wav_peaks_memo()
+    source = tmp_path / "cancel.bin"
+    source.write_bytes(b"not-riff")
+
+    import shutil
+    import subprocess
+    import threading
+
+    monkeypatch.setattr(shutil, "which", lambda name: f"/fake/{name}")
+    monkeypatch.setattr(subprocess, "check_output", lambda *_args, **_kwargs: b"1.0")
+    reads: list[int] = []
+    kills: list[str] = []
+
+    class _EndlessStdout:
+        def read(self, _size: int) -> bytes:
+            reads.append(1)
+            return struct.pack("<hh", 1024, -1024) * 64 * 100 if len(reads) < 50 else b""
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr(
+        subprocess,
+        "Popen",
+        lambda *_args, **_kwargs: SimpleNamespace(
+            stdout=_EndlessStdout(),
+            wait=lambda **_kw: 0,
+            kill=lambda: kills.append("kill"),
+        ),
+    )
+    cancel_event = threading.Event()
+    streamed: list[int] = []
+
+    def _on_peaks(batch, _expected_count) -> None:
+        streamed.append(len(batch))
+        cancel_event.set()
+
+    peaks = load_wav_peaks(str(source), 100, on_peaks=_on_peaks, cancel_event=cancel_event)
+
+    assert peaks == []
+    assert streamed == [300]
+    assert kills == ["kill"]
+    assert len(reads) == 3
+    assert (
+        waveform_module._wav_peaks_memo_key(str(source), 100) not in waveform_module._wav_peaks_memo
+    )
+
+
+def test_long_ffmpeg_sources_decode_bucket_aligned_segments_in_order(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "long.bin"
+    source.write_bytes(b"not-riff")
+
+    import os
+    import shutil
+    import subprocess
+
+    monkeypatch.setattr(shutil, "which", lambda name: f"/fake/{name}")
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(subprocess, "check_output", lambda *_args, **_kwargs: b"120")
+    commands: list[list[str]] = []
+    # 120 s at the 8 kHz floor gives 8 buckets of 120000 frames, two per segment.
+    segment_frames = 240_000
+
+    class _FakeStdout:
+        def __init__(self, payload: bytes) -> None:
+            self._payload = payload
+
+        def read(self, size: int) -> bytes:
+            chunk, self._payload = self._payload[:size], self._payload[size:]
+            return chunk
+
+        def close(self) -> None:
+            pass
+
+    class _FakeProcess:
+        def __init__(self, payload: bytes) -> None:
+            self.stdout = _FakeStdout(payload)
+
+        def wait(self, *, timeout=None):
+            return 0
+
+        def kill(self) -> None:
+            pass
+
+    def _popen(command, **_kwargs):
+        commands.append(list(command))
+        index = len(commands) - 1
+        amplitude = 4096 * (index + 1)
+        payload = struct.pack("<hh", amplitude, -amplitude // 2) * segment_frames
+        # Output past the requested span must not leak into the next segment's buckets.
+        payload += struct.pack("<hh", 32767, -32768) * 1000
+        return _FakeProcess(payload)
+
+    monkeypatch.setattr(subprocess, "Popen", _popen)
+    streamed: list[tuple[list[tuple[float, float]], int | None]] = []
+    peaks = waveform_module._decode_wav_peaks(
+        str(source), 2, on_peaks=lambda batch, expected: streamed.append((batch, expected))
+    )
+
+    assert [len(batch) for batch, _expected in streamed] == [2, 2, 2, 3]
+    assert [peak for batch, _expected in streamed for peak in batch] == peaks
+    assert {expected for _batch, expected in streamed} == {8}
+    assert len(commands) == 4
+    starts = [
+        command[command.index("-ss") + 1] if "-ss" in command else None for command in commands
+    ]
+    assert starts == [None, "30.000000", "60.000000", "90.000000"]
+    assert ["-t" in command for command in commands] == [True, True, True, False]
+    assert peaks == [
+        (-(amplitude / 2) / 32768.0, amplitude / 32768.0)
+        for amplitude in (4096, 4096, 8192, 8192, 12288, 12288, 16384, 16384)
+    ] + [(-1.0, 32767 / 32768.0)]
+
+
 def test_load_wav_peaks_handles_24_32_bit_and_decoder_fallbacks(
     monkeypatch,
     tmp_path: Path,
 ) -> None:
+    # Each fallback below re-reads the same source with a different decoder patched in.
+    monkeypatch.setattr(waveform_module, "_wav_peaks_memo_key", lambda *_args: None)
     wav_24 = tmp_path / "tone24.wav"
     _write_pcm_wav(
         wav_24,
@@ -729,10 +1011,23 @@ def test_load_wav_peaks_handles_24_32_bit_and_decoder_fallbacks(
         lambda name: f"/fake/{name}" if name in {"ffmpeg", "ffprobe"} else None,
     )
     monkeypatch.setattr(subprocess, "check_output", lambda *_args, **_kwargs: b"0.05")
-    monkeypatch.setattr(subprocess, "Popen", lambda *_args, **_kwargs: _FakeProcess(pcm))
+    ffmpeg_commands: list[list[str]] = []
+
+    def _popen(command, **_kwargs):
+        ffmpeg_commands.append(list(command))
+        return _FakeProcess(pcm)
+
+    monkeypatch.setattr(subprocess, "Popen", _popen)
     ffmpeg_peaks = load_wav_peaks(str(raw_path), 2)
     assert ffmpeg_peaks
     assert ffmpeg_peaks[0][0] < 0.0
+    command = ffmpeg_commands[-1]
+    assert command[command.index("-ar") + 1] == "10240"
+
+    monkeypatch.setattr(subprocess, "check_output", lambda *_args, **_kwargs: b"600")
+    assert load_wav_peaks(str(raw_path), 2)
+    command = ffmpeg_commands[-1]
+    assert command[command.index("-ar") + 1] == "8000"
 
     import platform
 
@@ -817,6 +1112,7 @@ def test_load_wav_peaks_qt_decoder_edge_formats_and_binary_search(
     tmp_path: Path,
 ) -> None:
     require_qapplication()
+    monkeypatch.setattr(waveform_module, "_wav_peaks_memo_key", lambda *_args: None)
     raw_path = tmp_path / "decoder-source.bin"
     raw_path.write_bytes(b"not-riff")
 
@@ -1279,6 +1575,19 @@ def test_audio_visualization_loaders_handle_wav_boundaries(tmp_path: Path) -> No
     assert all(value == 0.0 for frame in spectrum_frames for value in frame)
 
 
+def test_peak_meter_frames_reduce_each_hop_including_the_short_tail(tmp_path: Path) -> None:
+    wav_path = tmp_path / "meter.wav"
+    # 1 kHz gives 33-frame hops: one full hop and a 7-frame tail.
+    frames = [(16384, 0)] * 33 + [(0, -32768)] * 6 + [(16, 0)]
+    _write_stereo_wav(wav_path, frames, sample_rate=1000)
+
+    meter = load_audio_peak_meter_frames(str(wav_path))
+
+    assert len(meter) == 2
+    assert meter[0] == pytest.approx((20.0 * math.log10(0.5), -60.0))
+    assert meter[1] == pytest.approx((-60.0, 0.0))
+
+
 def test_audio_visualization_loaders_decode_ffmpeg_fallbacks(
     monkeypatch,
     tmp_path: Path,
@@ -1530,6 +1839,97 @@ def test_waveform_cache_helpers_render_decode_resample_and_fingerprint(tmp_path:
         )
 
 
+def test_wave_peaks_reduce_each_bucket_per_channel(tmp_path: Path) -> None:
+    wav_16 = tmp_path / "buckets16.wav"
+    _write_pcm_wav(
+        wav_16,
+        [(16384, -8192), (-32768, 4096), (0, 0), (8192, -16384), (1, 1)],
+        channels=2,
+        sample_width=2,
+    )
+    assert waveform_cache._load_wave_peaks(str(wav_16), 2) == [
+        (-0.25, 1.0),
+        (-0.5, 0.25),
+        (-(1 / 32768.0), 1 / 32768.0),
+    ]
+
+    wav_24 = tmp_path / "buckets24.wav"
+    _write_pcm_wav(
+        wav_24,
+        [(-8388608,), (4194304,), (2097152,)],
+        channels=1,
+        sample_width=3,
+    )
+    assert waveform_cache._load_wave_peaks(str(wav_24), 1) == [(-1.0, 1.0)]
+
+
+def test_pcm_frame_magnitudes_sign_extend_24_bit_samples() -> None:
+    values = [-8388608, 8388607, -1, 0, -4194304, 1]
+    raw = b"".join(_pack_s24(value) for value in values)
+    magnitudes = waveform_cache._pcm_frame_magnitudes(raw, 3, 2)
+    assert magnitudes.tolist() == [[8388608, 8388607], [1, 0], [4194304, 1]]
+
+
+def test_ffmpeg_peaks_use_container_duration_before_spawning_ffprobe(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "tagged.m4a"
+    source.write_bytes(b"not-riff")
+
+    import subprocess
+
+    monkeypatch.setattr(waveform_cache, "_which", lambda name: f"/fake/{name}")
+    monkeypatch.setattr(
+        waveform_cache,
+        "MutagenFile",
+        lambda _path: SimpleNamespace(info=SimpleNamespace(length=0.001)),
+    )
+    monkeypatch.setattr(
+        subprocess,
+        "check_output",
+        lambda *_args, **_kwargs: pytest.fail("ffprobe spawned despite a known duration"),
+    )
+
+    class _FakeProcess:
+        def __init__(self, payload: bytes) -> None:
+            self.stdout = SimpleNamespace(read=lambda _size: self._take(), close=lambda: None)
+            self._payload = payload
+
+        def _take(self) -> bytes:
+            payload, self._payload = self._payload, b""
+            return payload
+
+        def wait(self, *, timeout=None):
+            return 0
+
+        def poll(self):
+            return 0
+
+    # 0.001 s at 44.1 kHz is 44 frames, so two buckets of 22 frames each.
+    pcm = struct.pack("<hh", 8192, -8192) * 22 + struct.pack("<hh", 16384, -4096) * 22
+    monkeypatch.setattr(subprocess, "Popen", lambda *_args, **_kwargs: _FakeProcess(pcm))
+    assert waveform_cache._load_ffmpeg_peaks(str(source), 2) == [(-0.25, 0.25), (-0.125, 0.5)]
+
+    monkeypatch.setattr(waveform_cache, "MutagenFile", lambda _path: None)
+    assert waveform_cache._container_duration_seconds(str(source)) is None
+
+
+def test_pcm_peak_accumulator_carries_buckets_across_chunks() -> None:
+    accumulator = waveform_cache._PcmPeakAccumulator(3)
+    frames = [(8192, -4096), (-16384, 0), (0, 0), (4096, 32767), (0, -32768)]
+    payload = b"".join(struct.pack("<hh", *frame) for frame in frames)
+    # Split mid-frame so the accumulator has to carry a partial frame forward.
+    accumulator.feed(payload[:5])
+    accumulator.feed(payload[5:])
+
+    assert accumulator.finish() == [(-0.125, 0.5), (-1.0, 0.125)]
+
+    mono = waveform_cache._PcmPeakAccumulator(2, channels=1)
+    mono.feed(struct.pack("<hhh", 16384, -8192, 4096))
+    assert mono.finish() == [(-0.5, 0.5), (-0.125, 0.125)]
+
+
 def test_waveform_cache_schema_delete_decoder_and_color_edge_branches(
     monkeypatch,
     tmp_path: Path,
@@ -1589,6 +1989,7 @@ def test_waveform_cache_schema_delete_decoder_and_color_edge_branches(
     assert waveform_cache._mp3_source_has_frame_sync(str(mp3_sync)) is True
 
     with monkeypatch.context() as which_patch:
+        which_patch.setattr(waveform_cache, "_resolved_tool_paths", {})
         which_patch.setattr(
             waveform_cache.shutil,
             "which",
@@ -1604,7 +2005,12 @@ def test_waveform_cache_schema_delete_decoder_and_color_edge_branches(
         )
         assert waveform_cache._which("ffmpeg").lower().endswith("ffmpeg.exe")
         which_patch.setattr(waveform_cache.platform, "system", lambda: "plan9")
+        assert waveform_cache._find_tool("ffmpeg") is None
+        # The last hit is reused for as long as the resolved file still exists.
+        assert waveform_cache._which("ffmpeg").lower().endswith("ffmpeg.exe")
+        which_patch.setattr(waveform_cache.os.path, "exists", lambda _path: False)
         assert waveform_cache._which("ffmpeg") is None
+        assert "ffmpeg" not in waveform_cache._resolved_tool_paths
 
     import subprocess
 
@@ -1625,11 +2031,15 @@ def test_waveform_cache_schema_delete_decoder_and_color_edge_branches(
     monkeypatch.setattr(subprocess, "Popen", lambda *_args, **_kwargs: _NoStdoutProcess())
     assert waveform_cache._load_ffmpeg_peaks(str(not_riff), 2) is None
 
+    read_sizes: list[int] = []
+    popen_kwargs: dict[str, object] = {}
+
     class _FakeStdout:
         def __init__(self, payload: bytes) -> None:
             self._payload = payload
 
-        def read(self, _size: int) -> bytes:
+        def read(self, size: int) -> bytes:
+            read_sizes.append(size)
             payload, self._payload = self._payload, b""
             return payload
 
@@ -1652,8 +2062,15 @@ def test_waveform_cache_schema_delete_decoder_and_color_edge_branches(
 
     pcm = b"".join(struct.pack("<hh", 16000, -4000) for _ in range(12))
     monkeypatch.setattr(subprocess, "check_output", lambda *_args, **_kwargs: b"0.01")
-    monkeypatch.setattr(subprocess, "Popen", lambda *_args, **_kwargs: _FakeProcess(pcm))
+
+    def _popen(*_args, **kwargs):
+        popen_kwargs.update(kwargs)
+        return _FakeProcess(pcm)
+
+    monkeypatch.setattr(subprocess, "Popen", _popen)
     assert waveform_cache._load_ffmpeg_peaks(str(not_riff), 2)
+    assert popen_kwargs["bufsize"] == waveform_cache._PCM_PIPE_BUFFER_BYTES
+    assert set(read_sizes) == {waveform_cache._PCM_PIPE_READ_BYTES}
 
     monkeypatch.setattr(waveform_cache, "_load_wave_peaks", lambda *_args: None)
     monkeypatch.setattr(waveform_cache, "_load_ffmpeg_peaks", lambda *_args: None)
@@ -1680,8 +2097,6 @@ def test_waveform_cache_schema_delete_decoder_and_color_edge_branches(
     )
     assert waveform_cache.load_audio_waveform_colors("missing.wav", 3) == []
 
-    assert waveform_cache._build_waveform_path([], QRectF(0, 0, 10, 10)).isEmpty()
-    assert not waveform_cache._build_waveform_path([(-0.4, 0.7)], QRectF(0, 0, 10, 10)).isEmpty()
     assert waveform_cache._resample_peaks_to_width(
         [(-0.1, 0.1), (-0.8, 0.2), (-0.2, 0.9), (-0.3, 0.4)],
         2,
@@ -1699,6 +2114,33 @@ def test_waveform_cache_schema_delete_decoder_and_color_edge_branches(
     assert waveform_cache._bytes_edge_fingerprint(large_data, len(large_data))
 
 
+def test_render_waveform_cache_png_shades_each_bar_pixel() -> None:
+    import io
+
+    from PIL import Image
+
+    png = waveform_cache.render_waveform_cache_png(
+        [(-0.5, 1.0)],
+        width_px=1,
+        height_px=11,
+        light_background=False,
+        waveform_colors=[(200, 90, 30)],
+    )
+    pixels = Image.open(io.BytesIO(png)).convert("RGBA")
+    amplitude = 11 * 0.47
+    # The bottom bar (rows 5-8) is drawn last, so it owns the shared center row.
+    bar_rows = [(row, 1.0) for row in range(0, 5)] + [(row, 0.5) for row in range(5, 9)]
+    shaded = waveform_cache._shade_waveform_pixels(
+        [(200, 90, 30)] * len(bar_rows),
+        [peak for _row, peak in bar_rows],
+        [abs(row - 5.0) / (peak * amplitude) for row, peak in bar_rows],
+        light_background=False,
+    ).tolist()
+    expected = {row: (*rgb, 255) for (row, _peak), rgb in zip(bar_rows, shaded)}
+    for row in range(11):
+        assert pixels.getpixel((0, row)) == expected.get(row, (0, 0, 0, 0))
+
+
 def test_waveform_cache_loaders_and_color_helpers_handle_wav_and_decode_failures(
     tmp_path: Path,
 ) -> None:
@@ -1719,15 +2161,13 @@ def test_waveform_cache_loaders_and_color_helpers_handle_wav_and_decode_failures
     invalid.write_bytes(b"not a wave")
     assert waveform_cache.load_audio_waveform_peaks(str(invalid), 3) == []
     assert waveform_cache.load_audio_waveform_colors(str(invalid), 3) == []
-    assert (
-        waveform_cache._shade_waveform_rgb(
-            (300, -4, 80),
-            peak=2.0,
-            edge_ratio=2.0,
-            light_background=False,
-        )[3]
-        == 255
+    clamped = waveform_cache._shade_waveform_pixels(
+        [(300, -4, 80)],
+        [2.0],
+        [2.0],
+        light_background=False,
     )
+    assert clamped.tolist() == [[255, 21, 110]]
 
 
 def test_waveform_cache_ffmpeg_color_decode_resampling_and_service_edges(
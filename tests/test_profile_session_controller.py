@@ -216,6 +216,42 @@ def _storage_inspection(
     )
 
 
+def test_apply_storage_layout_only_creates_missing_storage_folders(tmp_path, monkeypatch):
+    root = tmp_path / "data"
+    layout = SimpleNamespace(
+        data_root=root,
+        database_dir=root / "Database",
+        exports_dir=root / "exports",
+        logs_dir=root / "logs",
+        backups_dir=root / "backups",
+        history_dir=root / "history",
+        help_dir=root / "help",
+    )
+    for directory in (layout.database_dir, layout.exports_dir, layout.logs_dir):
+        directory.mkdir(parents=True)
+    monkeypatch.setattr(profile_session, "resolve_app_storage_layout", lambda **_kwargs: layout)
+    monkeypatch.setattr(profile_session, "StorageMigrationService", mock.Mock())
+    created: list[Path] = []
+    original_mkdir = Path.mkdir
+
+    def recording_mkdir(self, *args, **kwargs):
+        created.append(self)
+        return original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", recording_mkdir)
+    app = SimpleNamespace(
+        settings=None,
+        _report_storage_startup_progress=mock.Mock(),
+        _log_event=mock.Mock(),
+    )
+
+    profile_session._apply_storage_layout(app)
+
+    assert created == [root, layout.backups_dir, layout.history_dir, layout.help_dir]
+    assert all(directory.is_dir() for directory in vars(layout).values())
+    assert app._report_storage_startup_progress.call_count == 8
+
+
 def test_reconcile_startup_storage_root_handles_resumable_conflict_and_failure(tmp_path):
     preferred = tmp_path / "preferred"
     legacy = tmp_path / "legacy"
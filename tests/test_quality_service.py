@@ -501,6 +501,11 @@ class QualityDashboardServiceTests(unittest.TestCase):
             QualityDashboardService._normalize_date("15-03-2026"),
             "2026-03-15",
         )
+        self.assertEqual(QualityDashboardService._normalize_date("2026/3/5"), "2026-03-05")
+        self.assertEqual(QualityDashboardService._normalize_date("5/3/2026"), "2026-03-05")
+        self.assertEqual(QualityDashboardService._normalize_date("15-3-2026"), "2026-03-15")
+        self.assertIsNone(QualityDashboardService._normalize_date("2026-03/15"))
+        self.assertIsNone(QualityDashboardService._normalize_date("2026-13-40"))
 
     def test_relink_media_reports_unavailable_without_data_root(self):
         service = QualityDashboardService(
@@ -4,7 +4,7 @@ import unittest
 from pathlib import Path
 from unittest import mock
 
-from isrc_manager.services.sqlite_utils import safe_wal_checkpoint
+from isrc_manager.services.sqlite_utils import bulk_write_transaction, safe_wal_checkpoint
 
 
 class SafeWalCheckpointTests(unittest.TestCase):
@@ -120,5 +120,52 @@ class SafeWalCheckpointTests(unittest.TestCase):
         conn.execute.assert_not_called()
 
 
+class BulkWriteTransactionTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("CREATE TABLE sample (value INTEGER)")
+        self.conn.commit()
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_commits_and_restores_isolation_level(self):
+        traced: list[str] = []
+        self.conn.set_trace_callback(traced.append)
+
+        with bulk_write_transaction(self.conn) as conn:
+            self.assertIsNone(conn.isolation_level)
+            self.assertTrue(conn.in_transaction)
+            conn.executemany("INSERT INTO sample(value) VALUES (?)", [(1,), (2,)])
+
+        self.assertEqual(traced, [])
+        self.assertEqual(self.conn.isolation_level, "")
+        self.assertFalse(self.conn.in_transaction)
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM sample").fetchone()[0], 2)
+
+    def test_reinstalls_the_callers_trace_callback_on_exit(self):
+        traced: list[str] = []
+        self.conn.set_trace_callback(traced.append)
+
+        with self.assertRaises(RuntimeError):
+            with bulk_write_transaction(self.conn, trace_callback=traced.append) as conn:
+                conn.execute("INSERT INTO sample(value) VALUES (1)")
+                raise RuntimeError("boom")
+        self.assertEqual(traced, [])
+
+        self.conn.execute("SELECT COUNT(*) FROM sample").fetchone()
+        self.assertEqual(traced, ["SELECT COUNT(*) FROM sample"])
+
+    def test_rolls_back_and_restores_isolation_level_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with bulk_write_transaction(self.conn) as conn:
+                conn.execute("INSERT INTO sample(value) VALUES (1)")
+                raise RuntimeError("boom")
+
+        self.assertEqual(self.conn.isolation_level, "")
+        self.assertFalse(self.conn.in_transaction)
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM sample").fetchone()[0], 0)
+
+
 if __name__ == "__main__":
     unittest.main()
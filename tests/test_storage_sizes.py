@@ -44,6 +44,17 @@ class StorageSizeTests(unittest.TestCase):
         self.assertEqual(format_storage_bytes(1024 * 1024), "1 MB")
         self.assertEqual(format_storage_bytes(1536 * 1024 * 1024), "1.5 GB")
 
+    def test_storage_byte_formatting_picks_units_at_binary_boundaries(self):
+        self.assertEqual(format_storage_bytes(0), "0 B")
+        self.assertEqual(format_storage_bytes(None), "0 B")
+        self.assertEqual(format_storage_bytes(-5), "0 B")
+        self.assertEqual(format_storage_bytes(1023), "1023 B")
+        self.assertEqual(format_storage_bytes(1024), "1 KB")
+        self.assertEqual(format_storage_bytes(1024 * 1024 - 1), "1024 KB")
+        self.assertEqual(format_storage_bytes(3 * 1024**4), "3 TB")
+        self.assertEqual(format_storage_bytes(2048 * 1024**4), "2048 TB")
+        self.assertEqual(format_storage_bytes(1234567, max_decimals=2), "1.18 MB")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1960,6 +1960,31 @@ class TrackServiceTests(unittest.TestCase):
         ).fetchall()
         self.assertEqual(rows, [("Valid Guest",)])
 
+    def test_replace_additional_artists_inserts_each_resolved_artist_once(self):
+        track_id = self.service.create_track(
+            self._track_payload(
+                isrc="NL-ABC-26-90101",
+                track_title="Repeated Guests",
+            )
+        )
+
+        self.service.replace_additional_artists(
+            track_id,
+            ["Guest One", "Guest Two", "Guest One", "  "],
+        )
+
+        rows = self.conn.execute(
+            """
+            SELECT a.name
+            FROM TrackArtists ta
+            JOIN Artists a ON a.id = ta.artist_id
+            WHERE ta.track_id=? AND ta.role='additional'
+            ORDER BY a.name
+            """,
+            (track_id,),
+        ).fetchall()
+        self.assertEqual(rows, [("Guest One",), ("Guest Two",)])
+
     def test_album_group_snapshots_sort_and_conflict_helpers_filter_invalid_values(self):
         track_a = self.service.create_track(
             self._track_payload(
@@ -349,6 +349,21 @@ class UpdateInstallerTests(unittest.TestCase):
 
             self.assertEqual(staged.replacement_path.name, f"{PACKAGED_APP_NAME}.exe")
 
+    def test_safe_zip_extract_finds_windows_onedir_folder(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            package = root / "ISRCManager-v3.5.4-windows-x64.zip"
+            with zipfile.ZipFile(package, "w") as archive:
+                executable = zipfile.ZipInfo(f"{PACKAGED_APP_NAME}/{PACKAGED_APP_NAME}.exe")
+                executable.external_attr = 0o755 << 16
+                archive.writestr(executable, b"exe")
+                archive.writestr(f"{PACKAGED_APP_NAME}/_internal/helper.exe", b"exe")
+
+            staged = extract_update_package(package, root / "stage", platform_key="windows")
+
+            self.assertTrue(staged.replacement_path.is_dir())
+            self.assertEqual(staged.replacement_path.name, PACKAGED_APP_NAME)
+
     def test_safe_zip_extract_rejects_path_traversal(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
@@ -497,6 +512,10 @@ class UpdateInstallerTests(unittest.TestCase):
             mac_exe.write_text("", encoding="utf-8")
             win_exe = root / f"{PACKAGED_APP_NAME}.exe"
             win_exe.write_text("", encoding="utf-8")
+            win_dir = root / "windows" / PACKAGED_APP_NAME
+            (win_dir / "_internal").mkdir(parents=True)
+            win_onedir_exe = win_dir / f"{PACKAGED_APP_NAME}.exe"
+            win_onedir_exe.write_text("", encoding="utf-8")
             linux_dir = root / PACKAGED_APP_NAME
             linux_dir.mkdir()
             linux_exe = linux_dir / PACKAGED_APP_NAME
@@ -511,6 +530,10 @@ class UpdateInstallerTests(unittest.TestCase):
                 resolve_installed_target_path(executable=win_exe, platform_key="windows"),
                 win_exe.resolve(),
             )
+            self.assertEqual(
+                resolve_installed_target_path(executable=win_onedir_exe, platform_key="windows"),
+                win_dir.resolve(),
+            )
             self.assertEqual(
                 resolve_installed_target_path(executable=linux_exe, platform_key="linux"),
                 linux_dir.resolve(),
@@ -231,6 +231,30 @@ class XMLExportServiceTests(unittest.TestCase):
             track.findtext("./CustomFields/Field[@name='Artwork']/MimeType"), "image/png"
         )
 
+    def test_exports_escape_markup_in_text_and_attributes(self):
+        self.conn.execute("UPDATE Tracks SET track_title=? WHERE id=1", ('Rock & Roll <"Live">',))
+        self.conn.execute("UPDATE CustomFieldDefs SET name=? WHERE id=1", ('Mood "A&B"',))
+        self.conn.execute("UPDATE CustomFieldValues SET value=? WHERE field_def_id=1", ("<calm>",))
+        full_output = Path(self.tmpdir.name) / "escaped-full.xml"
+        selected_output = Path(self.tmpdir.name) / "escaped-selected.xml"
+
+        self.service.export_all(full_output)
+        self.service.export_selected(selected_output, [1], current_db_path="/tmp/a&b <profile>.db")
+        full_root = ET.parse(full_output).getroot()
+        selected_root = ET.parse(selected_output).getroot()
+
+        self.assertEqual(
+            full_root.find("SoundRecording").findtext("track_title"), 'Rock & Roll <"Live">'
+        )
+        self.assertEqual(
+            full_root.find("SoundRecording").find("./CustomFields/Field").attrib["name"],
+            'Mood "A&B"',
+        )
+        self.assertEqual(selected_root.findtext("./Meta/ProfileDB"), "/tmp/a&b <profile>.db")
+        track = selected_root.find("./Tracks/Track")
+        self.assertEqual(track.findtext("Title"), 'Rock & Roll <"Live">')
+        self.assertEqual(track.findtext("./CustomFields/Field/Value"), "<calm>")
+
     def test_export_all_reports_staged_progress(self):
         output = Path(self.tmpdir.name) / "progress.xml"
         progress_events: list[tuple[int, int, str]] = []
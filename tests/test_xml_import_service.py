@@ -108,6 +108,79 @@ class XMLImportServiceTests(unittest.TestCase):
         self.assertEqual(inspection.would_insert, 0)
         self.assertEqual(len(inspection.records), 1)
 
+    def test_execute_import_skips_repeated_isrc_within_the_same_file(self):
+        file_path = self._write_xml(
+            "repeated.xml",
+            """
+            <ISRCExport>
+              <Tracks>
+                <Track>
+                  <ISRC>NL-ABC-26-00007</ISRC>
+                  <Title>First Copy</Title>
+                  <MainArtist>New Artist</MainArtist>
+                </Track>
+                <Track>
+                  <ISRC>NLABC2600007</ISRC>
+                  <Title>Second Copy</Title>
+                  <MainArtist>New Artist</MainArtist>
+                </Track>
+                <Track>
+                  <ISRC>NL-ABC-26-00001</ISRC>
+                  <Title>Existing Copy</Title>
+                  <MainArtist>Existing Artist</MainArtist>
+                </Track>
+              </Tracks>
+            </ISRCExport>
+            """,
+        )
+
+        inspection = self.service.inspect_file(file_path)
+        self.assertEqual(
+            [record.is_duplicate for record in inspection.records], [False, False, True]
+        )
+        self.assertEqual(inspection.duplicate_count, 1)
+
+        result = self.service.execute_import(file_path)
+
+        self.assertEqual((result.inserted, result.duplicate_count), (1, 2))
+        titles = [
+            row[0]
+            for row in self.conn.execute(
+                "SELECT track_title FROM Tracks WHERE isrc_compact='NLABC2600007'"
+            )
+        ]
+        self.assertEqual(titles, ["First Copy"])
+
+    def test_execute_import_keeps_last_value_for_repeated_custom_field(self):
+        file_path = self._write_xml(
+            "repeated-field.xml",
+            """
+            <ISRCExport>
+              <Tracks>
+                <Track>
+                  <ISRC>NL-ABC-26-00008</ISRC>
+                  <Title>Repeated Field</Title>
+                  <MainArtist>New Artist</MainArtist>
+                  <CustomFields>
+                    <Field name="Mood" type="dropdown"><Value>Happy</Value></Field>
+                    <Field name="Mood" type="dropdown"><Value>Calm</Value></Field>
+                  </CustomFields>
+                </Track>
+              </Tracks>
+            </ISRCExport>
+            """,
+        )
+
+        result = self.service.execute_import(file_path)
+
+        self.assertEqual((result.inserted, result.error_count), (1, 0))
+        values = self.conn.execute("""
+            SELECT value
+            FROM CustomFieldValues
+            WHERE track_id = (SELECT id FROM Tracks WHERE isrc_compact='NLABC2600008')
+            """).fetchall()
+        self.assertEqual(values, [("Calm",)])
+
     def test_inspect_reports_missing_custom_field_definitions(self):
         file_path = self._write_xml(
             "missing-fields.xml",
@@ -95,25 +95,6 @@ class _FakeConn:
         self.rollbacks += 1
 
 
-class _QueryCursor:
-    def __init__(self) -> None:
-        self.queries: list[str] = []
-        self._rows: list[tuple[str | None]] = []
-
-    def execute(self, query: str):
-        self.queries.append(query)
-        if "Albums" in query:
-            self._rows = [("",), ("Catalog Album",), ("Catalog Album",), ("Other Album",)]
-        elif "genre" in query:
-            self._rows = [(None,), ("Rock",), ("Rock",), ("Ambient",)]
-        else:
-            self._rows = []
-        return self
-
-    def fetchall(self):
-        return list(self._rows)
-
-
 class _FakeTrackService:
     def __init__(self, snapshot=None) -> None:
         self.snapshot = snapshot
@@ -210,6 +191,14 @@ class _FakeParent:
     def _artist_lookup_values(self) -> list[str]:
         return ["", "Lookup Artist", "Lookup Artist", "Guest Lookup"]
 
+    def _catalog_lookup_values(self) -> dict[str, list[str]]:
+        return {
+            "artists": self._artist_lookup_values(),
+            "albums": ["", "Catalog Album", "Catalog Album", "Other Album"],
+            "genres": ["Rock", "Rock", "Ambient"],
+            "upcs": [],
+        }
+
     def _resolve_artist_party_choice(self, widget):
         return widget.currentText(), None
 
@@ -317,7 +306,6 @@ class _WidgetParent(QWidget, _FakeParent):
     def __init__(self, snapshots: list[SimpleNamespace]) -> None:
         QWidget.__init__(self)
         _FakeParent.__init__(self, snapshots[0])
-        self.cursor = _QueryCursor()
         self.work_service = SimpleNamespace(
             fetch_work=lambda work_id: (
                 SimpleNamespace(registration_number="BUMA-WORK") if work_id == 7 else None
@@ -981,6 +969,8 @@ def test_edit_dialog_constructor_covers_single_and_bulk_layout_branches() -> Non
         assert single_dialog.artist_name.findText("New Artist") >= 0
         assert single_dialog.album_title.findText("Unique Album") >= 0
         assert single_dialog.genre.findText("Unique Genre") >= 0
+        assert single_dialog.album_title.findText("Other Album") >= 0
+        assert single_dialog.genre.findText("Ambient") >= 0
         assert single_dialog.audio_file.text() == "mix.wav (stored in database)"
         assert single_dialog.album_art.text() == "cover.jpg (stored in database)"
         assert single_dialog.buma_work_number.isReadOnly()
@@ -1025,10 +1015,17 @@ def test_edit_dialog_constructor_covers_single_and_bulk_layout_branches() -> Non
         mixed_dialog.close()
         mixed_dialog.deleteLater()
 
+    locked_snapshot_values = {
+        "track_number": 3,
+        "release_date": "2026-03-01",
+        "track_length_sec": 120,
+        "artist_name": "Lookup Artist",
+        "additional_artists": ["Guest Lookup"],
+    }
     locked_parent = _WidgetParent(
         [
-            _snapshot(track_id=1, track_number=3, release_date="2026-03-01", track_length_sec=120),
-            _snapshot(track_id=2, track_number=3, release_date="2026-03-01", track_length_sec=120),
+            _snapshot(track_id=1, **locked_snapshot_values),
+            _snapshot(track_id=2, **locked_snapshot_values),
         ]
     )
 
@@ -1039,6 +1036,10 @@ def test_edit_dialog_constructor_covers_single_and_bulk_layout_branches() -> Non
         assert not locked_dialog.len_m.isEnabled()
         assert not locked_dialog.len_s.isEnabled()
         assert locked_dialog.release_date.selectedDate().toString("yyyy-MM-dd") == "2026-03-01"
+        assert (
+            locked_dialog.artist_name.completer().model()
+            is locked_dialog.additional_artist.completer().model()
+        )
     finally:
         locked_dialog.close()
         locked_dialog.deleteLater()